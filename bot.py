@@ -2,9 +2,17 @@ from utils.database import get_emoji_from_table, get_fun_emoji, get_music_emoji,
 import asyncio
 import logging
 from utils.config import TOKEN, INTENTS, get_config
-from utils.database import get_prefix
+from utils.database import get_prefix, pool, emoji_registry
+from utils.async_database import db
 from utils.event_loader import load_events
 from utils.command_loader import load_commands
+from commands.music.musicsystem.extractor import extractor
+from commands.music.musicsystem.browser_pool import browser_pool
+from commands.music.musicsystem.lyrics_providers import lyrics_service
+from commands.music.musicsystem.play_log import play_log
+from commands.music.musicsystem.radio_prober import radio_prober
+from utils.samp_query import samp_query
+from utils.samp_stats import samp_stats
 from discord.ext import commands
 from colorama import init, Fore, Style
 
@@ -40,6 +48,9 @@ async def main():
             raise ValueError("O TOKEN do bot não está configurado. Verifique o arquivo .env ou as variáveis de ambiente.")
         
         async with bot:
+            # Pré-carregar os emojis do banco de dados em memória
+            await db.run(emoji_registry.load)
+
             logger.info(f"{Fore.CYAN}Iniciando o carregamento de eventos e comandos...{Style.RESET_ALL}")
             
             # Carregar eventos
@@ -68,7 +79,19 @@ async def main():
         logger.critical(f"{Fore.RED}Erro crítico na execução do bot: {e}{Style.RESET_ALL}")
     finally:
         logger.info(f"{Fore.CYAN}Encerrando o bot.{Style.RESET_ALL}")
+        music_managers = getattr(bot, "music_managers", None)
+        if music_managers is not None:
+            await music_managers.close()  # Grava o último snapshot das filas antes de sair dos canais de voz
         await bot.close()  # Garante que o bot desconecta corretamente
+        await play_log.close()  # Grava as reproduções ainda não persistidas
+        await samp_stats.close()  # Grava as amostras de população ainda não persistidas
+        await lyrics_service.close()  # Fecha a sessão HTTP dos provedores de letras
+        await browser_pool.close()  # Fecha o Chromium usado nas buscas de letras
+        await radio_prober.close()  # Interrompe as verificações das rádios
+        extractor.shutdown()  # Descarta as extrações do yt-dlp ainda na fila
+        samp_query.close()  # Fecha o socket UDP das consultas SA-MP
+        db.close()  # Aguarda as operações pendentes do banco de dados
+        pool.close()  # Fecha as conexões persistentes do banco de dados
 
 
 # Executar o bot
@@ -1,4 +1,5 @@
-from utils.database import fetchone, execute_query
+from utils.database import get_config
+from utils.async_database import db
 from utils.config import get_lema
 import discord
 from discord.ext import commands
@@ -18,16 +19,15 @@ class EmbedColor(commands.Cog):
         Obtém a cor da tabela 'configs' com a key 'EMBED_COLOR'.
         Retorna um objeto discord.Colour com a cor definida ou aleatória.
         """
-        query = "SELECT value FROM configs WHERE key = ?"
-        result = fetchone(query, ("EMBED_COLOR",))
+        value = get_config("EMBED_COLOR")
 
-        if result and isinstance(result[0], str):
-            if result[0].lower() == "random":
+        if isinstance(value, str):
+            if value.lower() == "random":
                 return discord.Colour.random()
             try:
-                return discord.Colour(int(result[0].lstrip("#"), 16))
+                return discord.Colour(int(value.lstrip("#"), 16))
             except ValueError:
-                logger.warning(f"Valor inválido em 'EMBED_COLOR': {result[0]}")
+                logger.warning(f"Valor inválido em 'EMBED_COLOR': {value}")
         return discord.Colour.random()
 
     def validate_color(self, color: str) -> discord.Colour:
@@ -49,8 +49,8 @@ class EmbedColor(commands.Cog):
         Somente o dono configurado no banco de dados pode usá-lo.
         """
         # Verificar se o autor é o dono
-        owner_id = fetchone("SELECT value FROM configs WHERE key = ?", ("DONO",))
-        if not owner_id or str(ctx.author.id) != str(owner_id[0]):
+        owner_id = get_config("DONO")
+        if not owner_id or str(ctx.author.id) != str(owner_id):
             embed = discord.Embed(
                 title="🔒 Acesso Negado",
                 description="Você não tem permissão para usar este comando.",
@@ -121,7 +121,7 @@ class EmbedColor(commands.Cog):
         validated_color = self.validate_color(color)
         if validated_color:
             # Atualiza o banco com a nova cor
-            execute_query("UPDATE configs SET value = ? WHERE key = ?", (color.upper(), "EMBED_COLOR"))
+            await db.set_config("EMBED_COLOR", color.upper())
             embed = discord.Embed(
                 title="✅ Cor Alterada com Sucesso",
                 description=f"A cor padrão das embeds foi alterada para **#{color.upper()}**.",
@@ -136,7 +136,7 @@ class EmbedColor(commands.Cog):
         """
         Define uma cor aleatória e atualiza no banco de dados como 'random'.
         """
-        execute_query("UPDATE configs SET value = ? WHERE key = ?", ("random", "EMBED_COLOR"))
+        await db.set_config("EMBED_COLOR", "random")
         embed = discord.Embed(
             title="🎲 Cor Aleatória Definida",
             description="A cor padrão das embeds foi definida como **aleatória**.",
@@ -4,7 +4,7 @@ import traceback
 import textwrap
 from contextlib import redirect_stdout
 import io
-from utils.database import fetchone  # ou de onde você obtém a função fetchone
+from utils.database import get_config
 
 class Eval(commands.Cog):
     def __init__(self, bot):
@@ -17,8 +17,8 @@ class Eval(commands.Cog):
         Insira o código dentro de três crases (```código aqui```).
         """
         # Verificar se o autor é o dono
-        dono_id = fetchone("SELECT value FROM configs WHERE key = ?", ("DONO",))
-        if not dono_id or str(ctx.author.id) != dono_id[0]:
+        dono_id = get_config("DONO")
+        if not dono_id or str(ctx.author.id) != dono_id:
             embed = discord.Embed(
                 title="🔒 Acesso Negado",
                 description="Apenas o dono do bot pode usar este comando.",
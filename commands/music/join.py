@@ -1,6 +1,7 @@
 from utils.database import get_emoji_from_table, get_fun_emoji, get_music_emoji, get_error_emoji, get_number_emoji, get_clan_management_emoji, get_server_staff_emoji
 import discord
 from discord.ext import commands
+from commands.music.musicsystem.music_registry import MusicManagerRegistry
 from commands.music.musicsystem.embeds import (
     embed_already_being_used_only_owner_can_move,
     embed_error,
@@ -13,18 +14,20 @@ class JoinCommand(commands.Cog):
     Comando para o bot entrar ou se mover para outro canal de voz.
     """
 
-    def __init__(self, bot, music_manager):
+    def __init__(self, bot, music_managers: MusicManagerRegistry):
         """
         Inicializa o comando de entrada no canal de voz.
         """
         self.bot = bot
-        self.music_manager = music_manager
+        self.music_managers = music_managers
 
     @commands.command(name="join", aliases=["entrar", "enter", "connect", "conectar"])
     async def join(self, ctx):
         """
         Faz o bot entrar ou se mover para o canal de voz do usuário.
         """
+        music_manager = self.music_managers.get(ctx.guild)
+
         if ctx.author.voice is None:
             await ctx.send(embed=embed_need_to_be_connected_in_voice_channel())
             return
@@ -36,13 +39,13 @@ class JoinCommand(commands.Cog):
             # O bot já está conectado a um canal
             current_channel = bot_voice_client.channel
 
-            if self.music_manager.is_playing():
+            if music_manager.is_playing():
                 # O bot está tocando música
-                session_owner_id = self.music_manager.get_session_owner_id()
+                session_owner_id = music_manager.get_session_owner_id()
 
                 if session_owner_id is None:
-                    if self.music_manager.current_song:
-                        session_owner_id = self.music_manager.current_song.get('added_by', None)
+                    if music_manager.current_song:
+                        session_owner_id = music_manager.current_song.get('added_by', None)
 
                 try:
                     session_owner_id = int(session_owner_id)  # Garantir que o ID seja um número inteiro
@@ -58,8 +61,8 @@ class JoinCommand(commands.Cog):
                 if session_owner_id == ctx.author.id:
                     # O dono da sessão solicitou o movimento
                     await bot_voice_client.move_to(user_channel)
-                    self.music_manager.voice_channel = user_channel  # Atualiza o canal de voz no gerenciador
-                    self.music_manager.voice_client = bot_voice_client  # Atualiza o cliente de voz no gerenciador
+                    music_manager.voice_channel = user_channel  # Atualiza o canal de voz no gerenciador
+                    music_manager.voice_client = bot_voice_client  # Atualiza o cliente de voz no gerenciador
                     await ctx.send(embed=embed_connected(user_channel.name))
                 else:
                     # Outro usuário tentou mover o bot enquanto ele está tocando
@@ -67,21 +70,21 @@ class JoinCommand(commands.Cog):
             else:
                 # O bot não está tocando música, mover para o canal solicitado
                 await bot_voice_client.move_to(user_channel)
-                self.music_manager.voice_channel = user_channel  # Atualiza o canal de voz no gerenciador
-                self.music_manager.voice_client = bot_voice_client  # Atualiza o cliente de voz no gerenciador
+                music_manager.voice_channel = user_channel  # Atualiza o canal de voz no gerenciador
+                music_manager.voice_client = bot_voice_client  # Atualiza o cliente de voz no gerenciador
                 await ctx.send(embed=embed_connected(user_channel.name))
         else:
             # O bot não está conectado a nenhum canal, conectar ao canal do usuário
-            self.music_manager.voice_channel = user_channel  # Atualiza o canal de voz no gerenciador
+            music_manager.voice_channel = user_channel  # Atualiza o canal de voz no gerenciador
             voice_client = await user_channel.connect()
-            self.music_manager.voice_client = voice_client  # Atualiza o cliente de voz no gerenciador
+            music_manager.voice_client = voice_client  # Atualiza o cliente de voz no gerenciador
             await ctx.send(embed=embed_connected(user_channel.name))
 
-async def setup(bot, music_manager):
+async def setup(bot, music_managers: MusicManagerRegistry):
     """
     Adiciona o cog ao bot.
 
     :param bot: O bot do Discord.
-    :param music_manager: O gerenciador de música compartilhado.
+    :param music_managers: O registro de gerenciadores de música por servidor.
     """
-    await bot.add_cog(JoinCommand(bot, music_manager))
+    await bot.add_cog(JoinCommand(bot, music_managers))
@@ -1,6 +1,7 @@
 from utils.database import get_emoji_from_table, get_fun_emoji, get_music_emoji, get_error_emoji, get_number_emoji, get_clan_management_emoji, get_server_staff_emoji
 import discord
 from discord.ext import commands
+from commands.music.musicsystem.music_registry import MusicManagerRegistry
 from commands.music.musicsystem.embeds import embed_dj_error, embed_error, embed_disconnected, embed_permission_denied
 
 class LeaveCommand(commands.Cog):
@@ -8,18 +9,20 @@ class LeaveCommand(commands.Cog):
     Comando para o bot sair do canal de voz.
     """
 
-    def __init__(self, bot, music_manager):
+    def __init__(self, bot, music_managers: MusicManagerRegistry):
         """
         Inicializa o comando de saída do canal de voz.
         """
         self.bot = bot
-        self.music_manager = music_manager
+        self.music_managers = music_managers
 
     @commands.command(name="leave", aliases=["sair", "desconectar", "disconnect", "quit"])
     async def leave(self, ctx):
         """
         Faz o bot sair do canal de voz atual.
         """
+        music_manager = self.music_managers.get(ctx.guild)
+
         if not self.bot.voice_clients or not any(vc.is_connected() for vc in self.bot.voice_clients):
             await ctx.send(embed=embed_error(
                 "Não estou conectado a nenhum canal de voz."
@@ -27,11 +30,11 @@ class LeaveCommand(commands.Cog):
             return
 
         # Verifica se o usuário iniciou a sessão ou tem a tag de DJ
-        tag_dj_id = self.music_manager.dj_role_id
-        session_owner_id = self.music_manager.get_session_owner_id()
+        tag_dj_id = music_manager.dj_role_id
+        session_owner_id = music_manager.get_session_owner_id()
 
-        if session_owner_id is None and self.music_manager.current_song:
-            session_owner_id = self.music_manager.current_song.get('added_by', None)
+        if session_owner_id is None and music_manager.current_song:
+            session_owner_id = music_manager.current_song.get('added_by', None)
 
         try:
             session_owner_id = int(session_owner_id) if session_owner_id else None
@@ -46,11 +49,11 @@ class LeaveCommand(commands.Cog):
         for vc in self.bot.voice_clients:
             if vc.channel == ctx.author.voice.channel:
                 # Parar qualquer música sendo reproduzida antes de sair
-                if self.music_manager.is_playing():
-                    await self.music_manager.stop_music(ctx)
+                if music_manager.is_playing():
+                    await music_manager.stop_music(ctx)
 
                 await vc.disconnect()
-                self.music_manager.voice_client = None  # Resetar o cliente de voz no gerenciador de música
+                music_manager.voice_client = None  # Resetar o cliente de voz no gerenciador de música
                 await ctx.send(embed=embed_disconnected(vc.channel.name))
                 return
 
@@ -59,11 +62,11 @@ class LeaveCommand(commands.Cog):
         ))
 
 
-async def setup(bot, music_manager):
+async def setup(bot, music_managers: MusicManagerRegistry):
     """
     Adiciona o cog ao bot.
 
     :param bot: O bot do Discord.
-    :param music_manager: O gerenciador de música compartilhado.
+    :param music_managers: O registro de gerenciadores de música por servidor.
     """
-    await bot.add_cog(LeaveCommand(bot, music_manager))
+    await bot.add_cog(LeaveCommand(bot, music_managers))
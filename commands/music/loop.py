@@ -2,6 +2,7 @@ from utils.database import get_emoji_from_table, get_fun_emoji, get_music_emoji,
 import asyncio
 import discord
 from discord.ext import commands
+from commands.music.musicsystem.music_registry import MusicManagerRegistry
 from commands.music.musicsystem.embeds import (
     embed_dj_error, embed_error, embed_loop_single, embed_loop_all, embed_loop_off, embed_loop_cancel, embed_loop_timeout, create_embed
 )
@@ -14,19 +15,20 @@ class LoopCommand(commands.Cog):
     """
     Comando para gerenciar o loop de reprodução.
     """
-    def __init__(self, bot, music_manager):
+    def __init__(self, bot, music_managers: MusicManagerRegistry):
         self.bot = bot
-        self.music_manager = music_manager
+        self.music_managers = music_managers
 
     @commands.command(name="loop", aliases=["repetir", "repeat"])
     async def loop(self, ctx):
         """
         Menu para gerenciar o modo de repetição.
         """
+        music_manager = self.music_managers.get(ctx.guild)
 
         # Verifica se o usuário iniciou a sessão ou tem a tag de DJ
-        tag_dj_id = self.music_manager.dj_role_id
-        if not (ctx.author.id == self.music_manager.get_session_owner_id() or 
+        tag_dj_id = music_manager.dj_role_id
+        if not (ctx.author.id == music_manager.get_session_owner_id() or 
                 discord.utils.get(ctx.author.roles, id=int(tag_dj_id))):
             await ctx.send(embed=embed_dj_error())
             return
@@ -57,21 +59,21 @@ class LoopCommand(commands.Cog):
             reaction, _ = await self.bot.wait_for("reaction_add", timeout=60.0, check=check)
 
             if str(reaction.emoji) == "1️⃣":
-                self.music_manager.set_loop_mode("single")
+                music_manager.set_loop_mode("single")
                 await ctx.send(embed=embed_loop_single())
 
             elif str(reaction.emoji) == "2️⃣":
-                self.music_manager.set_loop_mode("all")
+                music_manager.set_loop_mode("all")
                 await ctx.send(embed=embed_loop_all())
 
             elif str(reaction.emoji) == "3️⃣":
-                self.music_manager.set_loop_mode("none")
+                music_manager.set_loop_mode("none")
                 await ctx.send(embed=embed_loop_off())
 
             elif str(reaction.emoji) == "❌":
                 await ctx.send(embed=embed_loop_cancel())
 
-            logger.info(f"{Fore.GREEN}Loop atualizado para: {self.music_manager.get_loop_mode()} pelo usuário {ctx.author.id}{Style.RESET_ALL}")
+            logger.info(f"{Fore.GREEN}Loop atualizado para: {music_manager.get_loop_mode()} pelo usuário {ctx.author.id}{Style.RESET_ALL}")
 
         except asyncio.TimeoutError:
             await ctx.send(embed=embed_loop_timeout())
@@ -80,11 +82,11 @@ class LoopCommand(commands.Cog):
             # Apaga a mensagem do menu
             await menu_message.delete()
 
-async def setup(bot, music_manager):
+async def setup(bot, music_managers: MusicManagerRegistry):
     """
     Adiciona o cog ao bot.
 
     :param bot: O bot do Discord.
-    :param music_manager: O gerenciador de música compartilhado.
+    :param music_managers: O registro de gerenciadores de música por servidor.
     """
-    await bot.add_cog(LoopCommand(bot, music_manager))
+    await bot.add_cog(LoopCommand(bot, music_managers))
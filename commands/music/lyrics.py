@@ -1,8 +1,9 @@
 from utils.database import get_emoji_from_table, get_fun_emoji, get_music_emoji, get_error_emoji, get_number_emoji, get_clan_management_emoji, get_server_staff_emoji
 import logging
 from discord.ext import commands
-from commands.music.musicsystem.embeds import embed_lyrics, embed_error, embed_searching_lyrics
-from commands.music.musicsystem.music_system import MusicManager
+from commands.music.musicsystem.embeds import embed_lyrics, embed_error, embed_searching_lyrics, embed_lyrics_search_results
+from commands.music.musicsystem.lyrics_store import lyrics_store
+from commands.music.musicsystem.music_registry import MusicManagerRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -11,38 +12,56 @@ class LyricsCommand(commands.Cog):
     Comando para buscar letras da música atual.
     """
 
-    def __init__(self, bot, music_manager: MusicManager):
+    def __init__(self, bot, music_managers: MusicManagerRegistry):
         """
         Inicializa o comando Lyrics.
         """
         self.bot = bot
-        self.music_manager = music_manager
+        self.music_managers = music_managers
 
-    @commands.command(name="lyrics", aliases=["letra", "lyric", "letras"])
+    @commands.group(name="lyrics", aliases=["letra", "lyric", "letras"], invoke_without_command=True)
     async def lyrics(self, ctx):
         """
         Comando para buscar letras da música atualmente tocando.
         """
-        if not self.music_manager.current_song:
+        music_manager = self.music_managers.get(ctx.guild)
+
+        if not music_manager.current_song:
             await ctx.send(embed=embed_error("Nenhuma música está tocando no momento."))
             return
 
-        title = self.music_manager.current_song.get('title', 'Desconhecido')
+        title = music_manager.current_song.get('title', 'Desconhecido')
         logger.info(f"Buscando letras para a música: {title}")
 
         # Envia a mensagem informando que a letra está sendo pesquisada
         searching_message = await ctx.send(embed=embed_searching_lyrics(title))
 
         try:
-            await self.music_manager.fetch_lyrics(ctx)
+            await music_manager.fetch_lyrics(ctx)
             await searching_message.delete()  # Apaga a mensagem de "pesquisando"
         except Exception as e:
             logger.error(f"Erro ao buscar letras: {e}")
             await ctx.send(embed=embed_error("Erro ao buscar letras. Tente novamente."))
             await searching_message.delete()  # Apaga a mensagem de "pesquisando" mesmo em caso de erro
 
-async def setup(bot, music_manager):
+    @lyrics.command(name="search", aliases=["buscar", "pesquisar"])
+    async def lyrics_search(self, ctx, *, phrase: str = None):
+        """
+        Procura, entre as letras já armazenadas, as músicas que contêm um trecho.
+        """
+        if not phrase:
+            await ctx.send(embed=embed_error("Informe um trecho da letra. Exemplo: `lyrics search deixei de te amar`"))
+            return
+
+        try:
+            results = await lyrics_store.search(phrase)
+            await ctx.send(embed=embed_lyrics_search_results(phrase, results))
+        except Exception as e:
+            logger.error(f"Erro ao pesquisar letras: {e}")
+            await ctx.send(embed=embed_error("Erro ao pesquisar letras. Tente novamente."))
+
+async def setup(bot, music_managers: MusicManagerRegistry):
     """
     Adiciona o cog LyricsCommand ao bot.
     """
-    await bot.add_cog(LyricsCommand(bot, music_manager))
+    await bot.add_cog(LyricsCommand(bot, music_managers))
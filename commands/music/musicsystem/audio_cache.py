@@ -0,0 +1,245 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+from colorama import Fore, Style
+
+from commands.music.musicsystem.track_cache import normalize_key
+from utils.async_database import db
+from utils.database import pool
+
+logger = logging.getLogger(__name__)
+
+AUDIO_CACHE_ENABLED = os.getenv("AUDIO_CACHE_ENABLED", "0") == "1"  # Cache local de áudio é opcional
+AUDIO_CACHE_DIR = os.getenv("AUDIO_CACHE_DIR", os.path.join("cache", "audio"))
+AUDIO_CACHE_MAX_MB = int(os.getenv("AUDIO_CACHE_MAX_MB", "1024"))  # Espaço máximo ocupado pelos arquivos
+AUDIO_CACHE_MIN_PLAYS = int(os.getenv("AUDIO_CACHE_MIN_PLAYS", "2"))  # Reproduções até a faixa ser considerada "quente"
+AUDIO_CACHE_MAX_DURATION = 15 * 60  # Faixas mais longas que isso (em segundos) nunca são armazenadas
+AUDIO_CACHE_BITRATE = "128k"
+
+
+class AudioCache:
+    """
+    Cache em disco das faixas mais tocadas, armazenadas como arquivos Opus.
+
+    Cada reprodução é contabilizada na tabela 'audio_cache'; quando uma faixa atinge
+    `AUDIO_CACHE_MIN_PLAYS` reproduções, ela é transcodificada pelo ffmpeg em segundo
+    plano e as próximas reproduções usam o arquivo local em vez do stream do YouTube.
+    Quando o espaço ultrapassa o limite, as faixas de menor pontuação são removidas
+    (frequência de uso ponderada pelo tempo desde a última reprodução).
+    """
+
+    def __init__(self, directory: str = AUDIO_CACHE_DIR, max_bytes: int = AUDIO_CACHE_MAX_MB * 1024 * 1024, enabled: bool = AUDIO_CACHE_ENABLED):
+        """
+        Inicializa o cache.
+
+        :param directory: Diretório onde os arquivos Opus são gravados.
+        :param max_bytes: Espaço máximo, em bytes, ocupado pelos arquivos.
+        :param enabled: Se False, nenhuma faixa é armazenada ou servida.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._entries: Dict[str, Dict] = {}  # cache_key -> {path, size_bytes, play_count, last_played}
+        self._downloading: Dict[str, asyncio.Task] = {}
+        self._lock = threading.Lock()
+        self._loaded = False
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self) -> None:
+        """
+        Cria a tabela (se necessário) e carrega o índice do cache para a memória (bloqueante).
+        """
+        with pool.writer() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS audio_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    path TEXT,
+                    size_bytes INTEGER NOT NULL DEFAULT 0,
+                    play_count INTEGER NOT NULL DEFAULT 0,
+                    last_played REAL NOT NULL
+                )
+            """)
+            rows = conn.execute("SELECT cache_key, path, size_bytes, play_count, last_played FROM audio_cache").fetchall()
+
+        entries = {}
+        for key, path, size_bytes, play_count, last_played in rows:
+            if path and not os.path.exists(path):
+                path, size_bytes = None, 0  # Arquivo apagado manualmente
+            entries[key] = {"path": path, "size_bytes": size_bytes, "play_count": play_count, "last_played": last_played}
+        with self._lock:
+            self._entries = entries
+            self._loaded = True
+        os.makedirs(self.directory, exist_ok=True)
+        logger.info(f"[AUDIO CACHE] {sum(1 for e in entries.values() if e['path'])} faixas em cache ({self.used_bytes() / 1024 / 1024:.1f} MB).")
+
+    async def ensure_loaded(self) -> None:
+        """
+        Carrega o índice do cache na primeira utilização.
+        """
+        if self.enabled and not self._loaded:
+            await db.run(self._load)
+
+    def used_bytes(self) -> int:
+        """
+        Espaço ocupado pelos arquivos em cache.
+        """
+        with self._lock:
+            return sum(entry["size_bytes"] for entry in self._entries.values() if entry["path"])
+
+    async def lookup(self, song: Dict) -> Optional[str]:
+        """
+        Retorna o caminho do arquivo local da música, se ela estiver em cache.
+        """
+        if not self.enabled or not song.get("url"):
+            return None
+        await self.ensure_loaded()
+
+        entry = self._entries.get(normalize_key(song["url"]))
+        if entry and entry["path"] and os.path.exists(entry["path"]):
+            self.hits += 1
+            return entry["path"]
+        self.misses += 1
+        return None
+
+    async def record_play(self, song: Dict) -> None:
+        """
+        Contabiliza uma reprodução e agenda o armazenamento da faixa se ela ficou "quente".
+        """
+        if not self.enabled or not song.get("url") or song.get("type") == "radio":
+            return
+        await self.ensure_loaded()
+
+        key = normalize_key(song["url"])
+        now = time.time()
+        with self._lock:
+            entry = self._entries.setdefault(key, {"path": None, "size_bytes": 0, "play_count": 0, "last_played": now})
+            entry["play_count"] += 1
+            entry["last_played"] = now
+            play_count = entry["play_count"]
+            should_store = (
+                entry["path"] is None
+                and play_count >= AUDIO_CACHE_MIN_PLAYS
+                and key not in self._downloading
+                and 0 < (song.get("duration") or 0) <= AUDIO_CACHE_MAX_DURATION
+                and song.get("stream_url")
+            )
+
+        await db.execute_query(
+            "INSERT INTO audio_cache (cache_key, play_count, last_played) VALUES (?, 1, ?) "
+            "ON CONFLICT(cache_key) DO UPDATE SET play_count = play_count + 1, last_played = excluded.last_played",
+            (key, now),
+            log=False,
+        )
+
+        if should_store:
+            task = asyncio.create_task(self._store(key, song["stream_url"], song.get("title", key)))
+            self._downloading[key] = task
+            task.add_done_callback(lambda _: self._downloading.pop(key, None))
+
+    async def _store(self, key: str, stream_url: str, title: str) -> None:
+        """
+        Transcodifica o stream para Opus com o ffmpeg e registra o arquivo no cache.
+        """
+        filename = "".join(c if c.isalnum() or c in "-_" else "_" for c in key) + ".opus"
+        path = os.path.join(self.directory, filename)
+        partial = path + ".part"
+        process = None
+        try:
+            process = await asyncio.create_subprocess_exec(
+                "ffmpeg", "-nostdin", "-loglevel", "error", "-y",
+                "-reconnect", "1", "-reconnect_streamed", "1", "-reconnect_delay_max", "5",
+                "-i", stream_url, "-vn", "-c:a", "libopus", "-b:a", AUDIO_CACHE_BITRATE, "-f", "opus", partial,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            _, stderr = await process.communicate()
+            if process.returncode != 0:
+                raise RuntimeError(stderr.decode(errors="ignore").strip() or f"ffmpeg saiu com código {process.returncode}")
+
+            os.replace(partial, path)
+            size_bytes = os.path.getsize(path)
+            with self._lock:
+                entry = self._entries[key]
+                entry["path"], entry["size_bytes"] = path, size_bytes
+            await db.execute_query(
+                "UPDATE audio_cache SET path = ?, size_bytes = ? WHERE cache_key = ?",
+                (path, size_bytes, key),
+                log=False,
+            )
+            logger.info(f"{Fore.GREEN}[AUDIO CACHE]{Style.RESET_ALL} Faixa armazenada em cache: {title} ({size_bytes / 1024 / 1024:.1f} MB).")
+            await self._evict()
+        except asyncio.CancelledError:
+            # Encerra o ffmpeg antes de apagar o arquivo parcial, senão ele continuaria baixando
+            if process is not None and process.returncode is None:
+                try:
+                    process.kill()
+                except ProcessLookupError:
+                    pass
+                await process.wait()
+            raise
+        except Exception as e:
+            logger.error(f"{Fore.RED}[AUDIO CACHE]{Style.RESET_ALL} Erro ao armazenar '{title}' em cache: {e}")
+        finally:
+            if os.path.exists(partial):
+                os.remove(partial)
+
+    @staticmethod
+    def _score(entry: Dict, now: float) -> float:
+        """
+        Pontuação de permanência: reproduções divididas pela idade (em horas) da última reprodução.
+        """
+        return entry["play_count"] / (1.0 + (now - entry["last_played"]) / 3600.0)
+
+    async def _evict(self) -> None:
+        """
+        Remove as faixas de menor pontuação até o cache voltar a caber no limite de espaço.
+        """
+        now = time.time()
+        with self._lock:
+            cached = sorted(
+                ((key, entry) for key, entry in self._entries.items() if entry["path"]),
+                key=lambda item: self._score(item[1], now),
+            )
+            used = sum(entry["size_bytes"] for _, entry in cached)
+            evicted = []
+            for key, entry in cached:
+                if used <= self.max_bytes:
+                    break
+                used -= entry["size_bytes"]
+                evicted.append((key, entry["path"]))
+                entry["path"], entry["size_bytes"] = None, 0
+
+        for key, path in evicted:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        if evicted:
+            await db.execute_many(
+                "UPDATE audio_cache SET path = NULL, size_bytes = 0 WHERE cache_key = ?",
+                [(key,) for key, _ in evicted],
+                log=False,
+            )
+            logger.info(f"{Fore.YELLOW}[AUDIO CACHE]{Style.RESET_ALL} {len(evicted)} faixa(s) removida(s) do cache para respeitar o limite de espaço.")
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Retorna os contadores do cache, incluindo a taxa de acerto.
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+            "files": sum(1 for entry in self._entries.values() if entry["path"]),
+            "used_mb": self.used_bytes() / 1024 / 1024,
+        }
+
+
+# Instância compartilhada por todos os players
+audio_cache = AudioCache()
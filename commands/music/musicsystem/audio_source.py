@@ -0,0 +1,150 @@
+import asyncio
+import logging
+import os
+
+import discord
+
+from commands.music.musicsystem.ffmpeg_options import FFMPEG_OPTIONS
+
+logger = logging.getLogger(__name__)
+
+# "opus": o ffmpeg entrega Opus pronto, com o volume aplicado como filtro (menos CPU por sessão)
+# "pcm": o ffmpeg entrega PCM e o volume é aplicado em Python a cada frame (troca de volume instantânea)
+PLAYBACK_MODE = os.getenv("MUSIC_PLAYBACK_MODE", "opus").lower()
+OPUS_BITRATE = int(os.getenv("MUSIC_OPUS_BITRATE", "128"))  # kbps
+FRAME_DURATION = 0.02  # Cada pacote de áudio do Discord cobre 20 ms
+SOURCE_CLEANUP_DELAY = 1.0  # Segundos até encerrar uma fonte substituída no player
+
+
+class TrackedOpusAudio(discord.FFmpegOpusAudio):
+    """
+    Fonte Opus gerada pelo ffmpeg, com o volume aplicado pelo filtro 'volume'.
+
+    Como o volume não pode ser alterado em Python sem decodificar o áudio, a fonte
+    acompanha a posição reproduzida (contando os pacotes lidos) para que possa ser
+    recriada a partir do mesmo ponto com um novo volume.
+    """
+
+    def __init__(self, location, volume=1.0, *, remote=True, seekable=True, start_at=0.0):
+        """
+        :param location: URL do stream ou caminho do arquivo local.
+        :param volume: Volume (0.0 a 1.0) aplicado pelo ffmpeg.
+        :param remote: Se True, ativa as opções de reconexão do ffmpeg.
+        :param seekable: Se False (ex.: rádios ao vivo), a posição não é usada ao recriar a fonte.
+        :param start_at: Posição inicial, em segundos.
+        """
+        self.location = location
+        self.volume_level = volume
+        self.remote = remote
+        self.seekable = seekable
+        self.start_at = start_at if seekable else 0.0
+        self.frames_read = 0
+
+        before_options = FFMPEG_OPTIONS['before_options'] if remote else ''
+        if self.start_at:
+            before_options = f"{before_options} -ss {self.start_at:.2f}".strip()
+
+        # Arquivos Opus locais tocados sem alteração de volume dispensam até a recodificação
+        passthrough = not remote and volume == 1.0 and location.endswith('.opus')
+        super().__init__(
+            location,
+            bitrate=OPUS_BITRATE,
+            codec='copy' if passthrough else None,
+            before_options=before_options or None,
+            options='-vn' if passthrough else f"-vn -filter:a volume={volume:.3f}",
+        )
+
+    def read(self):
+        data = super().read()
+        if data:
+            self.frames_read += 1
+        return data
+
+    @property
+    def position(self):
+        """
+        Posição atual da reprodução, em segundos.
+        """
+        return self.start_at + self.frames_read * FRAME_DURATION
+
+    def with_volume(self, volume):
+        """
+        Cria uma nova fonte para o mesmo áudio, continuando da posição atual com outro volume.
+        """
+        return TrackedOpusAudio(
+            self.location,
+            volume,
+            remote=self.remote,
+            seekable=self.seekable,
+            start_at=self.position if self.seekable else 0.0,
+        )
+
+
+def create_source(location, volume=1.0, *, remote=True, seekable=True, start_at=0.0):
+    """
+    Cria a fonte de áudio de acordo com o modo de reprodução configurado.
+
+    :param location: URL do stream ou caminho do arquivo local.
+    :param volume: Volume inicial (0.0 a 1.0).
+    :param remote: Se True, ativa as opções de reconexão do ffmpeg.
+    :param seekable: Se False, a fonte representa um stream ao vivo.
+    :param start_at: Posição inicial, em segundos (ex.: retomada após reinício).
+    """
+    if PLAYBACK_MODE == "opus":
+        return TrackedOpusAudio(location, volume, remote=remote, seekable=seekable, start_at=start_at)
+
+    options = dict(FFMPEG_OPTIONS) if remote else {'options': '-vn'}
+    if start_at and seekable:
+        options['before_options'] = f"{options.get('before_options', '')} -ss {start_at:.2f}".strip()
+    return discord.PCMVolumeTransformer(discord.FFmpegPCMAudio(location, **options), volume=volume)
+
+
+def defer_cleanup(source):
+    """
+    Encerra uma fonte que acabou de ser substituída no player, após um intervalo.
+
+    A thread do player lê a fonte fora do lock da troca e pode estar no meio de
+    um `read()` da fonte antiga; encerrá-la na hora faria essa leitura voltar
+    vazia, o que o player interpreta como fim da música (pulando a faixa).
+    """
+    try:
+        asyncio.get_running_loop().call_later(SOURCE_CLEANUP_DELAY, source.cleanup)
+    except RuntimeError:
+        source.cleanup()  # Fora do event loop: não há como adiar
+
+
+def apply_volume(voice_client, volume):
+    """
+    Aplica um novo volume à fonte em reprodução.
+
+    Fontes PCM são ajustadas diretamente; fontes Opus (incluindo ouvintes de rádio
+    compartilhada) são recriadas com o novo volume e trocadas no player sem disparar
+    o callback de fim de música, preservando a pausa.
+
+    :return: True se o volume foi aplicado à fonte atual.
+    """
+    source = voice_client.source if voice_client else None
+    if source is None:
+        return False
+
+    if hasattr(source, 'volume'):
+        source.volume = volume
+        return True
+
+    if hasattr(source, 'with_volume'):
+        if abs(source.volume_level - volume) < 0.001:
+            return True
+        # Trocar a fonte retoma o player; uma música pausada deve continuar pausada
+        was_paused = voice_client.is_paused()
+        try:
+            voice_client.source = source.with_volume(volume)
+        except Exception as e:
+            logger.error(f"[VOLUME] Erro ao recriar a fonte Opus com o novo volume: {e}")
+            return False
+        if was_paused:
+            voice_client.pause()
+        defer_cleanup(source)  # Encerra o ffmpeg (ou a inscrição na rádio) da fonte anterior
+        logger.info(f"[VOLUME] Fonte Opus recriada com volume {volume * 100:.0f}%.")
+        return True
+
+    return False
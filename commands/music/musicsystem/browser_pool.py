@@ -0,0 +1,155 @@
+import asyncio
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import List, Optional, Tuple
+
+from colorama import Fore, Style
+from playwright.async_api import async_playwright
+
+logger = logging.getLogger(__name__)
+
+BROWSER_MAX_PAGES = int(os.getenv("LYRICS_BROWSER_PAGES", "2"))  # Páginas (e contextos) abertas ao mesmo tempo
+BROWSER_IDLE_TIMEOUT = int(os.getenv("LYRICS_BROWSER_IDLE", "300"))  # Segundos sem uso até fechar o Chromium
+
+
+class BrowserPool:
+    """
+    Pool de páginas de um único Chromium headless, compartilhado pelas buscas de letras.
+
+    O navegador é iniciado na primeira busca e reaproveitado pelas seguintes. Cada
+    página vive em um contexto próprio e volta para o pool ao final da busca; o
+    número de páginas em uso é limitado por um semáforo, de forma que uma rajada de
+    comandos aguarda na fila em vez de abrir vários navegadores. O Chromium é fechado
+    depois de um período ocioso e reiniciado automaticamente se travar.
+    """
+
+    def __init__(self, max_pages: int = BROWSER_MAX_PAGES, idle_timeout: int = BROWSER_IDLE_TIMEOUT):
+        """
+        Inicializa o pool.
+
+        :param max_pages: Máximo de páginas em uso simultaneamente.
+        :param idle_timeout: Segundos sem uso até o navegador ser encerrado.
+        """
+        self.max_pages = max_pages
+        self.idle_timeout = idle_timeout
+        self._playwright = None
+        self._browser = None
+        self._idle_pages: List[Tuple] = []  # (contexto, página) prontos para reuso
+        self._in_use = 0
+        self._last_used = time.monotonic()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._idle_task: Optional[asyncio.Task] = None
+        self.launches = 0
+
+    async def _ensure_browser(self):
+        """
+        Inicia o Chromium se ele ainda não estiver aberto ou se tiver caído.
+        """
+        if self._browser is not None and self._browser.is_connected():
+            return self._browser
+
+        async with self._lock:
+            if self._browser is not None and self._browser.is_connected():
+                return self._browser
+
+            if self._browser is not None:
+                logger.warning(f"{Fore.YELLOW}[BROWSER]{Style.RESET_ALL} Chromium desconectado. Reiniciando...")
+                await self._shutdown()
+
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(headless=True)
+            self.launches += 1
+            logger.info(f"{Fore.CYAN}[BROWSER]{Style.RESET_ALL} Chromium iniciado para as buscas de letras.")
+
+            if self._idle_task is None or self._idle_task.done():
+                self._idle_task = asyncio.create_task(self._idle_watch())
+            return self._browser
+
+    @asynccontextmanager
+    async def page(self):
+        """
+        Empresta uma página do pool durante o bloco `async with`.
+
+        Páginas que terminam com erro são descartadas em vez de voltar para o pool,
+        evitando reaproveitar uma aba em estado inconsistente.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_pages)
+            self._lock = asyncio.Lock()
+
+        async with self._semaphore:
+            self._in_use += 1
+            context = page = None
+            try:
+                browser = await self._ensure_browser()
+                while self._idle_pages:
+                    context, page = self._idle_pages.pop()
+                    if not page.is_closed():
+                        break
+                    context = page = None
+                if page is None:
+                    context = await browser.new_context()
+                    page = await context.new_page()
+
+                yield page
+
+                self._idle_pages.append((context, page))
+                context = page = None
+            finally:
+                if context is not None:
+                    await self._close_quietly(context)
+                self._in_use -= 1
+                self._last_used = time.monotonic()
+
+    async def _idle_watch(self):
+        """
+        Fecha o navegador quando ele fica sem uso por `idle_timeout` segundos.
+        """
+        while self._browser is not None:
+            await asyncio.sleep(min(60, self.idle_timeout))
+            if self._in_use == 0 and time.monotonic() - self._last_used >= self.idle_timeout:
+                async with self._lock:
+                    if self._in_use == 0 and self._browser is not None:
+                        await self._shutdown()
+                        logger.info(f"{Fore.YELLOW}[BROWSER]{Style.RESET_ALL} Chromium encerrado por inatividade.")
+                        return
+
+    async def _shutdown(self):
+        """
+        Fecha páginas, navegador e Playwright, ignorando erros de um navegador já caído.
+        """
+        idle_pages, self._idle_pages = self._idle_pages, []
+        for context, _ in idle_pages:
+            await self._close_quietly(context)
+        if self._browser is not None:
+            await self._close_quietly(self._browser)
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+        self._browser = None
+        self._playwright = None
+
+    @staticmethod
+    async def _close_quietly(target):
+        try:
+            await target.close()
+        except Exception:
+            pass
+
+    async def close(self):
+        """
+        Encerra o navegador (usado no desligamento do bot).
+        """
+        if self._idle_task is not None:
+            self._idle_task.cancel()
+        if self._browser is not None or self._playwright is not None:
+            await self._shutdown()
+
+
+# Instância compartilhada pelas buscas de letras
+browser_pool = BrowserPool()
@@ -333,6 +333,32 @@ def embed_playlist_added(title, uploader, valid_songs, total_duration, thumbnail
         banner=thumbnail
     )
 
+def embed_playlist_progress(title, uploader, added, expected, total_duration, thumbnail, user, status="loading"):
+    """
+    Embed de progresso da importação de uma playlist, editado conforme as músicas são adicionadas.
+
+    :param added: Quantidade de músicas já adicionadas à fila.
+    :param expected: Quantidade total de músicas da playlist, se conhecida.
+    :param status: "loading", "done", "partial" (leitura interrompida), "failed" ou "cancelled".
+    """
+    headers = {
+        "loading": "⏳ Carregando Playlist",
+        "done": "🎶 Playlist Adicionada",
+        "partial": "⚠️ Playlist Adicionada Parcialmente",
+        "failed": "❌ Falha ao Carregar a Playlist",
+        "cancelled": "⏹️ Carregamento da Playlist Cancelado",
+    }
+    count = f"{added}/{expected}" if expected else str(added)
+    return create_embed(
+        headers.get(status, headers["loading"]),
+        f"**Título:** {title}\n"
+        f"**Uploader:** {uploader}\n"
+        f"**Músicas Adicionadas:** {count}\n"
+        f"**Duração Total:** {format_duration(total_duration)}\n"
+        f"**Adicionada por:** {user.mention}",
+        banner=thumbnail
+    )
+
 def embed_playlist_menu(description=None):
     """
     Gera um embed para o menu principal de playlists.
@@ -478,14 +504,56 @@ def embed_lyrics(title, artist, lyrics):
     embed.set_footer(text=get_config("LEMA"))  # Adiciona o lema como rodapé
     return embed
 
-def embed_radio_menu(radios):
+def embed_lyrics_search_results(phrase, results):
+    """
+    Gera um embed com as músicas cujas letras contêm o trecho pesquisado.
+
+    :param phrase: Trecho pesquisado.
+    :param results: Lista de dicionários com 'title', 'artist' e 'snippet'.
+    :return: Um embed configurado.
+    """
+    if results:
+        description = "\n\n".join(
+            f"**{index}.** {result['title']} — *{result['artist']}*\n> {result['snippet'].replace(chr(10), ' ')}"
+            for index, result in enumerate(results, start=1)
+        )
+    else:
+        description = "Nenhuma música encontrada com esse trecho entre as letras já pesquisadas."
+    embed = discord.Embed(
+        title=f"🔎 Letras com: \"{phrase[:200]}\"",
+        description=description,
+        color=get_embed_color()
+    )
+    embed.set_footer(text=get_config("LEMA"))
+    return embed
+
+def _radio_status_line(index, radio, status):
+    """
+    Monta a linha de uma rádio no menu, com o status da última verificação.
+    """
+    if status is None:
+        return f"⚪ **{index}.** {radio['name']}"
+    if not status["online"]:
+        return f"🔴 **{index}.** {radio['name']} — *fora do ar*"
+    line = f"🟢 **{index}.** {radio['name']} `{status['latency']} ms`"
+    if status.get("title"):
+        title = status["title"] if len(status["title"]) <= 60 else status["title"][:57] + "..."
+        line += f"\n\u2003🎶 {title}"
+    return line
+
+
+def embed_radio_menu(radios, statuses=None):
     """
     Gera um embed para exibir o menu de rádios.
 
     :param radios: Lista de rádios.
+    :param statuses: Status das rádios por URL do stream (disponibilidade, latência e título tocando).
     :return: Um embed configurado.
     """
-    description = "\n".join([f"**{i+1}.** {radio['name']}" for i, radio in enumerate(radios)]) + "\n**18.** Desligar Rádio"
+    statuses = statuses or {}
+    description = "\n".join(
+        _radio_status_line(i + 1, radio, statuses.get(radio["stream"])) for i, radio in enumerate(radios)
+    ) + f"\n**{len(radios) + 1}.** Desligar Rádio"
     return create_embed(
         "🎵 Menu de Rádios",
         f"Escolha uma rádio digitando o número correspondente:\n\n{description}"
@@ -505,7 +573,7 @@ def embed_searching_lyrics(title):
     )
     return embed
 
-def embed_radio_now_playing(radio_name, stream_url, banner_url, user):
+def embed_radio_now_playing(radio_name, stream_url, banner_url, user, now_playing=None):
     """
     Gera um embed para exibir informações da rádio atualmente tocando.
 
@@ -513,6 +581,7 @@ def embed_radio_now_playing(radio_name, stream_url, banner_url, user):
     :param stream_url: URL do stream.
     :param banner_url: URL do banner da rádio.
     :param user: Usuário que iniciou a reprodução.
+    :param now_playing: Título que a rádio está tocando (metadados ICY), se conhecido.
     :return: Um embed configurado.
     """
     description = (
@@ -520,6 +589,8 @@ def embed_radio_now_playing(radio_name, stream_url, banner_url, user):
         f"🔗 **Stream:** [Clique aqui para ouvir]({stream_url})\n"
         f"👤 **Solicitada por:** {user.mention}"
     )
+    if now_playing:
+        description += f"\n🎶 **Tocando:** {now_playing}"
     return create_embed(
         "📻 Rádio Tocando Agora",
         description,
@@ -538,3 +609,21 @@ def embed_radio_stopped():
         "A reprodução foi encerrada. Escolha outra rádio para sintonizar ou continue sua experiência musical!"
     )
 
+
+
+def embed_top_tracks(tracks, days=None):
+    """
+    Gera um embed com as músicas mais tocadas do servidor.
+
+    :param tracks: Lista de tuplas (título, quantidade de reproduções).
+    :param days: Período considerado, em dias (None para todo o histórico).
+    :return: Um embed configurado.
+    """
+    period = f"nos últimos {days} dias" if days else "desde o início do registro"
+    if not tracks:
+        return create_embed("🏆 Músicas Mais Tocadas", f"Nenhuma música foi tocada {period}.")
+    lines = [
+        f"**{position}.** {title or 'Título desconhecido'} — {plays} reprodução(ões)"
+        for position, (title, plays) in enumerate(tracks, start=1)
+    ]
+    return create_embed("🏆 Músicas Mais Tocadas", f"Ranking {period}:\n\n" + "\n".join(lines))
@@ -0,0 +1,149 @@
+import asyncio
+import functools
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from yt_dlp import YoutubeDL
+from colorama import Fore, Style
+
+logger = logging.getLogger(__name__)
+
+EXTRACTION_WORKERS = int(os.getenv("YTDL_WORKERS", "3"))  # Extrações simultâneas do yt-dlp
+EXTRACTION_TIMEOUT = float(os.getenv("YTDL_TIMEOUT", "45"))  # Tempo máximo em segundos por extração
+
+
+class ExtractionService:
+    """
+    Executa as extrações do yt-dlp em um pool de threads limitado.
+
+    O `extract_info` é bloqueante e pode levar vários segundos; rodá-lo fora do
+    event loop mantém o áudio e o heartbeat do gateway fluindo enquanto as
+    músicas são resolvidas.
+    """
+
+    def __init__(self, max_workers: int = EXTRACTION_WORKERS, timeout: float = EXTRACTION_TIMEOUT):
+        """
+        Inicializa o serviço de extração.
+
+        :param max_workers: Número máximo de extrações executando ao mesmo tempo.
+        :param timeout: Tempo limite padrão, em segundos, de cada extração.
+        """
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ytdl")
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._queued = 0
+        self._running = 0
+        self.completed = 0
+        self.failures = 0
+        self.timeouts = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Quantidade de extrações aguardando uma vaga no pool.
+        """
+        return self._queued
+
+    @property
+    def running(self) -> int:
+        """
+        Quantidade de extrações em execução.
+        """
+        return self._running
+
+    def stats(self) -> dict:
+        """
+        Retorna as métricas do serviço de extração.
+        """
+        return {
+            "queue_depth": self._queued,
+            "running": self._running,
+            "completed": self.completed,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+        }
+
+    async def run(self, func: Callable, *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """
+        Executa uma função bloqueante no pool, respeitando o limite de concorrência e o tempo limite.
+
+        Se a coroutine for cancelada enquanto aguarda na fila, a extração nunca é
+        iniciada; se for cancelada ou expirar durante a execução, apenas quem chamou
+        deixa de esperar: a vaga continua ocupada até a thread terminar, para que
+        extrações abandonadas não ultrapassem o limite de concorrência.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+
+        self._queued += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._queued -= 1
+
+        self._running += 1
+        try:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+        except Exception:
+            self._release()
+            raise
+        future.add_done_callback(self._on_finished)
+
+        try:
+            # shield: o tempo limite não cancela o future, que libera a vaga ao terminar
+            result = await asyncio.wait_for(asyncio.shield(future), timeout or self.timeout)
+            self.completed += 1
+            return result
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            logger.error(f"{Fore.RED}[EXTRACTOR]{Style.RESET_ALL} Tempo limite excedido ({timeout or self.timeout}s) na extração.")
+            raise
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.failures += 1
+            raise
+
+    def _on_finished(self, future: asyncio.Future) -> None:
+        if not future.cancelled():
+            future.exception()  # Evita o aviso de exceção não lida quando ninguém aguarda mais o resultado
+        self._release()
+
+    def _release(self) -> None:
+        self._running -= 1
+        self._semaphore.release()
+
+    async def extract(self, query: str, ydl_opts: dict, timeout: Optional[float] = None, process: bool = True) -> Optional[dict]:
+        """
+        Extrai as informações de uma URL ou busca usando o yt-dlp, sem bloquear o event loop.
+
+        :param query: URL ou termo de busca.
+        :param ydl_opts: Opções do YoutubeDL.
+        :param timeout: Tempo limite desta extração (usa o padrão do serviço se omitido).
+        :param process: Se False, retorna as entradas de playlists sem resolvê-las.
+        :return: Dicionário de informações retornado pelo yt-dlp.
+        """
+        logger.debug(f"[EXTRACTOR] Extraindo '{query}' (fila: {self._queued}, em execução: {self._running}).")
+        return await self.run(_extract_info, query, ydl_opts, process, timeout=timeout)
+
+    def shutdown(self) -> None:
+        """
+        Encerra o pool de extração sem aguardar as extrações pendentes.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _extract_info(query: str, ydl_opts: dict, process: bool = True) -> Optional[dict]:
+    """
+    Executa o `extract_info` do yt-dlp (bloqueante). Chamada apenas dentro do pool.
+    """
+    with YoutubeDL(ydl_opts) as ydl:
+        return ydl.extract_info(query, download=False, process=process)
+
+
+# Instância compartilhada por todo o sistema de música
+extractor = ExtractionService()
@@ -0,0 +1,233 @@
+import abc
+import logging
+import time
+from typing import Dict, List, Optional
+from urllib.parse import quote
+
+import aiohttp
+from colorama import Fore, Style
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from commands.music.musicsystem.browser_pool import browser_pool
+from utils.database import get_config
+
+logger = logging.getLogger(__name__)
+
+VAGALUME_API_URL = "https://api.vagalume.com.br"
+VAGALUME_TIMEOUT = 8  # Segundos por requisição à API do Vagalume
+
+
+class LyricsProvider(abc.ABC):
+    """
+    Interface dos provedores de letras.
+
+    Cada provedor implementa `search`, que retorna um dicionário com 'title',
+    'artist', 'lyrics' e 'source_url', ou None quando a música não foi encontrada.
+    Erros de rede devem ser propagados como exceções, para que não sejam
+    confundidos com "letra inexistente". A chamada pública `fetch` registra a
+    latência e o resultado de cada consulta.
+    """
+
+    name = "base"
+
+    def __init__(self):
+        self.calls = 0
+        self.found = 0
+        self.failures = 0
+        self.total_latency = 0.0
+
+    def is_available(self) -> bool:
+        """
+        Indica se o provedor pode ser usado (ex.: chave de API configurada).
+        """
+        return True
+
+    @abc.abstractmethod
+    async def search(self, title: str) -> Optional[Dict]:
+        """
+        Busca a letra no serviço do provedor.
+        """
+
+    async def fetch(self, title: str) -> Optional[Dict]:
+        """
+        Busca a letra de uma música, registrando as métricas do provedor.
+        """
+        self.calls += 1
+        started = time.perf_counter()
+        try:
+            result = await self.search(title)
+        except Exception:
+            self.failures += 1
+            raise
+        finally:
+            self.total_latency += time.perf_counter() - started
+        if result:
+            self.found += 1
+        return result
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Retorna as métricas do provedor, incluindo a latência média em milissegundos.
+        """
+        return {
+            "calls": self.calls,
+            "found": self.found,
+            "failures": self.failures,
+            "avg_latency_ms": (self.total_latency / self.calls * 1000) if self.calls else 0.0,
+        }
+
+    async def close(self) -> None:
+        """
+        Libera os recursos do provedor.
+        """
+
+
+class VagalumeProvider(LyricsProvider):
+    """
+    Provedor baseado na API HTTP do Vagalume (chave na configuração 'VAGALUME_API_KEY').
+
+    Títulos no formato "Artista - Música" são resolvidos com uma única requisição;
+    nos demais casos, a música é localizada pela busca textual e a letra é obtida
+    pelo ID retornado.
+    """
+
+    name = "vagalume"
+
+    def __init__(self):
+        super().__init__()
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _api_key(self) -> Optional[str]:
+        return get_config("VAGALUME_API_KEY")
+
+    def is_available(self) -> bool:
+        return bool(self._api_key())
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=VAGALUME_TIMEOUT))
+        return self._session
+
+    async def _get_json(self, path: str, **params) -> Dict:
+        params["apikey"] = self._api_key()
+        async with self._get_session().get(f"{VAGALUME_API_URL}/{path}", params=params) as response:
+            response.raise_for_status()
+            return await response.json(content_type=None)
+
+    @staticmethod
+    def _parse_song(data: Dict) -> Optional[Dict]:
+        """
+        Converte a resposta de 'search.php' no formato comum dos provedores.
+        """
+        if data.get("type") not in ("exact", "aprox") or not data.get("mus"):
+            return None
+        song = data["mus"][0]
+        return {
+            "title": song.get("name"),
+            "artist": (data.get("art") or {}).get("name"),
+            "lyrics": song.get("text"),
+            "source_url": song.get("url"),
+        }
+
+    async def search(self, title: str) -> Optional[Dict]:
+        if " - " in title:
+            artist, song = (part.strip() for part in title.split(" - ", 1))
+            result = self._parse_song(await self._get_json("search.php", art=artist, mus=song))
+            if result:
+                return result
+
+        # Sem artista identificável: localiza a música pela busca textual
+        found = await self._get_json("search.artmus", q=title, limit=1)
+        docs = (found.get("response") or {}).get("docs") or []
+        song_id = next((doc.get("id") for doc in docs if doc.get("title")), None)
+        if not song_id:
+            return None
+        return self._parse_song(await self._get_json("search.php", musid=song_id))
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+
+class LetrasBrowserProvider(LyricsProvider):
+    """
+    Provedor de reserva: renderiza o letras.mus.br no Chromium compartilhado.
+    """
+
+    name = "letras.mus.br"
+
+    async def search(self, title: str) -> Optional[Dict]:
+        base_url = "https://www.letras.mus.br/"
+        formatted_title = quote(title)
+        search_url = f"{base_url}?q={formatted_title}#gsc.tab=0&gsc.q={formatted_title}"
+
+        async with browser_pool.page() as page:
+            logger.info(f"[LYRICS] Acessando URL: {search_url}")
+            await page.goto(search_url, timeout=60000)
+
+            try:
+                await page.wait_for_selector('a.gs-title[data-ctorig]', timeout=15000)
+            except PlaywrightTimeoutError:
+                # A página de resultados não trouxe nenhuma música
+                return None
+            result = page.locator('a.gs-title[data-ctorig]')
+            lyrics_url = await result.first.get_attribute('data-ctorig')
+
+            await page.goto(lyrics_url, timeout=60000)
+            await page.wait_for_selector("div.lyric-original", timeout=15000)
+
+            return {
+                "title": await page.locator("h1.textStyle-primary").inner_text(),
+                "artist": await page.locator("h2.textStyle-secondary").inner_text(),
+                "lyrics": await page.locator("div.lyric-original").inner_text(),
+                "source_url": lyrics_url,
+            }
+
+
+class LyricsService:
+    """
+    Consulta os provedores de letras em ordem, do mais rápido para o mais pesado.
+    """
+
+    def __init__(self, providers: List[LyricsProvider]):
+        """
+        :param providers: Provedores na ordem em que devem ser consultados.
+        """
+        self.providers = providers
+
+    async def lookup(self, title: str):
+        """
+        Busca a letra de uma música nos provedores disponíveis.
+
+        :return: Tupla (resultado, definitivo). `resultado` é None quando nenhum provedor
+                 encontrou a letra; `definitivo` é False se algum provedor falhou, caso
+                 em que a ausência não deve ser registrada no cache negativo.
+        """
+        definitive = True
+        for provider in self.providers:
+            if not provider.is_available():
+                continue
+            try:
+                result = await provider.fetch(title)
+            except Exception as e:
+                definitive = False
+                logger.warning(f"{Fore.YELLOW}[LYRICS]{Style.RESET_ALL} Provedor '{provider.name}' falhou para '{title}': {e}")
+                continue
+            if result and result.get("lyrics"):
+                logger.info(f"[LYRICS] Letra encontrada via '{provider.name}' para: {title}")
+                return result, True
+        return None, definitive
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Retorna as métricas de cada provedor.
+        """
+        return {provider.name: provider.stats() for provider in self.providers}
+
+    async def close(self) -> None:
+        for provider in self.providers:
+            await provider.close()
+
+
+# Vagalume como padrão (uma requisição HTTP); navegador apenas como reserva
+lyrics_service = LyricsService([VagalumeProvider(), LetrasBrowserProvider()])
@@ -0,0 +1,166 @@
+import logging
+import re
+import time
+from typing import Dict, List, Optional
+
+from colorama import Fore, Style
+
+from utils.async_database import db
+from utils.database import pool
+
+logger = logging.getLogger(__name__)
+
+LYRICS_TTL = 30 * 24 * 3600  # Letras encontradas são revalidadas após 30 dias
+LYRICS_NEGATIVE_TTL = 24 * 3600  # Buscas sem resultado só são repetidas após 1 dia
+
+
+def lyrics_key(title: str) -> str:
+    """
+    Normaliza um título (já filtrado por `filter_title`) para uso como chave.
+    """
+    return re.sub(r"\s+", " ", (title or "").lower()).strip()
+
+
+class LyricsStore:
+    """
+    Armazena as letras obtidas do letras.mus.br no banco de dados.
+
+    As letras ficam na tabela 'lyrics_cache', indexada pelo título filtrado, e
+    também no índice de texto completo 'lyrics_fts' (SQLite FTS5), que permite
+    encontrar uma música a partir de um trecho da letra. Buscas sem resultado são
+    registradas (cache negativo) para que a mesma música não seja pesquisada de
+    novo a cada comando.
+    """
+
+    def __init__(self, ttl: int = LYRICS_TTL, negative_ttl: int = LYRICS_NEGATIVE_TTL):
+        """
+        Inicializa o armazenamento.
+
+        :param ttl: Segundos até uma letra encontrada ser buscada novamente.
+        :param negative_ttl: Segundos até uma busca sem resultado ser repetida.
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._schema_ready = False
+
+    def _ensure_schema(self) -> None:
+        """
+        Cria as tabelas de letras caso ainda não existam.
+        """
+        if self._schema_ready:
+            return
+        with pool.writer() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS lyrics_cache (
+                    title_key TEXT PRIMARY KEY,
+                    title TEXT,
+                    artist TEXT,
+                    lyrics TEXT,
+                    source_url TEXT,
+                    found INTEGER NOT NULL,
+                    fetched_at REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS lyrics_fts USING fts5(
+                    title_key UNINDEXED, title, artist, lyrics,
+                    tokenize = 'unicode61 remove_diacritics 2'
+                )
+            """)
+        self._schema_ready = True
+
+    def _get(self, title_key: str) -> Optional[Dict]:
+        self._ensure_schema()
+        with pool.reader() as conn:
+            row = conn.execute(
+                "SELECT title, artist, lyrics, source_url, found, fetched_at FROM lyrics_cache WHERE title_key = ?",
+                (title_key,),
+            ).fetchone()
+        if not row:
+            return None
+        title, artist, lyrics, source_url, found, fetched_at = row
+        ttl = self.ttl if found else self.negative_ttl
+        if time.time() - fetched_at > ttl:
+            return None  # Expirada: será buscada novamente
+        return {"title": title, "artist": artist, "lyrics": lyrics, "source_url": source_url, "found": bool(found)}
+
+    def _put(self, title_key: str, title: Optional[str], artist: Optional[str], lyrics: Optional[str], source_url: Optional[str]) -> None:
+        self._ensure_schema()
+        found = lyrics is not None
+        with pool.writer() as conn:
+            conn.execute("""
+                INSERT INTO lyrics_cache (title_key, title, artist, lyrics, source_url, found, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(title_key) DO UPDATE SET
+                    title = excluded.title,
+                    artist = excluded.artist,
+                    lyrics = excluded.lyrics,
+                    source_url = excluded.source_url,
+                    found = excluded.found,
+                    fetched_at = excluded.fetched_at
+            """, (title_key, title, artist, lyrics, source_url, int(found), time.time()))
+            conn.execute("DELETE FROM lyrics_fts WHERE title_key = ?", (title_key,))
+            if found:
+                conn.execute(
+                    "INSERT INTO lyrics_fts (title_key, title, artist, lyrics) VALUES (?, ?, ?, ?)",
+                    (title_key, title, artist, lyrics),
+                )
+
+    def _search(self, phrase: str, limit: int) -> List[Dict]:
+        self._ensure_schema()
+        # Cada palavra vira um termo entre aspas, evitando que a sintaxe do FTS5 seja interpretada
+        terms = [word.replace('"', '""') for word in phrase.split()]
+        if not terms:
+            return []
+        query = " ".join(f'"{term}"' for term in terms)
+        with pool.reader() as conn:
+            rows = conn.execute("""
+                SELECT title, artist, snippet(lyrics_fts, 3, '**', '**', '…', 12)
+                FROM lyrics_fts
+                WHERE lyrics_fts MATCH ?
+                ORDER BY rank
+                LIMIT ?
+            """, (query, limit)).fetchall()
+        return [{"title": title, "artist": artist, "snippet": snippet} for title, artist, snippet in rows]
+
+    async def get(self, title: str) -> Optional[Dict]:
+        """
+        Busca uma letra armazenada e ainda válida.
+
+        :return: Dicionário com 'found' (False para buscas sem resultado registradas) ou None se não houver entrada válida.
+        """
+        try:
+            return await db.run(self._get, lyrics_key(title))
+        except Exception as e:
+            logger.error(f"{Fore.RED}[LYRICS STORE]{Style.RESET_ALL} Erro ao consultar letras armazenadas: {e}")
+            return None
+
+    async def put(self, title: str, song_title: str, artist: str, lyrics: str, source_url: Optional[str] = None) -> None:
+        """
+        Armazena uma letra encontrada e a adiciona ao índice de busca.
+        """
+        try:
+            await db.run(self._put, lyrics_key(title), song_title, artist, lyrics, source_url)
+        except Exception as e:
+            logger.error(f"{Fore.RED}[LYRICS STORE]{Style.RESET_ALL} Erro ao armazenar letra: {e}")
+
+    async def put_miss(self, title: str) -> None:
+        """
+        Registra que nenhuma letra foi encontrada para o título (cache negativo).
+        """
+        try:
+            await db.run(self._put, lyrics_key(title), title, None, None, None)
+        except Exception as e:
+            logger.error(f"{Fore.RED}[LYRICS STORE]{Style.RESET_ALL} Erro ao registrar busca sem resultado: {e}")
+
+    async def search(self, phrase: str, limit: int = 5) -> List[Dict]:
+        """
+        Procura músicas cuja letra contém as palavras informadas, sem acessar a internet.
+
+        :return: Lista de dicionários com 'title', 'artist' e 'snippet' (trecho com os termos destacados).
+        """
+        return await db.run(self._search, phrase, limit)
+
+
+# Instância compartilhada por todos os players
+lyrics_store = LyricsStore()
@@ -0,0 +1,259 @@
+import random
+from collections import deque
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+COMPACT_MIN_TOMBSTONES = 64  # Remoções acumuladas antes de considerar compactar a fila
+
+
+class MusicQueue:
+    """
+    Fila de músicas com operações O(1) nas pontas e remoção indexada.
+
+    Cada música recebe um ID de entrada estável: inserções no fim recebem IDs
+    crescentes e inserções no início recebem IDs decrescentes, de forma que a
+    ordem dos IDs é sempre a ordem da fila. Remoções no meio apenas marcam a
+    entrada como removida (tombstone); as entradas mortas são descartadas ao
+    chegarem na frente da fila ou quando a fila é compactada.
+    """
+
+    def __init__(self, songs: Iterable[Dict] = ()):
+        """
+        Inicializa a fila.
+
+        :param songs: Músicas iniciais, na ordem em que devem tocar.
+        """
+        self._order: deque = deque()  # IDs de entrada, incluindo tombstones
+        self._songs: Dict[int, Dict] = {}  # ID de entrada -> música (apenas entradas vivas)
+        self._by_url: Dict[str, Set[int]] = {}  # URL -> IDs de entrada com essa URL
+        self._head = 0  # Próximo ID para inserções no início (decrescente)
+        self._tail = 0  # Último ID usado em inserções no fim (crescente)
+        self._tombstones = 0
+        self._total_duration = 0
+        self.version = 0  # Incrementada a cada alteração; permite detectar filas modificadas
+        self.extend(songs)
+
+    # ----- Inserção -----
+
+    def append(self, song: Dict) -> int:
+        """
+        Adiciona uma música ao fim da fila.
+
+        :return: ID de entrada da música.
+        """
+        self._tail += 1
+        self._order.append(self._tail)
+        self._index(self._tail, song)
+        return self._tail
+
+    def appendleft(self, song: Dict) -> int:
+        """
+        Adiciona uma música no início da fila (será a próxima a tocar).
+
+        :return: ID de entrada da música.
+        """
+        self._head -= 1
+        self._order.appendleft(self._head)
+        self._index(self._head, song)
+        return self._head
+
+    def extend(self, songs: Iterable[Dict]) -> None:
+        """
+        Adiciona várias músicas ao fim da fila.
+        """
+        for song in songs:
+            self.append(song)
+
+    def reset(self, songs: Iterable[Dict] = ()) -> None:
+        """
+        Substitui todo o conteúdo da fila.
+        """
+        self.clear()
+        self.extend(songs)
+
+    # ----- Remoção -----
+
+    def popleft(self) -> Optional[Dict]:
+        """
+        Remove e retorna a primeira música da fila, ou None se estiver vazia.
+        """
+        while self._order:
+            entry_id = self._order.popleft()
+            song = self._songs.get(entry_id)
+            if song is None:
+                self._tombstones -= 1
+                continue
+            self._unindex(entry_id)
+            return song
+        return None
+
+    def remove(self, entry_id: int) -> Optional[Dict]:
+        """
+        Remove uma entrada pelo seu ID em O(1).
+
+        :return: A música removida, ou None se o ID não estiver na fila.
+        """
+        if entry_id not in self._songs:
+            return None
+        song = self._unindex(entry_id)
+        self._tombstones += 1
+        self._maybe_compact()
+        return song
+
+    def remove_by_url(self, url: str) -> Optional[Dict]:
+        """
+        Remove a primeira ocorrência de uma URL na fila.
+
+        :return: A música removida, ou None se a URL não estiver na fila.
+        """
+        found = self.find_by_url(url)
+        return self.remove(found[0]) if found else None
+
+    def remove_matching(self, song: Dict) -> int:
+        """
+        Remove todas as entradas iguais à música informada (usa o índice por URL).
+
+        :return: Quantidade de entradas removidas.
+        """
+        ids = [entry_id for entry_id in self._by_url.get(song.get("url"), ()) if self._songs[entry_id] == song]
+        for entry_id in ids:
+            self.remove(entry_id)
+        return len(ids)
+
+    def remove_where(self, predicate: Callable[[Dict], bool]) -> int:
+        """
+        Remove todas as entradas que satisfazem o predicado (O(n)).
+
+        :return: Quantidade de entradas removidas.
+        """
+        ids = [entry_id for entry_id, song in self._songs.items() if predicate(song)]
+        for entry_id in ids:
+            self.remove(entry_id)
+        return len(ids)
+
+    def clear(self) -> None:
+        """
+        Esvazia a fila.
+        """
+        self._order.clear()
+        self._songs.clear()
+        self._by_url.clear()
+        self._tombstones = 0
+        self._total_duration = 0
+        self.version += 1
+
+    # ----- Consulta -----
+
+    def peek(self) -> Optional[Dict]:
+        """
+        Retorna a primeira música da fila sem removê-la.
+        """
+        while self._order and self._order[0] not in self._songs:
+            # Descarta tombstones que chegaram na frente da fila
+            self._order.popleft()
+            self._tombstones -= 1
+        return self._songs[self._order[0]] if self._order else None
+
+    def find_by_url(self, url: str) -> Optional[Tuple[int, Dict]]:
+        """
+        Localiza a primeira ocorrência de uma URL na fila.
+
+        :return: Tupla (ID de entrada, música) ou None.
+        """
+        ids = self._by_url.get(url)
+        if not ids:
+            return None
+        entry_id = min(ids)
+        return entry_id, self._songs[entry_id]
+
+    def get(self, entry_id: int) -> Optional[Dict]:
+        """
+        Retorna a música de uma entrada pelo seu ID.
+        """
+        return self._songs.get(entry_id)
+
+    def entries(self) -> Iterator[Tuple[int, Dict]]:
+        """
+        Itera sobre os pares (ID de entrada, música), na ordem da fila.
+        """
+        for entry_id in self._order:
+            song = self._songs.get(entry_id)
+            if song is not None:
+                yield entry_id, song
+
+    @property
+    def total_duration(self) -> int:
+        """
+        Soma das durações das músicas na fila, mantida incrementalmente.
+        """
+        return self._total_duration
+
+    def shuffle(self) -> None:
+        """
+        Embaralha a fila, atribuindo novos IDs de entrada.
+        """
+        songs = list(self)
+        random.shuffle(songs)
+        self.reset(songs)
+
+    def __len__(self) -> int:
+        return len(self._songs)
+
+    def __bool__(self) -> bool:
+        return bool(self._songs)
+
+    def __iter__(self) -> Iterator[Dict]:
+        return (song for _, song in self.entries())
+
+    def __getitem__(self, key):
+        """
+        Acesso por posição ou fatia (ex.: paginação do comando de fila).
+        A posição 0 é O(1); as demais percorrem a fila até o ponto pedido.
+        """
+        if isinstance(key, slice):
+            if key.step is not None or (key.start or 0) < 0 or (key.stop is not None and key.stop < 0):
+                return list(self)[key]
+            return list(islice(self, key.start or 0, key.stop))
+        if key == 0:
+            song = self.peek()
+            if song is None:
+                raise IndexError("A fila de músicas está vazia.")
+            return song
+        if key < 0:
+            key += len(self)
+        for song in islice(self, key, key + 1):
+            return song
+        raise IndexError("Posição fora da fila de músicas.")
+
+    def copy(self) -> List[Dict]:
+        """
+        Retorna uma lista com as músicas da fila, na ordem.
+        """
+        return list(self)
+
+    # ----- Interno -----
+
+    def _index(self, entry_id: int, song: Dict) -> None:
+        self._songs[entry_id] = song
+        self._by_url.setdefault(song.get("url"), set()).add(entry_id)
+        self._total_duration += song.get("duration") or 0
+        self.version += 1
+
+    def _unindex(self, entry_id: int) -> Dict:
+        song = self._songs.pop(entry_id)
+        ids = self._by_url.get(song.get("url"))
+        if ids is not None:
+            ids.discard(entry_id)
+            if not ids:
+                del self._by_url[song.get("url")]
+        self._total_duration -= song.get("duration") or 0
+        self.version += 1
+        return song
+
+    def _maybe_compact(self) -> None:
+        """
+        Reconstrói a ordem sem os tombstones quando eles passam a dominar a fila.
+        """
+        if self._tombstones >= COMPACT_MIN_TOMBSTONES and self._tombstones > len(self._songs):
+            self._order = deque(entry_id for entry_id in self._order if entry_id in self._songs)
+            self._tombstones = 0
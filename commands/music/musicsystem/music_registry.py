@@ -0,0 +1,186 @@
+import asyncio
+import logging
+import time
+from typing import Dict, Iterator, Optional, Set
+
+from discord.ext import commands
+from colorama import Fore, Style
+
+from commands.music.musicsystem.music_system import MusicManager
+from commands.music.musicsystem.queue_snapshots import snapshot_store
+from utils.async_database import db
+
+logger = logging.getLogger(__name__)
+
+IDLE_TIMEOUT = 600  # Tempo em segundos sem uso antes de descartar o player de um servidor
+SWEEP_INTERVAL = 120  # Intervalo em segundos entre as varreduras de players ociosos
+SNAPSHOT_INTERVAL = 30  # Intervalo em segundos entre os snapshots das filas
+
+
+class MusicManagerRegistry:
+    """
+    Mantém um MusicManager isolado para cada servidor.
+
+    Os players são criados sob demanda na primeira interação de um servidor e
+    descartados depois de um período ocioso, de forma que fila, cliente de voz,
+    volume e modo de loop nunca são compartilhados entre servidores.
+    """
+
+    def __init__(self, bot, idle_timeout: int = IDLE_TIMEOUT, sweep_interval: int = SWEEP_INTERVAL):
+        """
+        Inicializa o registro de players.
+
+        :param bot: Instância do bot.
+        :param idle_timeout: Segundos sem atividade até o player ser descartado.
+        :param sweep_interval: Segundos entre cada varredura de players ociosos.
+        """
+        self.bot = bot
+        self.idle_timeout = idle_timeout
+        self.sweep_interval = sweep_interval
+        self._managers: Dict[int, MusicManager] = {}
+        self._sweep_task: Optional[asyncio.Task] = None
+        self._snapshot_task: Optional[asyncio.Task] = None
+        self._pending_restores: Dict[int, dict] = {}  # Snapshots carregados e ainda não aplicados
+        self._saved_versions: Dict[int, tuple] = {}  # Versão de cada fila no último snapshot gravado
+        self._discarded: Set[int] = set()  # Servidores cujo snapshot deve ser apagado
+
+    def get(self, guild) -> MusicManager:
+        """
+        Retorna o player do servidor, criando-o se ainda não existir.
+
+        :param guild: Objeto do servidor (discord.Guild) ou seu ID.
+        """
+        if guild is None:
+            raise commands.NoPrivateMessage("Os comandos de música só funcionam em servidores.")
+
+        guild_id = guild if isinstance(guild, int) else guild.id
+        manager = self._managers.get(guild_id)
+        if manager is None:
+            manager = MusicManager(self.bot, guild_id)
+            self._managers[guild_id] = manager
+            logger.info(f"{Fore.CYAN}[REGISTRY]{Style.RESET_ALL} Player criado para o servidor {guild_id}. Players ativos: {len(self._managers)}.")
+
+            # Retomada preguiçosa: a fila salva só é aplicada quando o servidor volta a usar o player
+            state = self._pending_restores.pop(guild_id, None)
+            if state:
+                manager.restore_state(state)
+                self._saved_versions[guild_id] = manager.snapshot_version()
+        manager.touch()
+        return manager
+
+    def peek(self, guild_id: int) -> Optional[MusicManager]:
+        """
+        Retorna o player do servidor sem criá-lo.
+        """
+        return self._managers.get(guild_id)
+
+    def __len__(self) -> int:
+        return len(self._managers)
+
+    def __iter__(self) -> Iterator[MusicManager]:
+        return iter(list(self._managers.values()))
+
+    def start(self) -> None:
+        """
+        Inicia a varredura periódica de players ociosos.
+        """
+        if self._sweep_task is None or self._sweep_task.done():
+            self._sweep_task = asyncio.create_task(self._sweep_loop())
+        if self._snapshot_task is None or self._snapshot_task.done():
+            self._snapshot_task = asyncio.create_task(self._snapshot_loop())
+
+    async def load_snapshots(self) -> int:
+        """
+        Carrega as filas salvas antes do último reinício. Elas ficam em memória e só
+        são aplicadas quando cada servidor volta a interagir com o player.
+
+        :return: Quantidade de filas disponíveis para retomada.
+        """
+        try:
+            self._pending_restores = await db.run(snapshot_store.load_all)
+        except Exception as e:
+            logger.error(f"{Fore.RED}[SNAPSHOT]{Style.RESET_ALL} Erro ao carregar as filas salvas: {e}")
+            self._pending_restores = {}
+        if self._pending_restores:
+            logger.info(f"{Fore.CYAN}[SNAPSHOT]{Style.RESET_ALL} {len(self._pending_restores)} fila(s) disponível(is) para retomada.")
+        return len(self._pending_restores)
+
+    async def _snapshot_loop(self) -> None:
+        """
+        Grava periodicamente as filas que mudaram desde o último snapshot.
+        """
+        while True:
+            await asyncio.sleep(SNAPSHOT_INTERVAL)
+            try:
+                await self.save_snapshots()
+            except Exception as e:
+                logger.error(f"{Fore.RED}[SNAPSHOT]{Style.RESET_ALL} Erro ao salvar as filas: {e}")
+
+    async def save_snapshots(self) -> int:
+        """
+        Grava apenas as filas alteradas (snapshot incremental) e apaga as que ficaram vazias.
+
+        :return: Quantidade de servidores gravados ou apagados.
+        """
+        states, deleted, versions = [], set(self._discarded), {}
+        for guild_id, manager in list(self._managers.items()):
+            version = manager.snapshot_version()
+            if self._saved_versions.get(guild_id) == version:
+                continue
+            versions[guild_id] = version
+            state = manager.snapshot_state()
+            if state is None:
+                deleted.add(guild_id)
+            else:
+                states.append((guild_id, state))
+
+        if not states and not deleted:
+            return 0
+        await db.run(snapshot_store.save, states, deleted)
+        self._saved_versions.update(versions)
+        self._discarded -= deleted
+        logger.debug(f"[SNAPSHOT] {len(states)} fila(s) gravada(s), {len(deleted)} removida(s).")
+        return len(states) + len(deleted)
+
+    async def close(self) -> None:
+        """
+        Interrompe as tarefas periódicas e grava um último snapshot (usado no desligamento do bot).
+        """
+        for task in (self._sweep_task, self._snapshot_task):
+            if task is not None:
+                task.cancel()
+        try:
+            await self.save_snapshots()
+        except Exception as e:
+            logger.error(f"{Fore.RED}[SNAPSHOT]{Style.RESET_ALL} Erro ao salvar as filas no desligamento: {e}")
+
+    async def _sweep_loop(self) -> None:
+        """
+        Descarta periodicamente os players ociosos.
+        """
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            try:
+                self.evict_idle()
+            except Exception as e:
+                logger.error(f"{Fore.RED}[REGISTRY]{Style.RESET_ALL} Erro ao descartar players ociosos: {e}")
+
+    def evict_idle(self) -> int:
+        """
+        Remove os players que estão ociosos há mais de `idle_timeout` segundos.
+
+        :return: Quantidade de players removidos.
+        """
+        now = time.monotonic()
+        idle = [
+            guild_id for guild_id, manager in self._managers.items()
+            if manager.is_idle() and now - manager.last_active >= self.idle_timeout
+        ]
+        for guild_id in idle:
+            self._managers.pop(guild_id).close()
+            self._saved_versions.pop(guild_id, None)
+            self._discarded.add(guild_id)
+
+        if idle:
+            logger.info(f"{Fore.YELLOW}[REGISTRY]{Style.RESET_ALL} {len(idle)} player(s) ocioso(s) descartado(s). Players ativos: {len(self._managers)}.")
+        return len(idle)
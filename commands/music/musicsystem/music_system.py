@@ -1,67 +1,183 @@
 from utils.database import get_emoji_from_table, get_fun_emoji, get_music_emoji, get_error_emoji, get_number_emoji, get_clan_management_emoji, get_server_staff_emoji
 import re
-from utils.database import execute_query, get_user_volume, set_user_volume
+from utils.async_database import db
 from commands.music.musicsystem.embeds import create_embed, embed_now_playing, embed_queue_empty, embed_error, embed_queue_song_added, embed_stop_music
 import asyncio
 import discord
-from yt_dlp import YoutubeDL
 import yt_dlp as youtube_dl
+from commands.music.musicsystem.extractor import extractor
+from commands.music.musicsystem.track_cache import track_cache
+from commands.music.musicsystem.music_queue import MusicQueue
+from commands.music.musicsystem.audio_cache import audio_cache
+from commands.music.musicsystem.play_log import play_log
+from commands.music.musicsystem.queue_snapshots import serialize_song
+from commands.music.musicsystem.audio_source import create_source, apply_volume
+from commands.music.musicsystem.radio_hub import radio_hub
 from utils.database import get_config
 import logging
-from commands.music.musicsystem.ffmpeg_options import FFMPEG_OPTIONS
-from playwright.sync_api import sync_playwright
-from playwright.async_api import async_playwright
+from commands.music.musicsystem.lyrics_store import lyrics_store
+from commands.music.musicsystem.lyrics_providers import lyrics_service
 from commands.music.musicsystem.embeds import embed_lyrics, embed_error  # Embeds para exibir letras e erros
 from colorama import Fore, Style
-import random
-from urllib.parse import quote
+import os
+from collections import deque
+import time
 
 logger = logging.getLogger(__name__)
 
 INACTIVITY_TIMEOUT = 10  # Tempo em segundos antes de desconectar por inatividade
+HISTORY_CAPACITY = int(os.getenv("MUSIC_HISTORY_SIZE", "50"))  # Músicas mantidas no histórico em memória
+PREFETCH_DEPTH = int(os.getenv("MUSIC_PREFETCH_DEPTH", "2"))  # Próximas músicas da fila resolvidas antecipadamente
+PREFETCH_REFRESH_MARGIN = 600  # Segundos de validade exigidos de uma URL de stream pré-resolvida
 
 
 class MusicManager:
-    def __init__(self, bot):
+    # Um MusicManager existe por servidor; __slots__ mantém pequeno o custo de cada instância
+    __slots__ = (
+        "bot", "guild_id", "last_active", "voice_channel", "voice_client", "music_queue",
+        "song_history", "current_song", "volume", "dj_role_id", "loop_mode",
+        "prefetch_task", "pending_resolves", "ingest_tasks",
+    )
+
+    def __init__(self, bot, guild_id=None):
         """
-        Inicializa o gerenciador de música.
+        Inicializa o gerenciador de música de um servidor.
+
+        :param bot: Instância do bot.
+        :param guild_id: ID do servidor ao qual este gerenciador pertence.
         """
         self.bot = bot
+        self.guild_id = guild_id
+        self.last_active = time.monotonic()  # Última interação, usada para descartar players ociosos
         self.voice_channel = None  # Canal de voz atual
         self.voice_client = None  # Cliente de voz do bot
-        self.music_queue = []  # Fila de músicas
-        self.song_history = []  # Histórico de músicas tocadas na sessão
+        self.music_queue = MusicQueue()  # Fila de músicas
+        self.song_history = deque(maxlen=HISTORY_CAPACITY)  # Histórico recente (as mais antigas são descartadas)
         self.current_song = None  # Música atualmente tocando
         self.volume = 1.0  # Volume padrão (100%)
         self.dj_role_id = get_config("TAG_DJ")  # ID da role de DJ, padrão é None
         self.loop_mode = "none"  # Modos de loop: "none", "single", "all"
+        self.prefetch_task = None  # Tarefa que resolve antecipadamente as próximas músicas
+        self.pending_resolves = {}  # Resoluções de stream em andamento, por música
+        self.ingest_tasks = set()  # Importações de playlists em andamento
+
+    def touch(self):
+        """
+        Registra uma interação com o player.
+        """
+        self.last_active = time.monotonic()
+
+    def is_idle(self):
+        """
+        Verifica se o player está ocioso: sem conexão de voz, sem música atual e com a fila vazia.
+        """
+        connected = self.voice_client is not None and self.voice_client.is_connected()
+        return not connected and self.current_song is None and not self.music_queue and not self.ingest_tasks
+
+    def close(self):
+        """
+        Libera os recursos do player antes de ele ser descartado.
+        """
+        if self.prefetch_task and not self.prefetch_task.done():
+            self.prefetch_task.cancel()
+        self.cancel_ingestion()
+        self.music_queue.clear()
+        self.song_history.clear()
+        self.voice_client = None
+        self.voice_channel = None
+
+    def get_playback_position(self):
+        """
+        Retorna a posição, em segundos, da música em reprodução, se a fonte permitir rastreá-la.
+        """
+        source = self.voice_client.source if self.voice_client else None
+        return getattr(source, 'position', None)
+
+    def snapshot_version(self):
+        """
+        Identifica o estado atual da fila para detectar alterações desde o último snapshot.
+        A posição entra arredondada em blocos de 30 s para que uma música em andamento
+        não gere uma gravação a cada varredura.
+        """
+        position = self.get_playback_position() or 0
+        return (self.music_queue.version, id(self.current_song), self.loop_mode, int(position // 30))
+
+    def snapshot_state(self):
+        """
+        Serializa a fila, a música atual (com a posição) e o modo de loop.
+
+        :return: Dicionário serializável em JSON ou None se não houver nada a salvar.
+        """
+        current = self.current_song if self.current_song and self.current_song.get('type') != 'radio' else None
+        if current is None and not self.music_queue:
+            return None
+        return {
+            "current": serialize_song(current) if current else None,
+            "position": self.get_playback_position() or 0,
+            "queue": [serialize_song(song) for song in self.music_queue],
+            "loop_mode": self.loop_mode,
+        }
+
+    def restore_state(self, state):
+        """
+        Restaura uma fila salva antes de um reinício. A música que estava tocando volta
+        para o início da fila e será retomada na posição em que parou; nenhuma
+        extração é feita até que as músicas sejam de fato tocadas.
+        """
+        self.music_queue.reset(state.get("queue", []))
+        current = state.get("current")
+        if current:
+            current = dict(current)
+            current['resume_at'] = max(0, (state.get("position") or 0) - 2)
+            self.music_queue.appendleft(current)
+        self.loop_mode = state.get("loop_mode", "none")
+        logger.info(f"{Fore.CYAN}[SNAPSHOT]{Style.RESET_ALL} Fila restaurada para o servidor {self.guild_id}: {len(self.music_queue)} músicas.")
+
+    def get_session_owner_id(self):
+        """
+        Retorna o ID do usuário que adicionou a música atual (dono da sessão), se houver.
+        """
+        if self.current_song:
+            return self.current_song.get('added_by')
+        return None
 
     async def insert_music(self, ctx, query, ydl_opts, added_by_id):
         """
         Insere uma música na fila com base em uma consulta.
         """
         try:
-            with YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(query, download=False)
-                if "entries" in info:  # Verifica se é uma playlist
-                    info = info["entries"][0]  # Apenas pega a primeira entrada
+            track = await track_cache.lookup(query)
+            if track is None:
+                info = await extractor.extract(query, ydl_opts)
+                if info and "entries" in info:  # Verifica se é uma playlist
+                    info = info["entries"][0] if info["entries"] else None  # Apenas pega a primeira entrada
+                if not info:
+                    raise youtube_dl.DownloadError(f"Nenhum resultado encontrado para: {query}")
+                track = await track_cache.store(query, info)
+
+            song = {
+                "title": track.get("title") or "Título Desconhecido",
+                "url": track.get("webpage_url"),
+                "stream_url": track.get("stream_url"),
+                "stream_expires_at": track.get("stream_expires_at"),
+                "thumbnail": track.get("thumbnail"),
+                "uploader": track.get("uploader") or "Uploader Desconhecido",
+                "added_by": added_by_id,
+                "duration": track.get("duration") or 0,
+            }
 
-                song = {
-                    "title": info.get("title", "Título Desconhecido"),
-                    "url": info.get("url"),
-                    "uploader": info.get("uploader", "Uploader Desconhecido"),
-                    "added_by": added_by_id,
-                    "duration": info.get("duration", 0),
-                }
+            # Adiciona a música à fila
+            self.add_to_queue(song, added_by_id)
 
-                # Adiciona a música à fila
-                self.add_to_queue(song, added_by_id)
+            # Feedback ao usuário
+            await ctx.send(embed=embed_queue_song_added(song, ctx.author.voice.channel, added_by=added_by_id))
 
-                # Feedback ao usuário
-                await ctx.send(embed=embed_queue_song_added(song, ctx.author.voice.channel, added_by=added_by_id))
+            # Log para depuração
+            logger.info(f"{Fore.GREEN}[MUSIC]{Style.RESET_ALL} Música adicionada à fila: {song['title']} por {ctx.author.name}.")
 
-                # Log para depuração
-                logger.info(f"{Fore.GREEN}[MUSIC]{Style.RESET_ALL} Música adicionada à fila: {song['title']} por {ctx.author.name}.")
+        except asyncio.TimeoutError:
+            logger.error(f"{Fore.RED}[ERROR]{Style.RESET_ALL} Tempo esgotado ao buscar a música: {query}")
+            await ctx.send(embed=embed_error("Tempo esgotado ao buscar a música. Tente novamente."))
 
         except youtube_dl.DownloadError as e:
             logger.error(f"{Fore.RED}[ERROR]{Style.RESET_ALL} Erro ao processar o download da música: {e}")
@@ -90,6 +206,39 @@ class MusicManager:
         song['added_by'] = added_by_id
         self.music_queue.append(song)  # Usa `self.music_queue` consistentemente
         logger.info(f"{Fore.BLUE}[QUEUE]{Style.RESET_ALL} Música adicionada à fila: {song.get('title', 'Desconhecido')} por {added_by_id}.")
+        if len(self.music_queue) <= PREFETCH_DEPTH:
+            self.schedule_prefetch()
+
+    def extend_queue(self, songs, added_by_id):
+        """
+        Adiciona um lote de músicas à fila de uma só vez, com um único registro no log.
+        """
+        songs = list(songs)
+        for song in songs:
+            song['added_by'] = added_by_id
+        self.music_queue.extend(songs)
+        logger.info(f"{Fore.BLUE}[QUEUE]{Style.RESET_ALL} {len(songs)} músicas adicionadas à fila por {added_by_id}.")
+        if songs and len(self.music_queue) - len(songs) < PREFETCH_DEPTH:
+            self.schedule_prefetch()
+
+    def start_ingestion(self, coro):
+        """
+        Executa em segundo plano a importação de uma playlist, registrando a tarefa
+        para que ela possa ser cancelada pelo comando de parar.
+        """
+        task = asyncio.create_task(coro)
+        self.ingest_tasks.add(task)
+        task.add_done_callback(self.ingest_tasks.discard)
+        return task
+
+    def cancel_ingestion(self):
+        """
+        Cancela as importações de playlists em andamento.
+        """
+        for task in list(self.ingest_tasks):
+            task.cancel()
+        if self.ingest_tasks:
+            logger.info(f"{Fore.YELLOW}[PLAYLIST]{Style.RESET_ALL} {len(self.ingest_tasks)} importação(ões) de playlist cancelada(s).")
 
     async def play_radio(self, radio_name, stream_url, added_by):
         """
@@ -108,11 +257,8 @@ class MusicManager:
                 "type": "radio"  # Identificador para diferenciar músicas e rádios
             }
 
-            # Configura e inicia a reprodução
-            source = discord.PCMVolumeTransformer(
-                discord.FFmpegPCMAudio(stream_url, options="-vn"),
-                volume=self.volume
-            )
+            # Inscreve o player no stream compartilhado da rádio (um único ffmpeg para todos os ouvintes)
+            source = radio_hub.subscribe(stream_url, self.volume)
 
             # Para qualquer música/rádio sendo reproduzida e começa a nova reprodução
             if self.voice_client.is_playing():
@@ -156,11 +302,10 @@ class MusicManager:
                 logger.info(f"{Fore.CYAN}[VOICE]{Style.RESET_ALL} Movido para o canal de voz: {voice_channel.name}")
 
             # Ajustar o volume com base no banco de dados ou padrão
-            user_volume = get_user_volume(ctx.author.id)
+            user_volume = await db.get_user_volume(ctx.author.id)
             self.volume = user_volume if user_volume is not None else 1.0
 
-            if self.voice_client.source and hasattr(self.voice_client.source, "volume"):
-                self.voice_client.source.volume = self.volume
+            apply_volume(self.voice_client, self.volume)
             logger.info(f"{Fore.GREEN}[VOLUME]{Style.RESET_ALL} Volume ajustado para: {self.volume * 100:.1f}%")
 
         except discord.ClientException as e:
@@ -189,6 +334,10 @@ class MusicManager:
         Avança para a próxima música da fila e inicia a reprodução.
         """
         try:
+            # Modo 'all': a música que terminou volta ao final da fila (o histórico é limitado)
+            if self.loop_mode == "all" and self.current_song:
+                self.music_queue.append(self.current_song)
+
             # Salvar a música atual no histórico apenas se o modo não for "single"
             if self.loop_mode != "single":
                 self.save_current_to_history()
@@ -197,17 +346,10 @@ class MusicManager:
             next_song = self.get_next_song()
 
             if not next_song:
-                # Se o modo for "all", re-popula a fila a partir do histórico
-                if self.loop_mode == "all" and self.song_history:
-                    self.music_queue = self.song_history.copy()
-                    self.clear_history()
-                    logger.info("[MUSIC] Modo 'all': Fila re-populada a partir do histórico.")
-                    next_song = self.get_next_song()
-                else:
-                    logger.info("[MUSIC] Fila vazia. Nenhuma música para reproduzir.")
-                    self.current_song = None
-                    await ctx.send(embed=embed_queue_empty())
-                    return
+                logger.info("[MUSIC] Fila vazia. Nenhuma música para reproduzir.")
+                self.current_song = None
+                await ctx.send(embed=embed_queue_empty())
+                return
 
             # Verificar conexão ao canal de voz
             if not self.voice_client or not self.voice_client.is_connected():
@@ -216,7 +358,7 @@ class MusicManager:
                     self.voice_client = await ctx.author.voice.channel.connect()
 
                     # Aplicar o volume do banco de dados
-                    user_volume = get_user_volume(ctx.author.id)
+                    user_volume = await db.get_user_volume(ctx.author.id)
                     self.volume = user_volume if user_volume is not None else 1.0
 
                 except discord.ClientException as e:
@@ -227,20 +369,14 @@ class MusicManager:
                         return
 
             # Garantir que o volume está atualizado antes de reproduzir
-            user_volume = get_user_volume(ctx.author.id)
+            user_volume = await db.get_user_volume(ctx.author.id)
             if user_volume is not None:
                 self.volume = user_volume
 
-            # Resolver URL e iniciar a reprodução
-            self.resolve_stream_url(next_song)
+            # Preparar o áudio (cache local ou stream) e iniciar a reprodução
+            source = await self.prepare_source(next_song)
             self.set_current_song(next_song)
 
-            # Configurar e tocar a próxima música
-            source = discord.PCMVolumeTransformer(
-                discord.FFmpegPCMAudio(next_song['stream_url'], **FFMPEG_OPTIONS),
-                volume=self.volume
-            )
-
             def after_playing(error):
                 if error:
                     logger.error(f"[ERROR] Erro durante a reprodução: {error}")
@@ -250,6 +386,7 @@ class MusicManager:
                 self.voice_client.stop()
 
             self.voice_client.play(source, after=after_playing)
+            self.schedule_prefetch()
 
             # Informar sobre a música atual
             voice_channel = self.voice_client.channel if self.voice_client else ctx.author.voice.channel
@@ -262,7 +399,7 @@ class MusicManager:
                     async def add_clone():
                         await asyncio.sleep(duration - 2)  # Aguarde até 2 segundos antes do final
                         if self.loop_mode == "single" and self.current_song == next_song:
-                            self.music_queue.insert(0, self.current_song.copy())
+                            self.music_queue.appendleft(self.current_song.copy())
                             logger.info(f"[MUSIC] Modo 'single': Clone da música '{self.current_song.get('title', 'Desconhecido')}' re-adicionado à fila.")
                     asyncio.create_task(add_clone())
 
@@ -282,8 +419,14 @@ class MusicManager:
             self.current_song = None
 
     def get_total_duration(self):
-        """Calcula a duração total das músicas na fila."""
-        return sum(song.get('duration', 0) or 0 for song in self.music_queue)
+        """Retorna a duração total das músicas na fila (mantida pela própria fila)."""
+        return self.music_queue.total_duration
+
+    def clear_queue(self):
+        """Remove todas as músicas da fila e interrompe as importações de playlists."""
+        self.cancel_ingestion()
+        self.music_queue.clear()
+        logger.info("[QUEUE] Fila de músicas limpa.")
 
     async def stop_music(self, ctx):
         """Para a música atual e limpa a fila."""
@@ -300,8 +443,7 @@ class MusicManager:
         """Ajusta o volume da reprodução atual."""
         if 0.0 <= volume <= 1.0:
             self.volume = volume
-            if self.voice_client and self.voice_client.source:
-                self.voice_client.source.volume = self.volume
+            apply_volume(self.voice_client, self.volume)
             logger.info(f"[VOLUME] Volume ajustado para: {volume * 100}%")
         else:
             logger.warning("[VOLUME] Volume fora do intervalo permitido.")
@@ -328,15 +470,13 @@ class MusicManager:
         if mode == "none":
             # Remover todos os clones da música atual
             if self.music_queue and self.current_song:
-                self.music_queue = [
-                    song for song in self.music_queue if song != self.current_song
-                ]
+                self.music_queue.remove_matching(self.current_song)
                 logger.info("[LOOP] Modo 'none': Clones removidos da fila.")
 
         elif mode == "single" and self.current_song:
             # Adicionar clone da música atual na fila como próximo
-            if not self.music_queue or self.music_queue[0] != self.current_song:
-                self.music_queue.insert(0, self.current_song)
+            if self.music_queue.peek() != self.current_song:
+                self.music_queue.appendleft(self.current_song)
                 logger.info(f"[LOOP] Modo 'single': Clone da música '{self.current_song.get('title', 'Desconhecido')}' adicionado à fila.")
 
     def get_loop_mode(self):
@@ -350,12 +490,13 @@ class MusicManager:
         Embaralha a fila de músicas, mantendo a música atual no topo se ela existir.
         """
         if self.music_queue:
-            random.shuffle(self.music_queue)
+            self.music_queue.shuffle()
             logger.info("[QUEUE] Fila de músicas embaralhada com sucesso.")
 
     async def fetch_lyrics(self, ctx):
         """
-        Busca e exibe as letras da música atual usando Playwright assíncrono.
+        Busca e exibe as letras da música atual: primeiro no armazenamento local,
+        depois nos provedores de letras (API do Vagalume e, como reserva, o navegador).
         """
         if not self.current_song:
             await ctx.send(embed=embed_error("Nenhuma música está tocando no momento."))
@@ -365,36 +506,33 @@ class MusicManager:
         title = self.filter_title(original_title)
         logger.info(f"[LYRICS] Buscando letras para: {title}")
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-
-            try:
-                base_url = "https://www.letras.mus.br/"
-                formatted_title = quote(title)
-                search_url = f"{base_url}?q={formatted_title}#gsc.tab=0&gsc.q={formatted_title}"
-
-                logger.info(f"[LYRICS] Acessando URL: {search_url}")
-                await page.goto(search_url, timeout=60000)
-
-                await page.wait_for_selector('a.gs-title[data-ctorig]', timeout=15000)
-                result = page.locator('a.gs-title[data-ctorig]')
-                lyrics_url = await result.first.get_attribute('data-ctorig')
-
-                await page.goto(lyrics_url, timeout=60000)
-                await page.wait_for_selector("div.lyric-original", timeout=15000)
+        cached = await lyrics_store.get(title)
+        if cached is not None:
+            logger.info(f"[LYRICS] Letra obtida do armazenamento local para: {title}")
+            if cached["found"]:
+                await ctx.send(embed=embed_lyrics(cached["title"], cached["artist"], cached["lyrics"]))
+            else:
+                await ctx.send(embed=embed_error(f"Nenhuma letra encontrada para **{title}**."))
+            return
 
-                title_element = await page.locator("h1.textStyle-primary").inner_text()
-                artist_element = await page.locator("h2.textStyle-secondary").inner_text()
-                lyrics = await page.locator("div.lyric-original").inner_text()
+        try:
+            result, definitive = await lyrics_service.lookup(title)
+        except Exception as e:
+            logger.error(f"[ERROR] Erro ao buscar letras: {e}")
+            await ctx.send(embed=embed_error(f"Erro ao buscar letras para **{title}**."))
+            return
 
-                await ctx.send(embed=embed_lyrics(title_element, artist_element, lyrics))
+        if result:
+            await lyrics_store.put(title, result["title"], result["artist"], result["lyrics"], result.get("source_url"))
+            await ctx.send(embed=embed_lyrics(result["title"], result["artist"], result["lyrics"]))
+            return
 
-            except Exception as e:
-                logger.error(f"[ERROR] Erro ao buscar letras: {e}")
-                await ctx.send(embed=embed_error(f"Erro ao buscar letras para **{title}**."))
-            finally:
-                await browser.close()
+        if definitive:
+            # Nenhum provedor encontrou a letra: registra a ausência para não repetir a busca tão cedo
+            await lyrics_store.put_miss(title)
+            await ctx.send(embed=embed_error(f"Nenhuma letra encontrada para **{title}**."))
+        else:
+            await ctx.send(embed=embed_error(f"Erro ao buscar letras para **{title}**."))
 
     def filter_title(self, title):
         """
@@ -425,9 +563,7 @@ class MusicManager:
         """
         if self.loop_mode == "single" and self.current_song:
             return self.current_song  # Repetir a música atual
-        elif self.loop_mode == "all" and self.current_song:
-            self.music_queue.append(self.current_song)  # Adicionar ao final da fila
-        return self.music_queue.pop(0) if self.music_queue else None
+        return self.music_queue.popleft()
 
     def clear_history(self):
         """
@@ -436,27 +572,116 @@ class MusicManager:
         self.song_history.clear()
         logger.info("[HISTORY] Histórico de músicas limpo com sucesso.")
 
+    def get_previous_song(self):
+        """
+        Remove e retorna a música tocada mais recentemente do histórico, ou None.
+        """
+        return self.song_history.pop() if self.song_history else None
+
     def get_history(self):
         """
         Retorna uma cópia do histórico de músicas.
         """
         return list(self.song_history)
     
-    def resolve_stream_url(self, song):
+    async def prepare_source(self, song):
+        """
+        Monta a fonte de áudio de uma música: o arquivo local, se a faixa estiver no
+        cache de áudio, ou o stream remoto, resolvido quando necessário.
+        """
+        start_at = song.pop('resume_at', 0)  # Posição salva antes de um reinício do bot
+        local_path = await audio_cache.lookup(song)
+        if local_path:
+            source = create_source(local_path, self.volume, remote=False, start_at=start_at)
+            logger.info(f"{Fore.GREEN}[AUDIO CACHE]{Style.RESET_ALL} Reproduzindo do cache local: {song.get('title', 'Desconhecido')}")
+        else:
+            await self.resolve_stream_url(song)
+            source = create_source(song['stream_url'], self.volume, start_at=start_at)
+
+        await audio_cache.record_play(song)
+        play_log.record(song, self.guild_id)
+        return source
+
+    def schedule_prefetch(self):
         """
-        Resolve a URL do stream de uma música, se ainda não estiver resolvida.
+        Inicia, em segundo plano, a resolução das próximas músicas da fila,
+        para que a troca de faixa não precise esperar pelo yt-dlp.
         """
-        if 'stream_url' not in song or not song['stream_url']:
+        if PREFETCH_DEPTH <= 0 or not self.music_queue:
+            return
+        if self.prefetch_task and not self.prefetch_task.done():
+            return
+        self.prefetch_task = asyncio.create_task(self._prefetch_upcoming())
+
+    async def _prefetch_upcoming(self):
+        """
+        Resolve as URLs de stream das próximas `PREFETCH_DEPTH` músicas da fila,
+        renovando as que estiverem perto de expirar.
+        """
+        for song in self.music_queue[:PREFETCH_DEPTH]:
+            if song.get('type') == 'radio' or self._has_fresh_stream(song, PREFETCH_REFRESH_MARGIN):
+                continue
             try:
-                ydl_opts = {'format': 'bestaudio/best', 'quiet': True, 'extract_flat': False}
-                with YoutubeDL(ydl_opts) as ydl:
-                    info = ydl.extract_info(song['url'], download=False)
-                    song['stream_url'] = info.get('url')
-                    song['thumbnail'] = info.get('thumbnail', song.get('thumbnail'))
-                    logger.info(f"[STREAM] URL de stream resolvida para: {song['title']}")
+                await self.resolve_stream_url(song, margin=PREFETCH_REFRESH_MARGIN)
+                logger.info(f"{Fore.CYAN}[PREFETCH]{Style.RESET_ALL} Próxima música pré-resolvida: {song.get('title', 'Desconhecido')}")
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                logger.error(f"[ERROR] Erro ao resolver URL do stream: {e}")
-                raise RuntimeError("Não foi possível reproduzir esta música.")
+                # A resolução será tentada novamente quando a música for tocar
+                logger.warning(f"{Fore.YELLOW}[PREFETCH]{Style.RESET_ALL} Falha ao pré-resolver '{song.get('title', 'Desconhecido')}': {e}")
+
+    @staticmethod
+    def _has_fresh_stream(song, margin=0):
+        """
+        Verifica se a música tem uma URL de stream válida por pelo menos `margin` segundos.
+        """
+        if not song.get('stream_url'):
+            return False
+        expires_at = song.get('stream_expires_at')
+        return not expires_at or expires_at - margin > time.time()
+
+    async def resolve_stream_url(self, song, margin=0):
+        """
+        Resolve a URL do stream de uma música, se ainda não estiver resolvida ou se já tiver expirado.
+        Chamadas simultâneas para a mesma música (reprodução e pré-resolução) compartilham uma única extração.
+
+        :param song: Música a ser resolvida.
+        :param margin: Segundos de validade que a URL ainda precisa ter para ser reaproveitada.
+        """
+        if self._has_fresh_stream(song, margin):
+            return
+
+        key = id(song)
+        task = self.pending_resolves.get(key)
+        if task is None:
+            task = asyncio.create_task(self._resolve_stream_url(song, margin))
+            self.pending_resolves[key] = task
+            task.add_done_callback(lambda _: self.pending_resolves.pop(key, None))
+        await asyncio.shield(task)
+
+    async def _resolve_stream_url(self, song, margin):
+        """
+        Consulta o cache de faixas e, se necessário, o yt-dlp para obter a URL de stream.
+        """
+        track = await track_cache.lookup(song['url'])
+        if track and track.get('stream_url') and track['stream_expires_at'] - margin > time.time():
+            song['stream_url'] = track['stream_url']
+            song['stream_expires_at'] = track['stream_expires_at']
+            song['thumbnail'] = song.get('thumbnail') or track.get('thumbnail')
+            logger.info(f"[STREAM] URL de stream obtida do cache para: {song['title']}")
+            return
+
+        try:
+            ydl_opts = {'format': 'bestaudio/best', 'quiet': True, 'extract_flat': False}
+            info = await extractor.extract(song['url'], ydl_opts)
+            track = await track_cache.store(song['url'], info)
+            song['stream_url'] = track['stream_url']
+            song['stream_expires_at'] = track['stream_expires_at']
+            song['thumbnail'] = info.get('thumbnail', song.get('thumbnail'))
+            logger.info(f"[STREAM] URL de stream resolvida para: {song['title']}")
+        except Exception as e:
+            logger.error(f"[ERROR] Erro ao resolver URL do stream: {e}")
+            raise RuntimeError("Não foi possível reproduzir esta música.")
 
 
 
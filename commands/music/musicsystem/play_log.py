@@ -0,0 +1,128 @@
+import asyncio
+import logging
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+from colorama import Fore, Style
+
+from commands.music.musicsystem.track_cache import normalize_key
+from utils.async_database import db
+from utils.database import pool
+
+logger = logging.getLogger(__name__)
+
+PLAY_LOG_FLUSH_INTERVAL = int(os.getenv("PLAY_LOG_FLUSH_INTERVAL", "30"))  # Segundos entre gravações em lote
+PLAY_LOG_BATCH_SIZE = 100  # Reproduções acumuladas que forçam uma gravação imediata
+
+
+class PlayLogWriter:
+    """
+    Registro persistente (somente inserção) de todas as músicas tocadas.
+
+    As reproduções são acumuladas em memória e gravadas na tabela 'play_log' em
+    lotes, a cada `flush_interval` segundos ou quando o lote enche, de forma que
+    tocar uma música não custa uma escrita no banco.
+    """
+
+    def __init__(self, flush_interval: int = PLAY_LOG_FLUSH_INTERVAL, batch_size: int = PLAY_LOG_BATCH_SIZE):
+        """
+        :param flush_interval: Segundos entre as gravações periódicas.
+        :param batch_size: Tamanho do lote que dispara uma gravação antecipada.
+        """
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._pending: List[Tuple] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._schema_ready = False
+
+    def _ensure_schema(self) -> None:
+        if self._schema_ready:
+            return
+        with pool.writer() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS play_log (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    track_key TEXT NOT NULL,
+                    title TEXT,
+                    guild_id INTEGER,
+                    user_id INTEGER,
+                    played_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_play_log_guild_time ON play_log (guild_id, played_at)")
+        self._schema_ready = True
+
+    def record(self, song: Dict, guild_id: Optional[int]) -> None:
+        """
+        Registra uma reprodução (apenas em memória até a próxima gravação).
+        """
+        if not song.get("url") or song.get("type") == "radio":
+            return
+        try:
+            user_id = int(song.get("added_by")) if song.get("added_by") is not None else None
+        except (TypeError, ValueError):
+            user_id = None
+        self._pending.append((normalize_key(song["url"]), song.get("title"), guild_id, user_id, time.time()))
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+        if len(self._pending) >= self.batch_size:
+            asyncio.create_task(self.flush())
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+            if not self._pending:
+                return  # Recomeça na próxima reprodução
+
+    async def flush(self) -> int:
+        """
+        Grava no banco as reproduções acumuladas.
+
+        :return: Quantidade de registros gravados.
+        """
+        if not self._pending:
+            return 0
+        batch, self._pending = self._pending, []
+        try:
+            await db.run(self._ensure_schema)
+            await db.execute_many(
+                "INSERT INTO play_log (track_key, title, guild_id, user_id, played_at) VALUES (?, ?, ?, ?, ?)",
+                batch,
+                log=False,
+            )
+        except Exception as e:
+            self._pending = batch + self._pending  # Tenta novamente na próxima gravação
+            logger.error(f"{Fore.RED}[PLAY LOG]{Style.RESET_ALL} Erro ao gravar o histórico de reproduções: {e}")
+            return 0
+        logger.debug(f"[PLAY LOG] {len(batch)} reproduções gravadas.")
+        return len(batch)
+
+    async def top_tracks(self, guild_id: int, limit: int = 10, since: Optional[float] = None) -> List[Tuple]:
+        """
+        Retorna as músicas mais tocadas de um servidor.
+
+        :param since: Timestamp a partir do qual as reproduções são consideradas.
+        :return: Lista de tuplas (título, quantidade de reproduções).
+        """
+        await self.flush()
+        await db.run(self._ensure_schema)
+        return await db.fetchall(
+            "SELECT title, COUNT(*) AS plays FROM play_log WHERE guild_id = ? AND played_at >= ? "
+            "GROUP BY track_key ORDER BY plays DESC LIMIT ?",
+            (guild_id, since or 0, limit),
+        )
+
+    async def close(self) -> None:
+        """
+        Grava as reproduções pendentes (usado no desligamento do bot).
+        """
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+        await self.flush()
+
+
+# Instância compartilhada por todos os players
+play_log = PlayLogWriter()
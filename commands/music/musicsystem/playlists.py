@@ -1,12 +1,18 @@
 from utils.database import get_emoji_from_table, get_fun_emoji, get_music_emoji, get_error_emoji, get_number_emoji, get_clan_management_emoji, get_server_staff_emoji
 import asyncio
-from yt_dlp import YoutubeDL
+from commands.music.musicsystem.extractor import extractor
 from asyncio.log import logger
-from commands.music.musicsystem.embeds import embed_playlist_added, embed_error, embed_now_playing
-from utils.database import get_user_volume, set_user_volume
+from commands.music.musicsystem.embeds import embed_playlist_added, embed_playlist_progress, embed_error, embed_now_playing
+from utils.async_database import db
 import discord
+import threading
+import time
 from colorama import Fore, Style
 
+PLAYLIST_PAGE_SIZE = 50  # Músicas adicionadas à fila por lote durante a importação
+PLAYLIST_PROGRESS_INTERVAL = 3.0  # Intervalo mínimo em segundos entre edições do embed de progresso
+PLAYLIST_BUFFERED_PAGES = 4  # Lotes lidos antecipadamente do yt-dlp antes de aguardar a fila
+
 
 async def process_playlist(ctx, playlist_url, music_manager, ydl_opts, from_db=False, db_links=None, send_embed=True, added_by_id=None):
     """
@@ -24,14 +30,13 @@ async def process_playlist(ctx, playlist_url, music_manager, ydl_opts, from_db=F
             entries = [{'url': link} for link in db_links]
         else:
             # Processar playlist externa
-            with YoutubeDL({**ydl_opts, 'extract_flat': True}) as ydl:
-                info = ydl.extract_info(playlist_url, download=False)
-                if not info or 'entries' not in info:
-                    raise ValueError(f"Nenhuma música válida encontrada na playlist: {playlist_url}")
-                entries = info.get('entries', [])
-                playlist_title = info.get('title', 'Playlist sem título')
-                playlist_uploader = info.get('uploader', 'Uploader desconhecido')
-                playlist_thumbnail = info.get('thumbnail', None)
+            info = await extractor.extract(playlist_url, {**ydl_opts, 'extract_flat': True})
+            if not info or 'entries' not in info:
+                raise ValueError(f"Nenhuma música válida encontrada na playlist: {playlist_url}")
+            entries = info.get('entries', [])
+            playlist_title = info.get('title', 'Playlist sem título')
+            playlist_uploader = info.get('uploader', 'Uploader desconhecido')
+            playlist_thumbnail = info.get('thumbnail', None)
 
         if not entries:
             raise ValueError("Nenhuma entrada válida encontrada na playlist.")
@@ -49,10 +54,10 @@ async def process_playlist(ctx, playlist_url, music_manager, ydl_opts, from_db=F
                 return
 
         # Ajustar o volume do usuário após conectar ao canal
-        user_volume = get_user_volume(ctx.author.id)
+        user_volume = await db.get_user_volume(ctx.author.id)
         if user_volume is None:
             user_volume = 1.0  # Volume padrão
-            set_user_volume(ctx.author.id, user_volume)
+            await db.set_user_volume(ctx.author.id, user_volume)
         music_manager.volume = user_volume
         logger.info(f"{Fore.GREEN}[VOLUME]{Style.RESET_ALL} Volume inicial ajustado para {music_manager.volume * 100:.1f}%")
 
@@ -91,6 +96,158 @@ async def process_playlist(ctx, playlist_url, music_manager, ydl_opts, from_db=F
             await ctx.send(embed=embed_error("playlist_processing_error", str(e)))
 
 
+def _song_from_entry(entry, ctx, playlist_thumbnail=None):
+    """
+    Converte uma entrada "flat" de playlist do yt-dlp em um dicionário de música.
+    """
+    url = entry.get('webpage_url') or entry.get('url')
+    if url and entry.get('ie_key') == 'Youtube' and not url.startswith('http'):
+        url = f"https://www.youtube.com/watch?v={url}"
+    return {
+        'title': entry.get('title') or 'Título desconhecido',
+        'url': url,
+        'duration': entry.get('duration') or 0,
+        'uploader': entry.get('uploader') or entry.get('channel') or 'Uploader desconhecido',
+        'thumbnail': entry.get('thumbnail', playlist_thumbnail),
+        'channel': ctx.author.voice.channel.name if ctx.author.voice else None,
+    }
+
+
+def _iter_entries(entries):
+    """
+    Itera sobre as entradas de uma playlist do yt-dlp, seja uma lista, um gerador
+    ou uma lista paginada (que só busca cada página quando ela é lida).
+    """
+    if hasattr(entries, 'getslice'):
+        start = 0
+        while True:
+            page = entries.getslice(start, start + PLAYLIST_PAGE_SIZE)
+            if not page:
+                return
+            yield from page
+            start += len(page)
+    else:
+        yield from entries
+
+
+def _drain_entries(entries, pages, loop, cancelled):
+    """
+    Lê as entradas da playlist (bloqueante, fora do event loop) e as entrega em lotes.
+
+    O primeiro lote tem uma única música para que a reprodução comece o quanto antes.
+    A fila de lotes é limitada; quando está cheia, a leitura aguarda, e é abandonada
+    assim que `cancelled` for sinalizado.
+
+    :return: A exceção que interrompeu a leitura, ou None se a playlist foi lida até o fim.
+    """
+    def deliver(item):
+        future = asyncio.run_coroutine_threadsafe(pages.put(item), loop)
+        while not cancelled.is_set():
+            try:
+                future.result(timeout=1)
+                return True
+            except TimeoutError:
+                continue
+        future.cancel()
+        return False
+
+    page, page_size = [], 1
+    try:
+        for entry in _iter_entries(entries):
+            if cancelled.is_set():
+                return
+            if not entry or not (entry.get('url') or entry.get('webpage_url')):
+                continue
+            page.append(entry)
+            if len(page) >= page_size:
+                if not deliver(page):
+                    return
+                page, page_size = [], PLAYLIST_PAGE_SIZE
+        if page:
+            deliver(page)
+    except Exception as e:
+        logger.error(f"{Fore.RED}[PLAYLIST]{Style.RESET_ALL} Erro ao ler as entradas da playlist: {e}")
+        return e
+    finally:
+        deliver(None)  # Sinaliza o fim da leitura
+
+
+async def stream_playlist(ctx, playlist_url, music_manager, ydl_opts, added_by_id=None):
+    """
+    Importa uma playlist de forma incremental.
+
+    A reprodução começa logo após a primeira música; as demais são adicionadas à
+    fila em lotes enquanto o yt-dlp percorre a playlist, e o progresso é exibido
+    em um único embed que vai sendo editado. A importação é interrompida se a
+    tarefa for cancelada (por exemplo, pelo comando de parar).
+    """
+    added_by_id = added_by_id or ctx.author.id
+    try:
+        info = await extractor.extract(playlist_url, {**ydl_opts, 'extract_flat': 'in_playlist'}, process=False)
+    except Exception as e:
+        logger.error(f"{Fore.RED}[ERROR]{Style.RESET_ALL} Erro ao processar playlist: {e}")
+        await ctx.send(embed=embed_error("playlist_processing_error", str(e)))
+        return
+    if not info or info.get('entries') is None:
+        await ctx.send(embed=embed_error("playlist_processing_error", f"Nenhuma música válida encontrada na playlist: {playlist_url}"))
+        return
+
+    playlist_title = info.get('title', 'Playlist sem título')
+    playlist_uploader = info.get('uploader', 'Uploader desconhecido')
+    playlist_thumbnail = info.get('thumbnail')
+    expected = info.get('playlist_count')
+    added, total_duration, status = 0, 0, "loading"
+
+    def progress_embed():
+        return embed_playlist_progress(playlist_title, playlist_uploader, added, expected, total_duration, playlist_thumbnail, ctx.author, status)
+
+    message = await ctx.send(embed=progress_embed())
+    last_edit = time.monotonic()
+
+    loop = asyncio.get_running_loop()
+    pages = asyncio.Queue(maxsize=PLAYLIST_BUFFERED_PAGES)
+    cancelled = threading.Event()
+    reader = loop.run_in_executor(None, _drain_entries, info['entries'], pages, loop, cancelled)
+
+    try:
+        while (page := await pages.get()) is not None:
+            songs = [_song_from_entry(entry, ctx, playlist_thumbnail) for entry in page]
+            music_manager.extend_queue(songs, added_by_id)
+            added += len(songs)
+            total_duration += sum(song['duration'] for song in songs)
+
+            # Começa a tocar assim que a primeira música estiver na fila
+            voice_client = music_manager.voice_client
+            if voice_client and not voice_client.is_playing() and not voice_client.is_paused() and music_manager.current_song is None:
+                await music_manager.play_next(ctx)
+
+            if time.monotonic() - last_edit >= PLAYLIST_PROGRESS_INTERVAL:
+                await message.edit(embed=progress_embed())
+                last_edit = time.monotonic()
+
+        error = await reader
+        if error is None:
+            status = "done"
+            logger.info(f"{Fore.MAGENTA}[PLAYLIST]{Style.RESET_ALL} {added} músicas adicionadas da playlist '{playlist_title}' por {ctx.author.name}.")
+        else:
+            # A leitura falhou no meio: informa quantas músicas chegaram à fila
+            status = "partial" if added else "failed"
+            logger.warning(f"{Fore.YELLOW}[PLAYLIST]{Style.RESET_ALL} Importação da playlist '{playlist_title}' interrompida após {added} músicas: {error}")
+    except asyncio.CancelledError:
+        status = "cancelled"
+        logger.info(f"{Fore.YELLOW}[PLAYLIST]{Style.RESET_ALL} Importação da playlist '{playlist_title}' cancelada após {added} músicas.")
+        raise
+    except Exception as e:
+        status = "partial" if added else "failed"
+        logger.error(f"{Fore.RED}[ERROR]{Style.RESET_ALL} Erro durante a importação da playlist '{playlist_title}': {e}")
+    finally:
+        cancelled.set()
+        try:
+            await asyncio.shield(message.edit(embed=progress_embed()))
+        except (discord.HTTPException, asyncio.CancelledError):
+            pass
+
+
 async def play_song(ctx, music_manager, ydl_opts):
     """
     Faz o download e reproduz a música atual da fila.
@@ -111,22 +268,13 @@ async def play_song(ctx, music_manager, ydl_opts):
                 logger.info(f"{Fore.YELLOW}[MUSIC]{Style.RESET_ALL} Bot desconectado por inatividade.")
             return
 
-        # Resolve a URL da música, se necessário
-        if not current_song.get('stream_url'):
-            with YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(current_song['url'], download=False)
-                current_song['stream_url'] = info.get('url')
-
         # Garantir que o volume está atualizado antes de tocar a música
-        user_volume = get_user_volume(ctx.author.id)
+        user_volume = await db.get_user_volume(ctx.author.id)
         if user_volume is not None:
             music_manager.volume = user_volume
 
-        # Configura o áudio e inicia a reprodução
-        source = discord.PCMVolumeTransformer(
-            discord.FFmpegPCMAudio(current_song['stream_url'], before_options='-reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5', options='-vn'),
-            volume=music_manager.volume
-        )
+        # Configura o áudio (cache local ou stream) e inicia a reprodução
+        source = await music_manager.prepare_source(current_song)
 
         def after_playing(error):
             if error:
@@ -134,6 +282,7 @@ async def play_song(ctx, music_manager, ydl_opts):
             ctx.bot.loop.create_task(play_song(ctx, music_manager, ydl_opts))
 
         music_manager.voice_client.play(source, after=after_playing)
+        music_manager.schedule_prefetch()
 
         # Log e feedback no bot
         logger.info(f"{Fore.BLUE}[NOW PLAYING]{Style.RESET_ALL} Reproduzindo agora: {current_song['title']} por {ctx.author.name}")
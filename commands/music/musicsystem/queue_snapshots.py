@@ -0,0 +1,87 @@
+import json
+import logging
+import time
+from typing import Dict, Iterable, List, Tuple
+
+from utils.database import pool
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAX_AGE = 24 * 3600  # Snapshots mais antigos que isso são descartados na inicialização
+
+# Campos de cada música preservados no snapshot (metadados já resolvidos, sem nova extração)
+SONG_FIELDS = ("title", "url", "uploader", "duration", "thumbnail", "added_by", "channel", "stream_url", "stream_expires_at")
+
+
+def serialize_song(song: Dict) -> Dict:
+    """
+    Reduz uma música aos campos necessários para restaurá-la.
+    """
+    return {field: song[field] for field in SONG_FIELDS if song.get(field) is not None}
+
+
+class QueueSnapshotStore:
+    """
+    Persistência das filas de música na tabela 'queue_snapshots' (uma linha por servidor).
+    Todos os métodos são bloqueantes e devem ser chamados via `db.run`.
+    """
+
+    def __init__(self, max_age: int = SNAPSHOT_MAX_AGE):
+        self.max_age = max_age
+        self._schema_ready = False
+
+    def _ensure_schema(self) -> None:
+        if self._schema_ready:
+            return
+        with pool.writer() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS queue_snapshots (
+                    guild_id INTEGER PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+        self._schema_ready = True
+
+    def load_all(self) -> Dict[int, Dict]:
+        """
+        Carrega todos os snapshots recentes, descartando os expirados.
+
+        :return: Dicionário guild_id -> estado salvo.
+        """
+        self._ensure_schema()
+        cutoff = time.time() - self.max_age
+        with pool.writer() as conn:
+            conn.execute("DELETE FROM queue_snapshots WHERE updated_at < ?", (cutoff,))
+            rows = conn.execute("SELECT guild_id, payload FROM queue_snapshots").fetchall()
+
+        snapshots = {}
+        for guild_id, payload in rows:
+            try:
+                snapshots[guild_id] = json.loads(payload)
+            except ValueError:
+                logger.warning(f"[SNAPSHOT] Snapshot inválido ignorado para o servidor {guild_id}.")
+        return snapshots
+
+    def save(self, states: Iterable[Tuple[int, Dict]], deleted: Iterable[int] = ()) -> None:
+        """
+        Grava os estados alterados e remove os snapshots dos servidores sem fila, em uma única transação.
+        """
+        self._ensure_schema()
+        now = time.time()
+        rows: List[Tuple] = [
+            (guild_id, json.dumps(state, ensure_ascii=False), now) for guild_id, state in states
+        ]
+        with pool.writer() as conn:
+            if rows:
+                conn.executemany("""
+                    INSERT INTO queue_snapshots (guild_id, payload, updated_at) VALUES (?, ?, ?)
+                    ON CONFLICT(guild_id) DO UPDATE SET payload = excluded.payload, updated_at = excluded.updated_at
+                """, rows)
+            deleted = [(guild_id,) for guild_id in deleted]
+            if deleted:
+                conn.executemany("DELETE FROM queue_snapshots WHERE guild_id = ?", deleted)
+
+
+# Instância compartilhada pelo registro de players
+snapshot_store = QueueSnapshotStore()
@@ -0,0 +1,195 @@
+import logging
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional, Set, Tuple
+
+import discord
+from colorama import Fore, Style
+
+from commands.music.musicsystem.ffmpeg_options import FFMPEG_OPTIONS
+
+logger = logging.getLogger(__name__)
+
+OPUS_SILENCE = b"\xf8\xff\xfe"  # Pacote Opus de silêncio, enviado quando o stream atrasa
+FRAME_DURATION = 0.02  # Cada pacote de áudio cobre 20 ms
+SUBSCRIBER_BUFFER = 50  # Pacotes (1 s) guardados por ouvinte; os mais antigos são descartados
+RECONNECT_ATTEMPTS = 3  # Tentativas de reabrir o stream quando ele cai
+VOLUME_STEP = 0.05  # Volumes são arredondados para que ouvintes próximos compartilhem o mesmo stream
+
+
+class RadioSubscriber(discord.AudioSource):
+    """
+    Fonte de áudio de um ouvinte: lê os pacotes Opus distribuídos pelo stream compartilhado.
+    """
+
+    def __init__(self, stream: "RadioStream"):
+        self.stream = stream
+        self.location = stream.url
+        self.volume_level = stream.volume
+        self._frames: deque = deque(maxlen=SUBSCRIBER_BUFFER)
+
+    def push(self, frame: bytes) -> None:
+        self._frames.append(frame)
+
+    def read(self) -> bytes:
+        try:
+            return self._frames.popleft()
+        except IndexError:
+            # Stream encerrado: retorna vazio para o player terminar; caso contrário, silêncio
+            return b"" if self.stream.closed else OPUS_SILENCE
+
+    def is_opus(self) -> bool:
+        return True
+
+    def with_volume(self, volume: float) -> "RadioSubscriber":
+        """
+        Passa a ouvir a mesma rádio com outro volume (outro stream compartilhado).
+        """
+        return self.stream.hub.subscribe(self.location, volume)
+
+    def cleanup(self) -> None:
+        self.stream.hub.unsubscribe(self)
+
+
+class RadioStream:
+    """
+    Um único ffmpeg para uma rádio (em um nível de volume), cujos pacotes Opus são
+    copiados para todos os ouvintes inscritos por uma thread dedicada.
+    """
+
+    def __init__(self, hub: "RadioHub", url: str, volume: float):
+        self.hub = hub
+        self.url = url
+        self.volume = volume
+        self.subscribers: Set[RadioSubscriber] = set()
+        self.closed = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._pump, name=f"radio-{url}", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _open(self) -> discord.FFmpegOpusAudio:
+        return discord.FFmpegOpusAudio(
+            self.url,
+            before_options=FFMPEG_OPTIONS['before_options'],
+            options=f"-vn -filter:a volume={self.volume:.2f}",
+        )
+
+    def _pump(self) -> None:
+        """
+        Lê o stream no ritmo de reprodução (um pacote a cada 20 ms) e distribui os pacotes.
+        """
+        source = None
+        failures = 0
+        try:
+            source = self._open()
+            next_tick = time.perf_counter()
+            while not self._stop.is_set():
+                frame = source.read()
+                if not frame:
+                    failures += 1
+                    source.cleanup()
+                    source = None
+                    if failures > RECONNECT_ATTEMPTS:
+                        logger.warning(f"{Fore.YELLOW}[RADIO HUB]{Style.RESET_ALL} Stream encerrado: {self.url}")
+                        break
+                    logger.warning(f"{Fore.YELLOW}[RADIO HUB]{Style.RESET_ALL} Stream caiu, reabrindo ({failures}/{RECONNECT_ATTEMPTS}): {self.url}")
+                    time.sleep(failures)
+                    source = self._open()
+                    next_tick = time.perf_counter()
+                    continue
+                failures = 0
+
+                for subscriber in tuple(self.subscribers):
+                    subscriber.push(frame)
+
+                next_tick += FRAME_DURATION
+                delay = next_tick - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    next_tick = time.perf_counter()  # Atrasado: não tenta compensar em rajada
+        except Exception as e:
+            logger.error(f"{Fore.RED}[RADIO HUB]{Style.RESET_ALL} Erro no stream {self.url}: {e}")
+        finally:
+            self.closed = True
+            if source is not None:
+                source.cleanup()
+            self.hub._discard(self)
+
+
+class RadioHub:
+    """
+    Distribui cada rádio a partir de um único ffmpeg, independente de quantos
+    servidores ou canais estejam ouvindo. O stream é aberto na primeira inscrição
+    e encerrado quando o último ouvinte sai.
+    """
+
+    def __init__(self):
+        self._streams: Dict[Tuple[str, float], RadioStream] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(url: str, volume: float) -> Tuple[str, float]:
+        return url, round(round(volume / VOLUME_STEP) * VOLUME_STEP, 2)
+
+    def subscribe(self, url: str, volume: float = 1.0) -> RadioSubscriber:
+        """
+        Inscreve um novo ouvinte na rádio, abrindo o stream se necessário.
+
+        :return: Fonte de áudio a ser passada para `VoiceClient.play`.
+        """
+        key = self._key(url, volume)
+        with self._lock:
+            stream = self._streams.get(key)
+            is_new = stream is None or stream.closed
+            if is_new:
+                stream = RadioStream(self, url, key[1])
+                self._streams[key] = stream
+            subscriber = RadioSubscriber(stream)
+            stream.subscribers.add(subscriber)
+            if is_new:
+                stream.start()  # Só inicia com o primeiro ouvinte inscrito, para não perder pacotes
+                logger.info(f"{Fore.MAGENTA}[RADIO HUB]{Style.RESET_ALL} Stream aberto: {url} (volume {key[1] * 100:.0f}%).")
+        return subscriber
+
+    def unsubscribe(self, subscriber: RadioSubscriber) -> None:
+        """
+        Remove um ouvinte; o stream é encerrado quando não restar nenhum.
+        """
+        stream = subscriber.stream
+        with self._lock:
+            stream.subscribers.discard(subscriber)
+            if not stream.subscribers:
+                stream.stop()
+                if self._streams.get((stream.url, stream.volume)) is stream:
+                    del self._streams[(stream.url, stream.volume)]
+                logger.info(f"{Fore.MAGENTA}[RADIO HUB]{Style.RESET_ALL} Último ouvinte saiu, stream encerrado: {stream.url}")
+
+    def _discard(self, stream: RadioStream) -> None:
+        with self._lock:
+            if self._streams.get((stream.url, stream.volume)) is stream:
+                del self._streams[(stream.url, stream.volume)]
+
+    def listeners(self, url: Optional[str] = None) -> int:
+        """
+        Quantidade de ouvintes inscritos (em uma rádio específica ou no total).
+        """
+        with self._lock:
+            return sum(len(s.subscribers) for (stream_url, _), s in self._streams.items() if url is None or stream_url == url)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "streams": len(self._streams),
+                "listeners": sum(len(stream.subscribers) for stream in self._streams.values()),
+            }
+
+
+# Instância compartilhada por todos os servidores
+radio_hub = RadioHub()
@@ -0,0 +1,155 @@
+import asyncio
+import logging
+import os
+import re
+import time
+from typing import Dict, Iterable, List, Optional
+
+import aiohttp
+from colorama import Fore, Style
+
+logger = logging.getLogger(__name__)
+
+RADIO_PROBE_INTERVAL = int(os.getenv("RADIO_PROBE_INTERVAL", "120"))  # Segundos entre as verificações
+RADIO_PROBE_TIMEOUT = float(os.getenv("RADIO_PROBE_TIMEOUT", "6"))  # Tempo máximo de cada verificação
+RADIO_PROBE_CONCURRENCY = 8  # Rádios verificadas ao mesmo tempo
+ICY_MAX_METAINT = 65536  # Não lê mais que isso do stream só para obter o título
+
+STREAM_TITLE_RE = re.compile(rb"StreamTitle='(.*?)';", re.S)
+
+
+class RadioProber:
+    """
+    Verifica periodicamente, em paralelo, se os streams das rádios estão no ar.
+
+    Para cada rádio são guardados a disponibilidade, a latência até a resposta do
+    servidor e o título ICY que está tocando, de forma que o menu de rádios seja
+    montado direto do cache, sem esperar pela rede.
+    """
+
+    def __init__(self, interval: int = RADIO_PROBE_INTERVAL, timeout: float = RADIO_PROBE_TIMEOUT):
+        """
+        :param interval: Segundos entre as rodadas de verificação.
+        :param timeout: Tempo máximo de cada verificação, em segundos.
+        """
+        self.interval = interval
+        self.timeout = timeout
+        self._urls: List[str] = []
+        self._status: Dict[str, Dict] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._task: Optional[asyncio.Task] = None
+        self._semaphore = asyncio.Semaphore(RADIO_PROBE_CONCURRENCY)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
+        return self._session
+
+    def start(self, urls: Iterable[str]) -> None:
+        """
+        Inicia as verificações periódicas dos streams informados.
+        """
+        self._urls = list(dict.fromkeys(urls))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._probe_loop())
+
+    async def _probe_loop(self) -> None:
+        while True:
+            try:
+                await self.probe_all()
+            except Exception as e:
+                logger.error(f"{Fore.RED}[RADIO PROBE]{Style.RESET_ALL} Erro ao verificar as rádios: {e}")
+            await asyncio.sleep(self.interval)
+
+    async def probe_all(self) -> None:
+        """
+        Verifica todas as rádios em paralelo e atualiza o cache.
+        """
+        started = time.perf_counter()
+        await asyncio.gather(*(self.probe(url) for url in self._urls))
+        online = sum(1 for url in self._urls if self._status.get(url, {}).get("online"))
+        logger.debug(f"[RADIO PROBE] {online}/{len(self._urls)} rádios no ar ({time.perf_counter() - started:.1f}s).")
+
+    async def probe(self, url: str) -> Dict:
+        """
+        Verifica uma rádio e atualiza seu status no cache.
+
+        :return: Dicionário com 'online', 'latency' (ms), 'title' e 'checked_at'.
+        """
+        async with self._semaphore:
+            started = time.perf_counter()
+            status = {"online": False, "latency": None, "title": None, "checked_at": time.time()}
+            try:
+                async with self._get_session().get(url, headers={"Icy-MetaData": "1"}) as response:
+                    status["latency"] = int((time.perf_counter() - started) * 1000)
+                    status["online"] = response.status == 200
+                    if status["online"]:
+                        status["title"] = await self._read_icy_title(response)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.debug(f"[RADIO PROBE] {url} fora do ar: {e!r}")
+            except Exception as e:
+                logger.warning(f"{Fore.YELLOW}[RADIO PROBE]{Style.RESET_ALL} Erro ao verificar {url}: {e}")
+
+        previous = self._status.get(url)
+        if previous and previous["online"] != status["online"]:
+            state = "voltou ao ar" if status["online"] else "saiu do ar"
+            logger.info(f"{Fore.MAGENTA}[RADIO PROBE]{Style.RESET_ALL} {url} {state}.")
+        self._status[url] = status
+        return status
+
+    @staticmethod
+    async def _read_icy_title(response: aiohttp.ClientResponse) -> Optional[str]:
+        """
+        Lê o primeiro bloco de metadados ICY do stream e extrai o título em reprodução.
+        """
+        try:
+            metaint = int(response.headers.get("icy-metaint", 0))
+        except ValueError:
+            return None
+        if not 0 < metaint <= ICY_MAX_METAINT:
+            return None
+
+        await response.content.readexactly(metaint)  # Áudio que antecede os metadados
+        length = (await response.content.readexactly(1))[0] * 16
+        if not length:
+            return None
+        match = STREAM_TITLE_RE.search(await response.content.readexactly(length))
+        if not match or not match.group(1).strip():
+            return None
+        raw = match.group(1).strip()
+        try:
+            return raw.decode("utf-8")
+        except UnicodeDecodeError:
+            return raw.decode("latin-1")
+
+    def status(self, url: str) -> Optional[Dict]:
+        """
+        Retorna o último status conhecido de uma rádio (None se ainda não verificada).
+        """
+        return self._status.get(url)
+
+    def statuses(self) -> Dict[str, Dict]:
+        return dict(self._status)
+
+    async def ensure_online(self, url: str) -> bool:
+        """
+        Confirma se uma rádio está no ar antes de tocá-la. Rádios marcadas como fora
+        do ar são verificadas novamente, pois podem ter voltado desde a última rodada.
+        """
+        status = self._status.get(url)
+        if status is None or not status["online"]:
+            status = await self.probe(url)
+        return status["online"]
+
+    async def close(self) -> None:
+        """
+        Interrompe as verificações e fecha a sessão HTTP.
+        """
+        if self._task is not None:
+            self._task.cancel()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+
+# Instância compartilhada pelo comando de rádios
+radio_prober = RadioProber()
@@ -0,0 +1,238 @@
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+from colorama import Fore, Style
+
+from utils.async_database import db
+from utils.database import pool
+
+logger = logging.getLogger(__name__)
+
+TRACK_CACHE_SIZE = int(os.getenv("TRACK_CACHE_SIZE", "1024"))  # Faixas mantidas na memória
+STREAM_URL_MARGIN = 300  # Segundos de folga antes da expiração da URL de stream
+STREAM_URL_DEFAULT_TTL = 3600  # TTL usado quando a URL não informa o parâmetro 'expire'
+
+METADATA_FIELDS = ("title", "uploader", "duration", "thumbnail", "webpage_url")
+
+_YOUTUBE_HOSTS = {"youtube.com", "www.youtube.com", "m.youtube.com", "music.youtube.com", "youtu.be"}
+
+
+def normalize_key(query: str) -> str:
+    """
+    Normaliza uma URL ou termo de busca para uso como chave do cache.
+
+    Links do YouTube em qualquer formato (youtu.be, watch?v=, music.youtube) viram
+    'youtube:<id>'; termos de busca são reduzidos a minúsculas com espaços únicos.
+    """
+    query = (query or "").strip()
+    parsed = urlparse(query)
+    if parsed.scheme in ("http", "https") and parsed.netloc:
+        host = parsed.netloc.lower()
+        if host in _YOUTUBE_HOSTS:
+            if host == "youtu.be":
+                video_id = parsed.path.lstrip("/")
+            else:
+                video_id = parse_qs(parsed.query).get("v", [""])[0]
+            if video_id:
+                return f"youtube:{video_id}"
+        return f"{host}{parsed.path}?{parsed.query}" if parsed.query else f"{host}{parsed.path}"
+    return "search:" + re.sub(r"\s+", " ", query.lower())
+
+
+def stream_url_expiry(stream_url: str, now: Optional[float] = None) -> float:
+    """
+    Calcula até quando uma URL de stream pode ser usada.
+
+    As URLs do googlevideo trazem o timestamp de expiração no parâmetro 'expire'
+    (na query string ou no caminho, como '/expire/<ts>/'); as demais recebem o TTL padrão.
+    """
+    now = now if now is not None else time.time()
+    parsed = urlparse(stream_url)
+    expire = parse_qs(parsed.query).get("expire", [None])[0]
+    if expire is None:
+        match = re.search(r"/expire/(\d+)", parsed.path)
+        expire = match.group(1) if match else None
+    try:
+        return float(expire) - STREAM_URL_MARGIN
+    except (TypeError, ValueError):
+        return now + STREAM_URL_DEFAULT_TTL
+
+
+class TrackCache:
+    """
+    Cache de metadados das faixas resolvidas pelo yt-dlp, em dois níveis.
+
+    O primeiro nível é um LRU em memória; o segundo é a tabela 'track_cache' do
+    banco de dados, que sobrevive a reinicializações. Título, uploader, duração e
+    thumbnail são guardados indefinidamente, enquanto a URL de stream só é servida
+    até a expiração indicada pelo próprio googlevideo.
+    """
+
+    def __init__(self, capacity: int = TRACK_CACHE_SIZE):
+        """
+        Inicializa o cache.
+
+        :param capacity: Quantidade máxima de faixas mantidas na memória.
+        """
+        self.capacity = capacity
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._schema_ready = False
+        self.hits = 0
+        self.misses = 0
+
+    def _ensure_schema(self) -> None:
+        """
+        Cria a tabela 'track_cache' caso ainda não exista.
+        """
+        if self._schema_ready:
+            return
+        with pool.writer() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS track_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    title TEXT,
+                    uploader TEXT,
+                    duration INTEGER,
+                    thumbnail TEXT,
+                    webpage_url TEXT,
+                    stream_url TEXT,
+                    stream_expires_at REAL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+        self._schema_ready = True
+
+    def _remember(self, key: str, entry: Dict) -> None:
+        """
+        Guarda uma entrada no LRU em memória, descartando a menos usada se necessário.
+        """
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def _load(self, key: str) -> Optional[Dict]:
+        """
+        Lê uma entrada do banco de dados (bloqueante).
+        """
+        self._ensure_schema()
+        with pool.reader() as conn:
+            row = conn.execute(
+                "SELECT title, uploader, duration, thumbnail, webpage_url, stream_url, stream_expires_at "
+                "FROM track_cache WHERE cache_key = ?",
+                (key,),
+            ).fetchone()
+        if not row:
+            return None
+        entry = dict(zip(METADATA_FIELDS, row[:5]))
+        entry["stream_url"], entry["stream_expires_at"] = row[5], row[6] or 0
+        return entry
+
+    def _save(self, keys, entry: Dict) -> None:
+        """
+        Grava (upsert) uma entrada no banco de dados sob uma ou mais chaves (bloqueante).
+        """
+        self._ensure_schema()
+        now = time.time()
+        rows = [
+            (key, *(entry.get(field) for field in METADATA_FIELDS), entry.get("stream_url"), entry.get("stream_expires_at"), now)
+            for key in keys
+        ]
+        with pool.writer() as conn:
+            conn.executemany("""
+                INSERT INTO track_cache (cache_key, title, uploader, duration, thumbnail, webpage_url, stream_url, stream_expires_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(cache_key) DO UPDATE SET
+                    title = excluded.title,
+                    uploader = excluded.uploader,
+                    duration = excluded.duration,
+                    thumbnail = excluded.thumbnail,
+                    webpage_url = excluded.webpage_url,
+                    stream_url = excluded.stream_url,
+                    stream_expires_at = excluded.stream_expires_at,
+                    updated_at = excluded.updated_at
+            """, rows)
+
+    async def lookup(self, query: str) -> Optional[Dict]:
+        """
+        Busca uma faixa no cache (memória e, em seguida, banco de dados).
+
+        A entrada retornada sempre contém os metadados; 'stream_url' só vem
+        preenchida se ainda estiver dentro do prazo de validade.
+
+        :param query: URL ou termo de busca usado para a extração.
+        :return: Dicionário com os dados da faixa ou None em caso de miss.
+        """
+        key = normalize_key(query)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is None:
+            try:
+                entry = await db.run(self._load, key)
+            except Exception as e:
+                logger.error(f"{Fore.RED}[TRACK CACHE]{Style.RESET_ALL} Erro ao consultar o cache de faixas: {e}")
+                entry = None
+            if entry is not None:
+                self._remember(key, entry)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        track = dict(entry)
+        if not track.get("stream_url") or (track.get("stream_expires_at") or 0) <= time.time():
+            track["stream_url"] = None
+        return track
+
+    async def store(self, query: str, info: Dict) -> Dict:
+        """
+        Guarda no cache o resultado de uma extração do yt-dlp.
+
+        A faixa fica registrada tanto pela consulta original quanto pela URL da
+        página, para que buscas e links diretos compartilhem a mesma entrada.
+
+        :param query: URL ou termo de busca usado para a extração.
+        :param info: Dicionário retornado pelo yt-dlp para uma única faixa.
+        :return: A entrada armazenada.
+        """
+        stream_url = info.get("url")
+        entry = {
+            "title": info.get("title"),
+            "uploader": info.get("uploader"),
+            "duration": info.get("duration") or 0,
+            "thumbnail": info.get("thumbnail"),
+            "webpage_url": info.get("webpage_url") or info.get("original_url") or query,
+            "stream_url": stream_url,
+            "stream_expires_at": stream_url_expiry(stream_url) if stream_url else 0,
+        }
+
+        keys = {normalize_key(query), normalize_key(entry["webpage_url"])}
+        for key in keys:
+            self._remember(key, entry)
+        try:
+            await db.run(self._save, keys, entry)
+        except Exception as e:
+            logger.error(f"{Fore.RED}[TRACK CACHE]{Style.RESET_ALL} Erro ao gravar o cache de faixas: {e}")
+        return dict(entry)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Retorna os contadores de acertos e falhas do cache.
+        """
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
+# Instância compartilhada por todos os players
+track_cache = TrackCache()
@@ -1,6 +1,7 @@
 from utils.database import get_emoji_from_table, get_fun_emoji, get_music_emoji, get_error_emoji, get_number_emoji, get_clan_management_emoji, get_server_staff_emoji
 import discord
 from discord.ext import commands
+from commands.music.musicsystem.music_registry import MusicManagerRegistry
 from commands.music.musicsystem.embeds import embed_now_playing, embed_error
 import logging
 
@@ -11,9 +12,9 @@ class NowCommand(commands.Cog):
     Comando para exibir informações sobre a música atualmente tocando.
     """
 
-    def __init__(self, bot, music_manager):
+    def __init__(self, bot, music_managers: MusicManagerRegistry):
         self.bot = bot
-        self.music_manager = music_manager
+        self.music_managers = music_managers
 
     @commands.command(name="now", aliases=["agora", "tocandoagora"])
     async def now(self, ctx):
@@ -22,15 +23,17 @@ class NowCommand(commands.Cog):
 
         :param ctx: Contexto do comando.
         """
+        music_manager = self.music_managers.get(ctx.guild)
+
         # Verifica se há uma música sendo tocada
-        if not self.music_manager.current_song:
+        if not music_manager.current_song:
             await ctx.send(embed=embed_error(
                 "Não há nenhuma música tocando no momento."
             ))
             return
 
         # Verifica se o usuário está no mesmo canal de voz que o bot
-        if not ctx.author.voice or ctx.author.voice.channel != self.music_manager.voice_client.channel:
+        if not ctx.author.voice or ctx.author.voice.channel != music_manager.voice_client.channel:
             await ctx.send(embed=embed_error(
                 "Você precisa estar no mesmo canal de voz do bot para usar este comando."
             ))
@@ -38,10 +41,10 @@ class NowCommand(commands.Cog):
 
         try:
             # Informações da música atual
-            song = self.music_manager.current_song
+            song = music_manager.current_song
 
             # Enviar embed com as informações da música atual
-            embed = embed_now_playing(song, self.music_manager.voice_client.channel)
+            embed = embed_now_playing(song, music_manager.voice_client.channel)
             await ctx.send(embed=embed)
             logger.info(f"Informações da música atual enviadas: {song.get('title', 'Título Desconhecido')}")
 
@@ -52,11 +55,11 @@ class NowCommand(commands.Cog):
             ))
 
 
-async def setup(bot, music_manager):
+async def setup(bot, music_managers: MusicManagerRegistry):
     """
     Adiciona o cog ao bot.
 
     :param bot: O bot do Discord.
-    :param music_manager: O gerenciador de música compartilhado.
+    :param music_managers: O registro de gerenciadores de música por servidor.
     """
-    await bot.add_cog(NowCommand(bot, music_manager))
\ No newline at end of file
+    await bot.add_cog(NowCommand(bot, music_managers))
\ No newline at end of file
@@ -3,7 +3,7 @@ import discord
 from discord.ext import commands
 from commands.music.musicsystem.embeds import embed_dj_error, embed_error, embed_music_paused, embed_permission_denied
 import logging
-from commands.music.musicsystem.music_system import MusicManager
+from commands.music.musicsystem.music_registry import MusicManagerRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -12,15 +12,15 @@ class PauseCommand(commands.Cog):
     Comando para pausar a reprodução de música.
     """
 
-    def __init__(self, bot, music_manager: MusicManager):
+    def __init__(self, bot, music_managers: MusicManagerRegistry):
         """
         Inicializa o comando de pausa.
 
         :param bot: O bot do Discord.
-        :param music_manager: Instância de MusicManager.
+        :param music_managers: Registro de MusicManager por servidor.
         """
         self.bot = bot
-        self.music_manager = music_manager
+        self.music_managers = music_managers
 
     @commands.command(name="pause", aliases=["pausar"])
     async def pause(self, ctx):
@@ -29,7 +29,9 @@ class PauseCommand(commands.Cog):
 
         :param ctx: Contexto do comando.
         """
-        voice_client = self.music_manager.voice_client
+        music_manager = self.music_managers.get(ctx.guild)
+
+        voice_client = music_manager.voice_client
 
         # Verifica se o bot está conectado a um canal de voz
         if voice_client is None or not voice_client.is_connected():
@@ -47,8 +49,8 @@ class PauseCommand(commands.Cog):
             return
 
         # Verifica se o usuário iniciou a sessão ou tem a tag de DJ
-        tag_dj_id = self.music_manager.dj_role_id
-        if not (ctx.author.id == int(self.music_manager.current_song.get('added_by')) or 
+        tag_dj_id = music_manager.dj_role_id
+        if not (ctx.author.id == int(music_manager.current_song.get('added_by')) or 
                 discord.utils.get(ctx.author.roles, id=int(tag_dj_id))):
             await ctx.send(embed=embed_dj_error())
             return
@@ -59,7 +61,7 @@ class PauseCommand(commands.Cog):
 
             # Verifica se o estado do player mudou para pausado
             if not voice_client.is_playing():
-                current_song = self.music_manager.current_song
+                current_song = music_manager.current_song
                 await ctx.send(embed=embed_music_paused(current_song))
                 logger.info(f"Música pausada com sucesso: {current_song.get('title', 'Desconhecida')}")
 
@@ -68,11 +70,11 @@ class PauseCommand(commands.Cog):
             await ctx.send(embed=embed_error("pause_error", str(e)))
 
 
-async def setup(bot, music_manager: MusicManager):
+async def setup(bot, music_managers: MusicManagerRegistry):
     """
     Adiciona o comando de pausa ao bot.
 
     :param bot: O bot do Discord.
-    :param music_manager: O gerenciador de música compartilhado.
+    :param music_managers: O registro de gerenciadores de música por servidor.
     """
-    await bot.add_cog(PauseCommand(bot, music_manager))
+    await bot.add_cog(PauseCommand(bot, music_managers))
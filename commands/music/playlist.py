@@ -2,6 +2,7 @@ from utils.database import get_emoji_from_table, get_fun_emoji, get_music_emoji,
 import asyncio
 import logging
 from discord.ext import commands
+from commands.music.musicsystem.music_registry import MusicManagerRegistry
 from commands.music.musicsystem.embeds import (
     embed_playlist_menu,
     embed_error,
@@ -10,16 +11,16 @@ from commands.music.musicsystem.embeds import (
     embed_playlist_loaded,
     embed_all_playlists_deleted
 )
-from utils.database import fetchall, fetchone, execute_query
+from utils.async_database import db
 from colorama import Fore, Style
 
 logger = logging.getLogger(__name__)
 
 
 class PlaylistCommand(commands.Cog):
-    def __init__(self, bot, music_manager):
+    def __init__(self, bot, music_managers: MusicManagerRegistry):
         self.bot = bot
-        self.music_manager = music_manager
+        self.music_managers = music_managers
         self.voice_channel = None
 
     @commands.command(name="playlist", aliases=["pl"])
@@ -53,7 +54,9 @@ class PlaylistCommand(commands.Cog):
         """
         Salva a playlist atual na base de dados.
         """
-        if not self.music_manager.music_queue:
+        music_manager = self.music_managers.get(ctx.guild)
+
+        if not music_manager.music_queue:
             await ctx.send(embed=embed_error("no_songs_in_queue"))
             return
 
@@ -67,27 +70,29 @@ class PlaylistCommand(commands.Cog):
             playlist_name = msg.content.strip()
 
             # Verifica se uma playlist com o mesmo nome já existe
-            existing = fetchone("SELECT id FROM playlists WHERE userid = ? AND name = ?", (str(ctx.author.id), playlist_name))
+            existing = await db.fetchone("SELECT id FROM playlists WHERE userid = ? AND name = ?", (str(ctx.author.id), playlist_name))
             if existing:
                 await ctx.send(embed=embed_error("Você já tem uma playlist com esse nome."))
                 return
 
             # Insere a playlist na tabela playlists
-            total_duration = self.music_manager.get_total_duration()
-            execute_query(
+            total_duration = music_manager.get_total_duration()
+            await db.execute_query(
                 "INSERT INTO playlists (userid, name, duration) VALUES (?, ?, ?)",
                 (str(ctx.author.id), playlist_name, total_duration)
             )
-            playlist_id = fetchone("SELECT id FROM playlists WHERE userid = ? AND name = ?", (str(ctx.author.id), playlist_name))[0]
+            playlist_id = (await db.fetchone("SELECT id FROM playlists WHERE userid = ? AND name = ?", (str(ctx.author.id), playlist_name)))[0]
 
-            # Insere as músicas da fila na tabela playlist_songs
-            for song in self.music_manager.music_queue:
-                execute_query(
-                    "INSERT INTO playlist_songs (playlist_id, title, url, duration, uploader, thumbnail) VALUES (?, ?, ?, ?, ?, ?)",
+            # Insere as músicas da fila na tabela playlist_songs em uma única transação
+            await db.execute_many(
+                "INSERT INTO playlist_songs (playlist_id, title, url, duration, uploader, thumbnail) VALUES (?, ?, ?, ?, ?, ?)",
+                [
                     (playlist_id, song['title'], song['url'], song['duration'], song['uploader'], song['thumbnail'])
-                )
+                    for song in music_manager.music_queue
+                ]
+            )
 
-            logger.info(f"{Fore.GREEN}[PLAYLIST]{Style.RESET_ALL} Playlist '{playlist_name}' salva por {ctx.author.name} com {len(self.music_manager.music_queue)} músicas.")
+            logger.info(f"{Fore.GREEN}[PLAYLIST]{Style.RESET_ALL} Playlist '{playlist_name}' salva por {ctx.author.name} com {len(music_manager.music_queue)} músicas.")
             await ctx.send(embed=embed_playlist_saved(playlist_name, total_duration, ctx.author))
         except asyncio.TimeoutError:
             await ctx.send(embed=embed_error("timeout"))
@@ -99,7 +104,9 @@ class PlaylistCommand(commands.Cog):
         """
         Carrega uma playlist do banco de dados.
         """
-        playlists = fetchall("SELECT id, name, duration FROM playlists WHERE userid = ?", (str(ctx.author.id),))
+        music_manager = self.music_managers.get(ctx.guild)
+
+        playlists = await db.fetchall("SELECT id, name, duration FROM playlists WHERE userid = ?", (str(ctx.author.id),))
         if not playlists:
             await ctx.send(embed=embed_error("no_playlists"))
             return
@@ -121,13 +128,13 @@ class PlaylistCommand(commands.Cog):
             playlist_data = playlists[playlist_number - 1]
             playlist_id, playlist_name, playlist_duration = playlist_data
 
-            songs = fetchall("SELECT title, url, duration, uploader, thumbnail FROM playlist_songs WHERE playlist_id = ?", (playlist_id,))
+            songs = await db.fetchall("SELECT title, url, duration, uploader, thumbnail FROM playlist_songs WHERE playlist_id = ?", (playlist_id,))
             if not songs:
                 await ctx.send(embed=embed_error("empty_playlist", playlist_name))
                 return
 
             for song in songs:
-                self.music_manager.add_to_queue({
+                music_manager.add_to_queue({
                     'title': song[0],
                     'url': song[1],
                     'duration': song[2],
@@ -141,16 +148,16 @@ class PlaylistCommand(commands.Cog):
             await ctx.send(embed=embed_playlist_loaded(playlist_name, len(songs), playlist_duration, ctx.author, banner_url=banner_url))
 
             # Garantir que o bot esteja conectado ao canal de voz
-            if not self.music_manager.voice_client or not self.music_manager.voice_client.is_connected():
+            if not music_manager.voice_client or not music_manager.voice_client.is_connected():
                 if ctx.author.voice:
-                    self.music_manager.voice_client = await ctx.author.voice.channel.connect()
+                    music_manager.voice_client = await ctx.author.voice.channel.connect()
                 else:
                     await ctx.send(embed=embed_error("not_in_voice_channel"))
                     return
 
             # Toca a próxima música se o bot não estiver reproduzindo nada
-            if not self.music_manager.voice_client.is_playing():
-                await self.music_manager.play_next(ctx)
+            if not music_manager.voice_client.is_playing():
+                await music_manager.play_next(ctx)
 
         except asyncio.TimeoutError:
             await ctx.send(embed=embed_error("timeout"))
@@ -162,20 +169,20 @@ class PlaylistCommand(commands.Cog):
         """
         Remove todas as playlists do usuário.
         """
-        playlists = fetchall("SELECT id FROM playlists WHERE userid = ?", (str(ctx.author.id),))
+        playlists = await db.fetchall("SELECT id FROM playlists WHERE userid = ?", (str(ctx.author.id),))
         if not playlists:
             await ctx.send(embed=embed_error("no_playlists"))
             return
 
-        execute_query("DELETE FROM playlists WHERE userid = ?", (str(ctx.author.id),))
-        execute_query("DELETE FROM playlist_songs WHERE playlist_id IN (SELECT id FROM playlists WHERE userid = ?)", (str(ctx.author.id),))
+        await db.execute_query("DELETE FROM playlists WHERE userid = ?", (str(ctx.author.id),))
+        await db.execute_query("DELETE FROM playlist_songs WHERE playlist_id IN (SELECT id FROM playlists WHERE userid = ?)", (str(ctx.author.id),))
 
         logger.info(f"{Fore.YELLOW}[PLAYLIST]{Style.RESET_ALL} Todas as playlists de {ctx.author.name} foram removidas.")
         await ctx.send(embed=embed_all_playlists_deleted())
 
 
-async def setup(bot, music_manager):
+async def setup(bot, music_managers: MusicManagerRegistry):
     """
     Adiciona o cog de playlists ao bot.
     """
-    await bot.add_cog(PlaylistCommand(bot, music_manager))
+    await bot.add_cog(PlaylistCommand(bot, music_managers))
@@ -1,11 +1,12 @@
 from utils.database import get_emoji_from_table, get_fun_emoji, get_music_emoji, get_error_emoji, get_number_emoji, get_clan_management_emoji, get_server_staff_emoji
 from asyncio.log import logger
 import os
-import discord
 from discord.ext import commands
 from commands.music.musicsystem.embeds import embed_error, embed_now_playing
-from commands.music.musicsystem.music_system import MusicManager
-from utils.database import get_config, get_user_volume
+from commands.music.musicsystem.music_registry import MusicManagerRegistry
+from commands.music.musicsystem.audio_source import create_source
+from utils.database import get_config
+from utils.async_database import db
 
 class PlayLocalCommand(commands.Cog):
     """
@@ -13,9 +14,9 @@ class PlayLocalCommand(commands.Cog):
     Apenas o DONO pode usar este comando.
     """
 
-    def __init__(self, bot, music_manager: MusicManager):
+    def __init__(self, bot, music_managers: MusicManagerRegistry):
         self.bot = bot
-        self.music_manager = music_manager
+        self.music_managers = music_managers
 
     @commands.command(name="playlocal")
     async def playlocal(self, ctx, *, file_path: str = None):
@@ -23,6 +24,8 @@ class PlayLocalCommand(commands.Cog):
         Toca um arquivo de áudio local.
         Apenas o DONO pode usar este comando.
         """
+        music_manager = self.music_managers.get(ctx.guild)
+
         # Verifica se o usuário é o dono do bot
         owner_id = int(get_config("DONO"))
         if ctx.author.id != owner_id:
@@ -44,18 +47,18 @@ class PlayLocalCommand(commands.Cog):
 
         try:
             # Conecta o bot ao canal de voz do usuário
-            voice_client = await self.music_manager.join_voice_channel(ctx)
+            voice_client = await music_manager.join_voice_channel(ctx)
             if voice_client is None:
                 return
 
             # Define o volume inicial do usuário
-            user_volume = get_user_volume(ctx.author.id)
-            self.music_manager.volume = user_volume if user_volume is not None else 1.0
-            logger.info(f"Volume inicial ajustado para {self.music_manager.volume * 100:.1f}% com base no volume do usuário.")
+            user_volume = await db.get_user_volume(ctx.author.id)
+            music_manager.volume = user_volume if user_volume is not None else 1.0
+            logger.info(f"Volume inicial ajustado para {music_manager.volume * 100:.1f}% com base no volume do usuário.")
 
             # Define o nome da música como o nome do arquivo
             song_name = os.path.basename(file_path)
-            self.music_manager.current_song = {
+            music_manager.current_song = {
                 "title": song_name,
                 "url": None,
                 "added_by": ctx.author.id,
@@ -73,13 +76,10 @@ class PlayLocalCommand(commands.Cog):
                 else:
                     logger.info("Reprodução concluída.")
                 # Atualiza o estado do MusicManager
-                self.music_manager.current_song = None
-                self.music_manager.voice_client.stop()
+                music_manager.current_song = None
+                music_manager.voice_client.stop()
 
-            audio_source = discord.PCMVolumeTransformer(
-                discord.FFmpegPCMAudio(file_path),
-                volume=self.music_manager.volume
-            )
+            audio_source = create_source(file_path, music_manager.volume, remote=False)
             voice_client.play(audio_source, after=lambda e: after_playing(e))
 
             # Envia o embed de "Tocando Agora"
@@ -98,8 +98,8 @@ class PlayLocalCommand(commands.Cog):
             await ctx.send(embed=embed_error("Erro ao tentar reproduzir o arquivo."))
             logger.error(f"Erro ao tentar reproduzir o arquivo: {e}")
 
-async def setup(bot, music_manager):
+async def setup(bot, music_managers: MusicManagerRegistry):
     """
     Adiciona o cog PlayLocalCommand ao bot.
     """
-    await bot.add_cog(PlayLocalCommand(bot, music_manager))
+    await bot.add_cog(PlayLocalCommand(bot, music_managers))
@@ -2,6 +2,7 @@ from utils.database import get_emoji_from_table, get_fun_emoji, get_music_emoji,
 import asyncio
 import discord
 from discord.ext import commands
+from commands.music.musicsystem.music_registry import MusicManagerRegistry
 from commands.music.musicsystem.embeds import embed_queue_page, embed_error, embed_queue_empty, embed_queue_cleared
 import logging
 import math
@@ -13,26 +14,28 @@ class QueueCommand(commands.Cog):
     Comando para exibir e gerenciar a fila de músicas.
     """
 
-    def __init__(self, bot, music_manager):
+    def __init__(self, bot, music_managers: MusicManagerRegistry):
         self.bot = bot
-        self.music_manager = music_manager  # Gerenciador centralizado de músicas
+        self.music_managers = music_managers  # Gerenciador centralizado de músicas
 
     @commands.command(name="queue", aliases=["fila", "lista", "q"])
     async def queue(self, ctx, *args):
         """
         Exibe ou gerencia a fila de músicas. Suporta paginação, limpeza e outras ações.
         """
+        music_manager = self.music_managers.get(ctx.guild)
+
         # Verifica se o autor está no mesmo canal que o bot
-        if not ctx.author.voice or self.music_manager.voice_client is None or ctx.author.voice.channel != self.music_manager.voice_client.channel:
+        if not ctx.author.voice or music_manager.voice_client is None or ctx.author.voice.channel != music_manager.voice_client.channel:
             await ctx.send(embed=embed_error("user_not_in_same_channel"))
             return
 
         # Subcomando: limpar fila
         if args and args[0].lower() in ["limpar", "clear", "clean"]:
-            if self.music_manager.loop_mode == "single":
-                self.music_manager.loop_mode = "none"
+            if music_manager.loop_mode == "single":
+                music_manager.loop_mode = "none"
                 logger.info("Loop desativado devido à limpeza da fila.")
-            self.music_manager.clear_queue()
+            music_manager.clear_queue()
             await ctx.send(embed=embed_queue_cleared())
             return
 
@@ -43,7 +46,7 @@ class QueueCommand(commands.Cog):
             await ctx.send(embed=embed_error("invalid_argument"))
             return
 
-        music_queue = self.music_manager.music_queue
+        music_queue = music_manager.music_queue
 
         if not music_queue:
             await ctx.send(embed=embed_queue_empty())
@@ -122,11 +125,11 @@ def format_duration(seconds):
     return f"{minutes}:{seconds:02d}"
 
 
-async def setup(bot, music_manager):
+async def setup(bot, music_managers: MusicManagerRegistry):
     """
     Adiciona o cog ao bot.
 
     :param bot: O bot do Discord.
-    :param music_manager: O gerenciador de música compartilhado.
+    :param music_managers: O registro de gerenciadores de música por servidor.
     """
-    await bot.add_cog(QueueCommand(bot, music_manager))
+    await bot.add_cog(QueueCommand(bot, music_managers))
@@ -7,8 +7,9 @@ from commands.music.musicsystem.embeds import (
     embed_radio_now_playing,
     embed_radio_stopped
 )
-from commands.music.musicsystem.music_system import MusicManager
-from utils.database import get_user_volume
+from commands.music.musicsystem.music_registry import MusicManagerRegistry
+from commands.music.musicsystem.radio_prober import radio_prober
+from utils.async_database import db
 from colorama import Fore, Style
 import discord
 
@@ -39,9 +40,13 @@ class RadiosCommand(commands.Cog):
     Comando para exibir um menu de rádios e permitir a reprodução.
     """
 
-    def __init__(self, bot, music_manager: MusicManager):
+    def __init__(self, bot, music_managers: MusicManagerRegistry):
         self.bot = bot
-        self.music_manager = music_manager
+        self.music_managers = music_managers
+
+    async def cog_load(self):
+        # Mantém o status das rádios atualizado em segundo plano para o menu abrir sem esperar a rede
+        radio_prober.start(radio["stream"] for radio in RADIOS)
 
     @commands.command(name="radios")
     async def radios(self, ctx):
@@ -49,8 +54,8 @@ class RadiosCommand(commands.Cog):
         Exibe o menu de rádios e permite a seleção.
         """
         try:
-            # Obtém o menu de rádios do embeds.py
-            embed_menu = embed_radio_menu(RADIOS)
+            # Obtém o menu de rádios do embeds.py, com o status em cache de cada rádio
+            embed_menu = embed_radio_menu(RADIOS, radio_prober.statuses())
             await ctx.send(embed=embed_menu)
 
             def check(msg):
@@ -62,7 +67,7 @@ class RadiosCommand(commands.Cog):
             if 1 <= choice <= len(RADIOS):
                 radio = RADIOS[choice - 1]
                 await self.play_radio(ctx, radio)
-            elif choice == 12:
+            elif choice == len(RADIOS) + 1:
                 await self.stop_radio(ctx)
             else:
                 await ctx.send(embed=embed_error("Opção inválida. Por favor, escolha um número válido."))
@@ -75,20 +80,28 @@ class RadiosCommand(commands.Cog):
         """
         Reproduz a rádio selecionada.
         """
+        music_manager = self.music_managers.get(ctx.guild)
+
         try:
+            # Evita esperar o timeout do ffmpeg em uma rádio que está fora do ar
+            if not await radio_prober.ensure_online(radio["stream"]):
+                await ctx.send(embed=embed_error(f"A rádio **{radio['name']}** está fora do ar no momento. Tente outra rádio."))
+                return
+
             # Conecta ao canal de voz
-            await self.music_manager.join_voice_channel(ctx)
+            await music_manager.join_voice_channel(ctx)
 
             # Ajusta o volume
-            user_volume = get_user_volume(ctx.author.id)
-            self.music_manager.volume = user_volume if user_volume is not None else 1.0
-            logger.info(Fore.BLUE + f"Volume ajustado para {self.music_manager.volume * 100:.1f}%" + Style.RESET_ALL)
+            user_volume = await db.get_user_volume(ctx.author.id)
+            music_manager.volume = user_volume if user_volume is not None else 1.0
+            logger.info(Fore.BLUE + f"Volume ajustado para {music_manager.volume * 100:.1f}%" + Style.RESET_ALL)
 
             # Reproduz a rádio usando o MusicManager
-            await self.music_manager.play_radio(radio["name"], radio["stream"], ctx.author.id)
+            await music_manager.play_radio(radio["name"], radio["stream"], ctx.author.id)
 
             # Obtém a embed da rádio do embeds.py
-            embed = embed_radio_now_playing(radio["name"], radio["stream"], radio["banner"], ctx.author)
+            status = radio_prober.status(radio["stream"]) or {}
+            embed = embed_radio_now_playing(radio["name"], radio["stream"], radio["banner"], ctx.author, status.get("title"))
             await ctx.send(embed=embed)
 
         except Exception as e:
@@ -99,9 +112,11 @@ class RadiosCommand(commands.Cog):
         """
         Para a reprodução da rádio.
         """
+        music_manager = self.music_managers.get(ctx.guild)
+
         try:
-            if self.music_manager.current_song and self.music_manager.current_song.get("type") == "radio":
-                self.music_manager.stop_radio()
+            if music_manager.current_song and music_manager.current_song.get("type") == "radio":
+                music_manager.stop_radio()
                 embed = embed_radio_stopped()
                 await ctx.send(embed=embed)
             else:
@@ -111,8 +126,8 @@ class RadiosCommand(commands.Cog):
             await ctx.send(embed=embed_error("Ocorreu um erro ao tentar parar a rádio."))
 
 
-async def setup(bot, music_manager):
+async def setup(bot, music_managers: MusicManagerRegistry):
     """
     Adiciona o cog RadiosCommand ao bot.
     """
-    await bot.add_cog(RadiosCommand(bot, music_manager))
+    await bot.add_cog(RadiosCommand(bot, music_managers))
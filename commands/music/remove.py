@@ -1,6 +1,7 @@
 from utils.database import get_emoji_from_table, get_fun_emoji, get_music_emoji, get_error_emoji, get_number_emoji, get_clan_management_emoji, get_server_staff_emoji
 import discord
 from discord.ext import commands
+from commands.music.musicsystem.music_registry import MusicManagerRegistry
 from commands.music.musicsystem.embeds import (
     embed_dj_error,
     embed_error,
@@ -17,16 +18,18 @@ class RemoveCommand(commands.Cog):
     Comando para remover músicas específicas da fila.
     """
 
-    def __init__(self, bot, music_manager):
+    def __init__(self, bot, music_managers: MusicManagerRegistry):
         self.bot = bot
-        self.music_manager = music_manager
+        self.music_managers = music_managers
 
     @commands.command(name="remove", aliases=["remover", "rm"])
     async def remove(self, ctx, *, url: str = None):
         """
         Remove uma música específica da fila com base no link.
         """
-        if not self.music_manager.music_queue:
+        music_manager = self.music_managers.get(ctx.guild)
+
+        if not music_manager.music_queue:
             await ctx.send(embed=embed_queue_empty())
             return
 
@@ -35,20 +38,17 @@ class RemoveCommand(commands.Cog):
             await ctx.send(embed=embed_remove_usage())
             return
 
-        # Localizar a música na fila pelo URL
-        song_index = next(
-            (i for i, song in enumerate(self.music_manager.music_queue) if song.get("url") == url),
-            None,
-        )
+        # Localizar a música na fila pelo URL (consulta indexada)
+        found = music_manager.music_queue.find_by_url(url)
 
-        if song_index is None:
+        if found is None:
             await ctx.send(embed=embed_error(f"Música com o link '{url}' não encontrada na fila."))
             return
 
-        song_to_remove = self.music_manager.music_queue[song_index]
+        entry_id, song_to_remove = found
 
         # Verifica se o usuário iniciou a sessão ou tem a tag de DJ
-        tag_dj_id = self.music_manager.dj_role_id
+        tag_dj_id = music_manager.dj_role_id
         if not (ctx.author.id == int(song_to_remove.get("added_by")) or
                 discord.utils.get(ctx.author.roles, id=int(tag_dj_id))):
             await ctx.send(embed=embed_dj_error())
@@ -56,7 +56,7 @@ class RemoveCommand(commands.Cog):
 
         try:
             # Remove a música da fila
-            removed_song = self.music_manager.music_queue.pop(song_index)
+            removed_song = music_manager.music_queue.remove(entry_id)
 
             # Log da remoção
             logger.info(f"Usuário {ctx.author.id} removeu a música: {removed_song['title']}")
@@ -69,11 +69,11 @@ class RemoveCommand(commands.Cog):
             await ctx.send(embed=embed_error("Erro ao remover a música.", str(e)))
 
 
-async def setup(bot, music_manager):
+async def setup(bot, music_managers: MusicManagerRegistry):
     """
     Adiciona o cog ao bot.
 
     :param bot: O bot do Discord.
-    :param music_manager: O gerenciador de música compartilhado.
+    :param music_managers: O registro de gerenciadores de música por servidor.
     """
-    await bot.add_cog(RemoveCommand(bot, music_manager))
+    await bot.add_cog(RemoveCommand(bot, music_managers))
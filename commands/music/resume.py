@@ -1,6 +1,7 @@
 from utils.database import get_emoji_from_table, get_fun_emoji, get_music_emoji, get_error_emoji, get_number_emoji, get_clan_management_emoji, get_server_staff_emoji
 import discord
 from discord.ext import commands
+from commands.music.musicsystem.music_registry import MusicManagerRegistry
 from commands.music.musicsystem.embeds import embed_dj_error, embed_error, embed_music_resumed, embed_no_music_paused, embed_permission_denied, embed_user_not_in_same_channel
 import logging
 
@@ -11,9 +12,9 @@ class ResumeCommand(commands.Cog):
     Comando para retomar a reprodução de música pausada.
     """
 
-    def __init__(self, bot, music_manager):
+    def __init__(self, bot, music_managers: MusicManagerRegistry):
         self.bot = bot
-        self.music_manager = music_manager
+        self.music_managers = music_managers
 
     @commands.command(name="resume", aliases=["resumir", "retomar"])
     async def resume(self, ctx):
@@ -22,7 +23,9 @@ class ResumeCommand(commands.Cog):
 
         :param ctx: Contexto do comando.
         """
-        voice_client = self.music_manager.voice_client
+        music_manager = self.music_managers.get(ctx.guild)
+
+        voice_client = music_manager.voice_client
 
         # Verificar conexão com canal de voz
         if voice_client is None or not voice_client.is_connected():
@@ -40,8 +43,8 @@ class ResumeCommand(commands.Cog):
             return
 
         # Verifica se o usuário iniciou a sessão ou tem a tag de DJ
-        tag_dj_id = self.music_manager.dj_role_id
-        if not (ctx.author.id == int(self.music_manager.current_song.get('added_by')) or 
+        tag_dj_id = music_manager.dj_role_id
+        if not (ctx.author.id == int(music_manager.current_song.get('added_by')) or 
                 discord.utils.get(ctx.author.roles, id=int(tag_dj_id))):
             await ctx.send(embed=embed_dj_error())
             return
@@ -49,18 +52,18 @@ class ResumeCommand(commands.Cog):
         try:
             # Retomar a música
             voice_client.resume()
-            self.music_manager.current_song['status'] = 'playing'  # Atualizar o estado da música no MusicManager
+            music_manager.current_song['status'] = 'playing'  # Atualizar o estado da música no MusicManager
             await ctx.send(embed=embed_music_resumed())
             logger.info("Música retomada com sucesso.")
         except Exception as e:
             logger.error(f"Erro ao tentar retomar a música: {e}")
             await ctx.send(embed=embed_error("resume_error", str(e)))
 
-async def setup(bot, music_manager):
+async def setup(bot, music_managers: MusicManagerRegistry):
     """
     Adiciona o cog ao bot.
 
     :param bot: O bot do Discord.
-    :param music_manager: O gerenciador de música compartilhado.
+    :param music_managers: O registro de gerenciadores de música por servidor.
     """
-    await bot.add_cog(ResumeCommand(bot, music_manager))
+    await bot.add_cog(ResumeCommand(bot, music_managers))
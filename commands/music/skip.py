@@ -2,6 +2,7 @@ from utils.database import get_emoji_from_table, get_fun_emoji, get_music_emoji,
 import asyncio
 import discord
 from discord.ext import commands
+from commands.music.musicsystem.music_registry import MusicManagerRegistry
 from commands.music.musicsystem.embeds import (
     embed_dj_error, embed_error, embed_song_skipped, embed_queue_empty
 )
@@ -14,16 +15,18 @@ class SkipCommand(commands.Cog):
     Comando para pular a música atual.
     """
 
-    def __init__(self, bot, music_manager):
+    def __init__(self, bot, music_managers: MusicManagerRegistry):
         self.bot = bot
-        self.music_manager = music_manager  # Gerenciador centralizado de músicas
+        self.music_managers = music_managers  # Gerenciador centralizado de músicas
 
     @commands.command(name="skip", aliases=["pular", "s"])
     async def skip(self, ctx):
         """
         Pula a música atualmente sendo tocada e avança para a próxima na fila.
         """
-        voice_client = self.music_manager.voice_client
+        music_manager = self.music_managers.get(ctx.guild)
+
+        voice_client = music_manager.voice_client
 
         if voice_client is None or not voice_client.is_connected():
             await ctx.send(embed=embed_error("Bot não está conectado a um canal de voz."))
@@ -34,8 +37,8 @@ class SkipCommand(commands.Cog):
             return
 
         # Verifica se o usuário tem permissão para pular
-        tag_dj_id = self.music_manager.dj_role_id
-        if not (ctx.author.id == int(self.music_manager.current_song.get('added_by')) or 
+        tag_dj_id = music_manager.dj_role_id
+        if not (ctx.author.id == int(music_manager.current_song.get('added_by')) or 
                 discord.utils.get(ctx.author.roles, id=int(tag_dj_id))):
             await ctx.send(embed=embed_dj_error())
             return
@@ -45,59 +48,48 @@ class SkipCommand(commands.Cog):
             voice_client.pause()
 
             # Modo 'single': remove o clone adicionado ao topo da fila
-            if self.music_manager.loop_mode == "single":
-                if self.music_manager.music_queue and self.music_manager.music_queue[0] == self.music_manager.current_song:
-                    self.music_manager.music_queue.pop(0)
+            if music_manager.loop_mode == "single":
+                if music_manager.music_queue.peek() == music_manager.current_song:
+                    music_manager.music_queue.popleft()
                     logger.info("Modo 'single': Clone da música atual removido após o comando de skip.")
 
+            # Modo 'all': a música pulada volta ao final da fila
+            if music_manager.loop_mode == "all":
+                music_manager.music_queue.append(music_manager.current_song)
+
             # Pular para a próxima música
-            next_song = self.music_manager.get_next_song()
+            next_song = music_manager.get_next_song()
 
             if next_song:
-                self.music_manager.set_current_song(next_song)  # Atualizar a música atual
-
-                # Resolver `stream_url` caso ainda não esteja resolvido
-                self.music_manager.resolve_stream_url(next_song)
+                music_manager.set_current_song(next_song)  # Atualizar a música atual
 
-                # Configurar e tocar a próxima música
-                source = discord.PCMVolumeTransformer(
-                    discord.FFmpegPCMAudio(next_song['stream_url'], **{
-                        'before_options': '-reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5',
-                        'options': '-vn'
-                    }),
-                    volume=self.music_manager.volume  # Ajustar volume atual
-                )
+                # Configurar e tocar a próxima música (cache local ou stream)
+                source = await music_manager.prepare_source(next_song)
 
                 voice_client.play(source, after=lambda e: asyncio.run_coroutine_threadsafe(
-                    self.music_manager.play_next(ctx), ctx.bot.loop
+                    music_manager.play_next(ctx), ctx.bot.loop
                 ))
+                music_manager.schedule_prefetch()
 
                 # Informar sobre a próxima música
                 await ctx.send(embed=embed_song_skipped(next_song))
             else:
-                # Modo 'all': Reinicia a fila a partir do histórico
-                if self.music_manager.loop_mode == "all" and self.music_manager.song_history:
-                    self.music_manager.music_queue = self.music_manager.song_history.copy()
-                    self.music_manager.clear_history()
-                    logger.info("Modo 'all': Fila reiniciada a partir do histórico.")
-                    await self.music_manager.play_next(ctx)
-                else:
-                    # Fila vazia
-                    if self.music_manager.current_song:
-                        self.music_manager.save_current_to_history()  # Salvar música atual no histórico
-                        self.music_manager.current_song = None
-                    await ctx.send(embed=embed_queue_empty())
+                # Fila vazia
+                if music_manager.current_song:
+                    music_manager.save_current_to_history()  # Salvar música atual no histórico
+                    music_manager.current_song = None
+                await ctx.send(embed=embed_queue_empty())
 
         except Exception as e:
             logger.error(f"Erro ao tentar pular para a próxima música: {e}")
             await ctx.send(embed=embed_error(f"Erro ao pular música: {str(e)}"))
 
 
-async def setup(bot, music_manager):
+async def setup(bot, music_managers: MusicManagerRegistry):
     """
     Adiciona o cog ao bot.
 
     :param bot: O bot do Discord.
-    :param music_manager: O gerenciador de música compartilhado.
+    :param music_managers: O registro de gerenciadores de música por servidor.
     """
-    await bot.add_cog(SkipCommand(bot, music_manager))
+    await bot.add_cog(SkipCommand(bot, music_managers))
@@ -8,7 +8,7 @@ from commands.music.musicsystem.embeds import (
     embed_permission_denied,
     embed_user_not_in_same_channel
 )
-from commands.music.musicsystem.music_system import MusicManager
+from commands.music.musicsystem.music_registry import MusicManagerRegistry
 from discord.ext import commands
 
 logger = logging.getLogger(__name__)
@@ -17,22 +17,24 @@ class StopMusicCommand(commands.Cog):
     """
     Comando para parar a música e limpar a fila.
     """
-    def __init__(self, bot, music_manager: MusicManager):
+    def __init__(self, bot, music_managers: MusicManagerRegistry):
         self.bot = bot
-        self.music_manager = music_manager
+        self.music_managers = music_managers
 
     @commands.command(name='stop', aliases=['parar'])
     async def stop(self, ctx):
         """
         Comando para parar a reprodução de música e limpar a fila.
         """
+        music_manager = self.music_managers.get(ctx.guild)
+
         # Verificar se o bot está tocando alguma música
-        if not self.music_manager.voice_client or not self.music_manager.voice_client.is_playing():
+        if not music_manager.voice_client or not music_manager.voice_client.is_playing():
             await ctx.send(embed=embed_error("Nenhuma música está tocando no momento."))
             return
 
         # Verificar se o usuário está no mesmo canal de voz que o bot
-        if not ctx.author.voice or ctx.author.voice.channel != self.music_manager.voice_client.channel:
+        if not ctx.author.voice or ctx.author.voice.channel != music_manager.voice_client.channel:
             await ctx.send(embed=embed_user_not_in_same_channel())
             return
 
@@ -43,10 +45,10 @@ class StopMusicCommand(commands.Cog):
 
         try:
             # Parar a música, limpar a fila e redefinir o loop
-            self.music_manager.voice_client.stop()
-            self.music_manager.clear_queue()
-            self.music_manager.current_song = None
-            self.music_manager.set_loop_mode("none")  # Desativa o loop
+            music_manager.voice_client.stop()
+            music_manager.clear_queue()
+            music_manager.current_song = None
+            music_manager.set_loop_mode("none")  # Desativa o loop
 
             logger.info(f"Usuário {ctx.author.id} parou a música e limpou a fila.")
             await ctx.send(embed=embed_stop_music())
@@ -60,15 +62,17 @@ class StopMusicCommand(commands.Cog):
         Verifica se o usuário tem permissão para parar a música.
         Retorna True se o usuário for o dono da sessão ou possuir a tag de DJ.
         """
-        tag_dj_id = self.music_manager.dj_role_id
-        if not self.music_manager.current_song:
+        music_manager = self.music_managers.get(ctx.guild)
+
+        tag_dj_id = music_manager.dj_role_id
+        if not music_manager.current_song:
             logger.warning("Nenhuma música atual definida para verificar permissões.")
             return False
 
         # Verifica se o usuário é o dono da sessão ou possui a tag de DJ
-        is_session_owner = ctx.author.id == int(self.music_manager.current_song.get('added_by', 0))
+        is_session_owner = ctx.author.id == int(music_manager.current_song.get('added_by', 0))
         has_dj_role = any(role.id == int(tag_dj_id) for role in ctx.author.roles)
         return is_session_owner or has_dj_role
 
-async def setup(bot, music_manager):
-    await bot.add_cog(StopMusicCommand(bot, music_manager))
\ No newline at end of file
+async def setup(bot, music_managers: MusicManagerRegistry):
+    await bot.add_cog(StopMusicCommand(bot, music_managers))
\ No newline at end of file
@@ -0,0 +1,48 @@
+from utils.database import get_emoji_from_table, get_fun_emoji, get_music_emoji, get_error_emoji, get_number_emoji, get_clan_management_emoji, get_server_staff_emoji
+import time
+from discord.ext import commands
+from commands.music.musicsystem.music_registry import MusicManagerRegistry
+from commands.music.musicsystem.embeds import embed_top_tracks, embed_error
+from commands.music.musicsystem.play_log import play_log
+import logging
+
+logger = logging.getLogger(__name__)
+
+class TopCommand(commands.Cog):
+    """
+    Comando para exibir as músicas mais tocadas do servidor (a partir do registro de reproduções).
+    """
+
+    def __init__(self, bot, music_managers: MusicManagerRegistry):
+        self.bot = bot
+        self.music_managers = music_managers
+
+    @commands.command(name="top", aliases=["maistocadas"])
+    async def top(self, ctx, dias: int = None):
+        """
+        Exibe as 10 músicas mais tocadas no servidor.
+
+        :param ctx: Contexto do comando.
+        :param dias: Considera apenas os últimos N dias (opcional).
+        """
+        if dias is not None and dias <= 0:
+            await ctx.send(embed=embed_error("Informe um número de dias maior que zero."))
+            return
+
+        since = time.time() - dias * 86400 if dias else None
+        try:
+            tracks = await play_log.top_tracks(ctx.guild.id, limit=10, since=since)
+            await ctx.send(embed=embed_top_tracks(tracks, dias))
+        except Exception as e:
+            logger.error(f"Erro ao consultar as músicas mais tocadas: {e}")
+            await ctx.send(embed=embed_error("Não foi possível consultar as músicas mais tocadas."))
+
+
+async def setup(bot, music_managers: MusicManagerRegistry):
+    """
+    Adiciona o cog ao bot.
+
+    :param bot: O bot do Discord.
+    :param music_managers: O registro de gerenciadores de música por servidor.
+    """
+    await bot.add_cog(TopCommand(bot, music_managers))
@@ -0,0 +1,70 @@
+import discord
+from discord.ext import commands
+from utils.database import get_config, get_embed_color
+import logging
+
+logger = logging.getLogger(__name__)
+
+MAX_LISTED_PLAYERS = 50  # Jogadores exibidos no embed (limite de tamanho da descrição)
+
+
+class JogadoresCommand(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        self.lema = get_config("LEMA") or "Bot oficial"
+
+    def create_embed(self, title, description, color=None):
+        """Cria um embed padronizado."""
+        embed = discord.Embed(title=title, description=description, color=color or get_embed_color())
+        embed.set_footer(text=self.lema)
+        return embed
+
+    @commands.command(name="jogadores", aliases=["players", "online"])
+    async def jogadores(self, ctx, servidor: int = None):
+        """
+        Mostra os jogadores online em um servidor SA-MP (o principal, por padrão).
+        A lista vem da memória do SampListener, atualizada em segundo plano.
+        """
+        listener = self.bot.get_cog("SampListener")
+        if not listener:
+            await ctx.send(embed=self.create_embed("❌ Listener Indisponível", "O Listener não está disponível no momento.", discord.Colour.red()))
+            return
+
+        server = listener.get_server(servidor)
+        if not server:
+            await ctx.send(embed=self.create_embed("❌ Servidor Não Encontrado", "Nenhum servidor monitorado com esse ID.", discord.Colour.red()))
+            return
+
+        if listener.get_status(server) != "on":
+            await ctx.send(embed=self.create_embed("🔴 Servidor Offline", f"O servidor **{server.name}** está offline no momento.", discord.Colour.red()))
+            return
+
+        roster = listener.get_roster(server)
+        player_info = listener.get_player_info(server)
+        online, maximum = player_info.get("online", 0), player_info.get("max", 0)
+
+        if not roster:
+            description = "Nenhum jogador online no momento." if not online else (
+                f"Há **{online}** jogadores online, mas o servidor não enviou a lista de nomes."
+            )
+            await ctx.send(embed=self.create_embed(f"🎮 {server.name} ({online}/{maximum})", description))
+            return
+
+        lines = []
+        for player in roster[:MAX_LISTED_PLAYERS]:
+            line = f"**{player['name']}** — {player['score']} pts"
+            if player.get("ping") is not None:
+                line = f"`{player['id']:>3}` {line} · {player['ping']} ms"
+            lines.append(line)
+        if len(roster) > MAX_LISTED_PLAYERS:
+            lines.append(f"... e mais **{len(roster) - MAX_LISTED_PLAYERS}** jogadores.")
+
+        embed = self.create_embed(f"🎮 {server.name} ({online}/{maximum})", "\n".join(lines))
+        if server.roster_updated_at:
+            embed.add_field(name="Atualizado", value=f"<t:{int(server.roster_updated_at)}:R>")
+        await ctx.send(embed=embed)
+
+
+# Adicionar o cog ao bot
+async def setup(bot):
+    await bot.add_cog(JogadoresCommand(bot))
@@ -2,7 +2,8 @@ from utils.database import get_emoji_from_table, get_fun_emoji, get_music_emoji,
 from utils.database import get_embed_color
 import discord
 from discord.ext import commands
-from utils.database import execute_query, get_config
+from utils.database import get_config
+from utils.async_database import db
 import logging
 
 logger = logging.getLogger(__name__)
@@ -50,7 +51,7 @@ class NivelCommand(commands.Cog):
             nivel_jogo = int(response.content.strip())
 
             # Atualiza ou insere o nível, sem afetar o número de prisões
-            execute_query(
+            await db.execute_query(
                 """
                 INSERT INTO niveleprisoes (userid, nivel)
                 VALUES (?, ?)
@@ -2,7 +2,8 @@ from utils.database import get_emoji_from_table, get_fun_emoji, get_music_emoji,
 from utils.database import get_embed_color
 import discord
 from discord.ext import commands
-from utils.database import fetchall, get_config
+from utils.database import get_config
+from utils.async_database import db
 import logging
 
 logger = logging.getLogger(__name__)
@@ -47,7 +48,7 @@ class NivelEPrisoesCommand(commands.Cog):
 
         # Buscar dados na tabela niveleprisoes
         try:
-            data = fetchall("SELECT userid, nivel, prisoes FROM niveleprisoes")
+            data = await db.fetchall("SELECT userid, nivel, prisoes FROM niveleprisoes")
             if not data:
                 await ctx.send(embed=self.create_embed(
                     "Nenhum Dado Encontrado",
@@ -2,7 +2,8 @@ from utils.database import get_emoji_from_table, get_fun_emoji, get_music_emoji,
 from utils.database import get_embed_color
 import discord
 from discord.ext import commands
-from utils.database import execute_query, get_config, get_embed_color
+from utils.database import get_config, get_embed_color
+from utils.async_database import db
 import logging
 
 logger = logging.getLogger(__name__)
@@ -50,7 +51,7 @@ class PrisoesCommand(commands.Cog):
             prisao_count = int(response.content.strip())
 
             # Atualiza ou insere o número de prisões, sem afetar o nível
-            execute_query(
+            await db.execute_query(
                 """
                 INSERT INTO niveleprisoes (userid, prisoes)
                 VALUES (?, ?)
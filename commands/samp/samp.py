@@ -1,13 +1,56 @@
 import asyncio
+import ipaddress
+import time
 import discord
 from discord.ext import commands
-from utils.database import execute_query, fetchone, get_config, get_embed_color
+from utils.database import get_config, get_embed_color
+from utils.async_database import db
+from utils.samp_servers import samp_servers
+from utils.samp_stats import samp_stats, DAY
 
 
 class SampCommand(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
+    async def check_owner(self, ctx):
+        """
+        Verifica se o usuário é o dono do bot; caso contrário, envia o aviso de acesso negado.
+        """
+        dono_id = get_config("DONO")
+        if dono_id and str(ctx.author.id) == dono_id:
+            return True
+        embed = discord.Embed(
+            title="🔒 Acesso Negado",
+            description="Você não tem permissão para usar este comando.",
+            color=discord.Colour.red()
+        )
+        embed.set_footer(text=get_config("LEMA") or "Bot oficial")
+        await ctx.send(embed=embed)
+        return False
+
+    async def set_server_channels(self, server_id, status_channel_id, players_channel_id):
+        """
+        Grava os canais de um servidor na tabela 'samp_servers' e recarrega o listener.
+        """
+        await db.run(samp_servers.set_channels, server_id, status_channel_id, players_channel_id)
+        listener = self.bot.get_cog("SampListener")
+        if listener:
+            await listener.reload_servers()
+
+    async def create_server_channels(self, category, server, labeled):
+        """
+        Cria os canais de status e de jogadores de um servidor dentro da categoria.
+        """
+        permissions = {
+            category.guild.default_role: discord.PermissionOverwrite(connect=False)
+        }
+        status_name, players_name = server.channel_names(labeled)
+        status_channel = await category.create_voice_channel(status_name, overwrites=permissions)
+        players_channel = await category.create_voice_channel(players_name, overwrites=permissions)
+        await self.set_server_channels(server.id, status_channel.id, players_channel.id)
+        return status_channel, players_channel
+
     async def update_listener_status(self, status):
         """
         Atualiza o status do `SampListener` e força uma atualização inicial.
@@ -18,7 +61,7 @@ class SampCommand(commands.Cog):
             print(f"[SAMP COMMAND] Listener atualizado para: {status}")
             if status == "on":
                 # Revalidar informações do servidor
-                server_updated = await listener.fetch_server_info()
+                server_updated = await listener.fetch_server_info(max_age=0)
                 if server_updated:
                     print("[SAMP COMMAND] Listener sincronizado com as novas informações do servidor.")
                 else:
@@ -39,8 +82,8 @@ class SampCommand(commands.Cog):
                 return
 
             # Obter IDs dos canais
-            status_channel_id = fetchone("SELECT id FROM canais WHERE tipodecanal = ?", ("samp_status",))
-            players_channel_id = fetchone("SELECT id FROM canais WHERE tipodecanal = ?", ("samp_jogadores",))
+            status_channel_id = await db.fetchone("SELECT id FROM canais WHERE tipodecanal = ?", ("samp_status",))
+            players_channel_id = await db.fetchone("SELECT id FROM canais WHERE tipodecanal = ?", ("samp_jogadores",))
 
             if not (status_channel_id and players_channel_id):
                 print("[SAMP COMMAND] Canais necessários não encontrados no banco de dados.")
@@ -65,7 +108,7 @@ class SampCommand(commands.Cog):
         except Exception as e:
             print(f"[SAMP COMMAND] Erro ao atualizar canais: {e}")
 
-    @commands.command(name="samp")
+    @commands.group(name="samp", invoke_without_command=True)
     async def samp_command(self, ctx):
         """
         Comando principal para gerenciar o SAMP.
@@ -124,6 +167,189 @@ class SampCommand(commands.Cog):
             embed.set_footer(text=lema)
             await ctx.send(embed=embed)
 
+    @samp_command.command(name="stats", aliases=["estatisticas", "estatísticas"])
+    async def samp_stats_command(self, ctx, servidor: int = None):
+        """
+        Mostra a média e o pico de jogadores e os horários mais movimentados do servidor.
+
+        :param servidor: ID do servidor (veja `samp servidores`); por padrão, o principal.
+        """
+        lema = get_config("LEMA") or "Bot oficial"
+        listener = self.bot.get_cog("SampListener")
+        if not listener:
+            embed = discord.Embed(
+                title="❌ Listener Indisponível",
+                description="O Listener não está disponível no momento.",
+                color=discord.Colour.red()
+            )
+            embed.set_footer(text=lema)
+            await ctx.send(embed=embed)
+            return
+
+        monitored = listener.get_server(servidor)
+        if not monitored:
+            embed = discord.Embed(
+                title="❌ Servidor Não Encontrado",
+                description="Nenhum servidor monitorado com esse ID. Use `samp servidores` para ver a lista.",
+                color=discord.Colour.red()
+            )
+            embed.set_footer(text=lema)
+            await ctx.send(embed=embed)
+            return
+
+        server = monitored.key
+        last_day, last_week = await asyncio.gather(
+            samp_stats.summary(server, DAY),
+            samp_stats.summary(server, 7 * DAY),
+        )
+        if not last_week:
+            embed = discord.Embed(
+                title="📊 Estatísticas do Servidor",
+                description="Ainda não há dados suficientes. As estatísticas são coletadas a cada consulta ao servidor.",
+                color=get_embed_color()
+            )
+            embed.set_footer(text=lema)
+            await ctx.send(embed=embed)
+            return
+
+        peak_hours = await samp_stats.peak_hours(server, days=7)
+        daily = await samp_stats.daily(server, days=7)
+
+        player_info = listener.get_player_info(monitored)
+        embed = discord.Embed(
+            title=f"📊 Estatísticas — {monitored.name}",
+            description=f"🎮 **Agora:** {player_info.get('online', 0)}/{player_info.get('max', 0)} jogadores",
+            color=get_embed_color()
+        )
+        for label, summary in (("Últimas 24 horas", last_day), ("Últimos 7 dias", last_week)):
+            if summary:
+                embed.add_field(
+                    name=label,
+                    value=(
+                        f"Média: **{summary['average']:.1f}**\n"
+                        f"Pico: **{summary['peak']}** (<t:{summary['peak_at']}:f>)\n"
+                        f"Mínimo: **{summary['low']}**"
+                    ),
+                    inline=True
+                )
+        if peak_hours:
+            embed.add_field(
+                name="Horários de Pico (7 dias)",
+                value="\n".join(f"**{hour:02d}h** — média {average:.1f}, pico {peak}" for hour, average, peak in peak_hours),
+                inline=False
+            )
+        if daily:
+            embed.add_field(
+                name="Média por Dia",
+                value="\n".join(
+                    f"{time.strftime('%d/%m', time.localtime(day))}: **{average:.1f}** (pico {peak})" for day, average, peak in daily
+                ),
+                inline=False
+            )
+        embed.set_footer(text=lema)
+        await ctx.send(embed=embed)
+
+    @samp_command.command(name="servidores", aliases=["servers", "lista"])
+    async def samp_servers_command(self, ctx):
+        """
+        Lista os servidores monitorados e o último status de cada um.
+        """
+        lema = get_config("LEMA") or "Bot oficial"
+        listener = self.bot.get_cog("SampListener")
+        servers = listener.get_servers() if listener else []
+        if not servers:
+            description = "Nenhum servidor monitorado. Use `samp adicionar <ip:porta> <nome>`."
+        else:
+            description = "\n".join(
+                f"`{server.id}` {'🟢' if server.server_info else '🔴'} **{server.name}** — `{server.key}` "
+                f"({server.players.get('online', 0)}/{server.players.get('max', 0)})"
+                for server in servers
+            )
+        embed = discord.Embed(title="🖥️ Servidores Monitorados", description=description, color=get_embed_color())
+        embed.set_footer(text=lema)
+        await ctx.send(embed=embed)
+
+    @samp_command.command(name="adicionar", aliases=["add"])
+    async def samp_add_command(self, ctx, endereco: str, *, nome: str):
+        """
+        Adiciona um servidor ao monitoramento (apenas o dono).
+        Se a categoria do SA-MP existir, os canais do servidor são criados nela.
+
+        :param endereco: Endereço no formato ip:porta (porta padrão 7777).
+        :param nome: Nome exibido nos canais e comandos.
+        """
+        if not await self.check_owner(ctx):
+            return
+        lema = get_config("LEMA") or "Bot oficial"
+
+        ip, _, port = endereco.partition(":")
+        try:
+            # Forma canônica (rejeita abreviações como "127.1"), igual ao endereço das respostas UDP
+            ip = str(ipaddress.IPv4Address(ip))
+            port = int(port or 7777)
+            if not 0 < port < 65536:
+                raise ValueError
+        except ValueError:
+            embed = discord.Embed(
+                title="❌ Endereço Inválido",
+                description="Informe o endereço no formato `ip:porta` (ex.: `15.235.123.105:7777`).",
+                color=discord.Colour.red()
+            )
+            embed.set_footer(text=lema)
+            await ctx.send(embed=embed)
+            return
+
+        server_id = await db.run(samp_servers.add, nome, ip, port)
+        listener = self.bot.get_cog("SampListener")
+        if listener:
+            await listener.reload_servers()
+            server = listener.get_server(server_id)
+            await listener.fetch_server_info(server)
+
+            category_id = await db.fetchone("SELECT id FROM canais WHERE tipodecanal = ?", ("samp_categoria",))
+            category = discord.utils.get(ctx.guild.categories, id=category_id[0]) if category_id and category_id[0] else None
+            if category and not server.status_channel_id:
+                await self.create_server_channels(category, server, labeled=server is not listener.get_server())
+
+        embed = discord.Embed(
+            title="✅ Servidor Adicionado",
+            description=f"**{nome}** (`{ip}:{port}`) agora é monitorado com o ID `{server_id}`.",
+            color=get_embed_color()
+        )
+        embed.set_footer(text=lema)
+        await ctx.send(embed=embed)
+
+    @samp_command.command(name="remover", aliases=["remove"])
+    async def samp_remove_command(self, ctx, servidor: int):
+        """
+        Remove um servidor do monitoramento e apaga seus canais (apenas o dono).
+
+        :param servidor: ID do servidor (veja `samp servidores`).
+        """
+        if not await self.check_owner(ctx):
+            return
+        lema = get_config("LEMA") or "Bot oficial"
+
+        listener = self.bot.get_cog("SampListener")
+        server = listener.get_server(servidor) if listener else None
+        if server:
+            for channel_id in (server.status_channel_id, server.players_channel_id):
+                channel = self.bot.get_channel(channel_id) if channel_id else None
+                if channel:
+                    await channel.delete()
+
+        removed = await db.run(samp_servers.remove, servidor)
+        if listener:
+            await listener.reload_servers()
+
+        embed = discord.Embed(
+            title="✅ Servidor Removido" if removed else "❌ Servidor Não Encontrado",
+            description=f"O servidor `{servidor}` não é mais monitorado." if removed else "Nenhum servidor monitorado com esse ID.",
+            color=get_embed_color() if removed else discord.Colour.red()
+        )
+        embed.set_footer(text=lema)
+        await ctx.send(embed=embed)
+
     async def create_category(self, ctx):
         """
         Cria a categoria e canais relacionados ao servidor SA-MP ou sincroniza os IDs se já existir.
@@ -154,16 +380,21 @@ class SampCommand(commands.Cog):
             await ctx.send("🔄 A categoria já existe. Sincronizando IDs...")
             for channel in existing_category.channels:
                 if "Status" in channel.name:
-                    execute_query(
+                    await db.execute_query(
                         "UPDATE canais SET id = ? WHERE tipodecanal = ?", (channel.id, "samp_status")
                     )
                 elif "Jogadores" in channel.name:
-                    execute_query(
+                    await db.execute_query(
                         "UPDATE canais SET id = ? WHERE tipodecanal = ?", (channel.id, "samp_jogadores")
                     )
-            execute_query(
+            await db.execute_query(
                 "UPDATE canais SET id = ? WHERE tipodecanal = ?", (existing_category.id, "samp_categoria")
             )
+            status_channel = next((c for c in existing_category.channels if "Status" in c.name), None)
+            players_channel = next((c for c in existing_category.channels if "Jogadores" in c.name), None)
+            primary = listener.get_server()
+            if primary and status_channel and players_channel:
+                await self.set_server_channels(primary.id, status_channel.id, players_channel.id)
             await self.update_listener_status("on")
             return
 
@@ -180,19 +411,26 @@ class SampCommand(commands.Cog):
             status_channel = await category.create_voice_channel(f"Status: {status}", overwrites=permissions)
             players_channel = await category.create_voice_channel(players_name, overwrites=permissions)
 
-            execute_query(
+            await db.execute_query(
                 "INSERT INTO canais (tipodecanal, id) VALUES (?, ?) ON CONFLICT(tipodecanal) DO UPDATE SET id=excluded.id",
                 ("samp_status", status_channel.id)
             )
-            execute_query(
+            await db.execute_query(
                 "INSERT INTO canais (tipodecanal, id) VALUES (?, ?) ON CONFLICT(tipodecanal) DO UPDATE SET id=excluded.id",
                 ("samp_jogadores", players_channel.id)
             )
-            execute_query(
+            await db.execute_query(
                 "INSERT INTO canais (tipodecanal, id) VALUES (?, ?) ON CONFLICT(tipodecanal) DO UPDATE SET id=excluded.id",
                 ("samp_categoria", category.id)
             )
 
+            # O servidor principal usa os canais acima; os demais recebem canais próprios
+            servers = listener.get_servers()
+            if servers:
+                await self.set_server_channels(servers[0].id, status_channel.id, players_channel.id)
+            for server in servers[1:]:
+                await self.create_server_channels(category, server, labeled=True)
+
             await self.update_listener_status("on")
             embed = discord.Embed(
                 title="✅ Categoria Criada",
@@ -217,7 +455,7 @@ class SampCommand(commands.Cog):
         """
         lema = get_config("LEMA") or "Bot oficial"
         try:
-            category_id = fetchone("SELECT id FROM canais WHERE tipodecanal = ?", ("samp_categoria",))
+            category_id = await db.fetchone("SELECT id FROM canais WHERE tipodecanal = ?", ("samp_categoria",))
             if not category_id:
                 embed = discord.Embed(
                     title="❌ Categoria Não Encontrada",
@@ -234,7 +472,10 @@ class SampCommand(commands.Cog):
                     await channel.delete()
                 await category.delete()
 
-            execute_query("UPDATE canais SET id = NULL WHERE tipodecanal LIKE 'samp_%'")
+            await db.execute_query("UPDATE canais SET id = NULL WHERE tipodecanal LIKE 'samp_%'")
+            listener = self.bot.get_cog("SampListener")
+            for server in (listener.get_servers() if listener else []):
+                await self.set_server_channels(server.id, None, None)
             await self.update_listener_status("off")
             embed = discord.Embed(
                 title="✅ Categoria Removida",
@@ -4,7 +4,8 @@ import discord
 from discord.ext import commands
 import asyncio
 import logging
-from utils.database import execute_query, get_config
+from utils.database import get_config
+from utils.async_database import db
 
 # Configuração de logs
 logger = logging.getLogger(__name__)
@@ -117,7 +118,7 @@ class StatusCommand(commands.Cog):
 
         # Salvar no banco de dados apenas a linha 2
         try:
-            execute_query(
+            await db.execute_query(
                 "UPDATE status SET status_type = ?, status_message = ?, status_status = ? WHERE id = 2",
                 (status_type, status_message, str(discord_status))
             )
@@ -1,8 +1,9 @@
 from utils.database import get_emoji_from_table, get_fun_emoji, get_music_emoji, get_error_emoji, get_number_emoji, get_clan_management_emoji, get_server_staff_emoji
 import discord
-import sqlite3
 from discord.ext import commands
-from utils.database import get_config
+from utils.database import get_config, pool, emoji_registry
+from utils.emoji_registry import EMOJI_CATEGORIES, EMOJI_SERVER_ID
+from utils.async_database import db
 
 class SyncEmojisCommand(commands.Cog):
     """
@@ -21,29 +22,24 @@ class SyncEmojisCommand(commands.Cog):
         :param table_name: Nome da tabela onde os emojis serão armazenados.
         """
         try:
-            conn = sqlite3.connect("bot.db")
-            cursor = conn.cursor()
-
-            # Cria a tabela se não existir
-            cursor.execute(f"""
-                CREATE TABLE IF NOT EXISTS {table_name} (
-                    identifier TEXT UNIQUE,
-                    emoji_code TEXT
-                )
-            """)
-            conn.commit()
-
-            # Insere ou atualiza os emojis na tabela
-            for emoji in emojis:
+            with pool.writer() as conn:
+                cursor = conn.cursor()
+
+                # Cria a tabela se não existir
                 cursor.execute(f"""
+                    CREATE TABLE IF NOT EXISTS {table_name} (
+                        identifier TEXT UNIQUE,
+                        emoji_code TEXT
+                    )
+                """)
+
+                # Insere ou atualiza os emojis na tabela
+                cursor.executemany(f"""
                     INSERT INTO {table_name} (identifier, emoji_code)
                     VALUES (?, ?)
                     ON CONFLICT(identifier) DO UPDATE SET
                         emoji_code = excluded.emoji_code
-                """, (emoji["identifier"], emoji["emoji_code"]))
-
-            conn.commit()
-            conn.close()
+                """, [(emoji["identifier"], emoji["emoji_code"]) for emoji in emojis])
         except Exception as e:
             print(f"Erro ao atualizar a tabela {table_name}: {e}")
 
@@ -53,8 +49,7 @@ class SyncEmojisCommand(commands.Cog):
         Sincroniza emojis do servidor na base de dados.
         """
         # Verifica se o comando está sendo executado no servidor correto
-        allowed_server_id = 1315754008136384572
-        if ctx.guild.id != allowed_server_id:
+        if ctx.guild.id != EMOJI_SERVER_ID:
             await ctx.send("Este comando só pode ser usado no servidor autorizado.")
             return
 
@@ -65,14 +60,7 @@ class SyncEmojisCommand(commands.Cog):
             return
 
         # Define prefixos e tabelas correspondentes
-        emoji_categories = {
-            "music_": "emojis_music",
-            "error_": "emojis_errors",
-            "fun_": "emojis_fun",
-            "number_": "emojis_numbers",
-            "clan_": "emojis_clan_management",
-            "staff_": "emojis_server_staff",
-        }
+        emoji_categories = EMOJI_CATEGORIES
 
         added_emojis = {table: 0 for table in emoji_categories.values()}
 
@@ -90,7 +78,10 @@ class SyncEmojisCommand(commands.Cog):
 
             # Atualiza o banco de dados para cada categoria
             for table, emojis in emojis_to_update.items():
-                self.update_database(emojis, table)
+                await db.run(self.update_database, emojis, table)
+
+            # Recarrega o registro em memória com os emojis recém-sincronizados
+            await db.run(emoji_registry.load)
 
             # Mensagem de confirmação
             results = "\n".join([f"{table}: {count} emojis sincronizados." for table, count in added_emojis.items()])
@@ -0,0 +1,28 @@
+import logging
+from discord.ext import commands
+from utils.database import emoji_registry
+from utils.emoji_registry import EMOJI_SERVER_ID
+
+logger = logging.getLogger(__name__)
+
+class OnGuildEmojisUpdateEvent(commands.Cog):
+    """Cog que mantém o registro de emojis em memória sincronizado com o servidor de emojis."""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @commands.Cog.listener()
+    async def on_guild_emojis_update(self, guild, before, after):
+        """
+        Evento disparado quando emojis são adicionados, removidos ou renomeados em um servidor.
+        """
+        if guild.id != EMOJI_SERVER_ID:
+            return
+
+        changed = emoji_registry.apply_guild_update(before, after)
+        if changed:
+            logger.info(f"🔄 Registro de emojis atualizado: {changed} alteração(ões) no servidor {guild.name}.")
+
+async def setup(bot):
+    """Função para adicionar o cog ao bot."""
+    await bot.add_cog(OnGuildEmojisUpdateEvent(bot))
@@ -1,6 +1,6 @@
 from utils.database import get_emoji_from_table, get_fun_emoji, get_music_emoji, get_error_emoji, get_number_emoji, get_clan_management_emoji, get_server_staff_emoji
 import logging
-from utils.database import fetchone
+from utils.async_database import db
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +16,7 @@ async def setup(bot):
         logger.info(f"🎉 Novo membro entrou: {member} (ID: {member.id})")
 
         # Buscar ID do canal de boas-vindas na tabela 'canais'
-        channel_data = fetchone("SELECT id FROM canais WHERE tipodecanal = ?", ("boas_vindas",))
+        channel_data = await db.fetchone("SELECT id FROM canais WHERE tipodecanal = ?", ("boas_vindas",))
         if not channel_data:
             logger.warning("⚠️ Nenhum canal de boas-vindas configurado na tabela 'canais'.")
             return
@@ -1,7 +1,7 @@
 from utils.database import get_emoji_from_table, get_fun_emoji, get_music_emoji, get_error_emoji, get_number_emoji, get_clan_management_emoji, get_server_staff_emoji
 import discord
 from discord.ext import commands
-from utils.database import get_status_by_id
+from utils.async_database import db
 import logging
 
 logger = logging.getLogger(__name__)
@@ -23,7 +23,7 @@ class OnRestartEvent(commands.Cog):
         """
         try:
             # Recuperar dados do status pelo ID
-            status_data = get_status_by_id(status_id)
+            status_data = await db.get_status_by_id(status_id)
             if not status_data:
                 logger.warning(f"Nenhum status encontrado para o ID {status_id}.")
                 return False
@@ -1,170 +1,236 @@
 import asyncio
-import socket
-import struct
 import logging
-import discord
+import os
+import time
+from typing import Dict, List, Optional
 from discord.ext import commands
-from utils.database import fetchone
+from utils.async_database import db
+from utils.samp_query import samp_query, SampQueryError
+from utils.samp_servers import samp_servers, SampServer
+from utils.samp_stats import samp_stats
 
 logger = logging.getLogger(__name__)
 
+SAMP_POLL_INTERVAL = int(os.getenv("SAMP_POLL_INTERVAL", "60"))  # Segundos entre as consultas periódicas aos servidores
+SAMP_INFO_MAX_AGE = float(os.getenv("SAMP_INFO_MAX_AGE", "10"))  # Segundos em que uma consulta recente é reaproveitada
+ROSTER_MAX_PLAYERS = 100  # A partir desta população o servidor não envia a lista de jogadores
+
 class SampListener(commands.Cog):
     def __init__(self, bot: commands.Bot):
         """
         Inicializa o cog SampListener.
         """
         self.bot = bot
-        self.status = "off"  # Inicializa o status como 'off'
-        self.server_info = None  # Armazena informações gerais do servidor
-        self.players = {"online": 0, "max": 0}  # Armazena jogadores online e máximo
-        self.server_ip = "15.235.123.105"
-        self.server_port = 7777
-        self.samp_query = SampQueryAPI(self.server_ip, self.server_port)
-        self.max_attempts = 10  # Número máximo de tentativas antes de marcar como offline
+        self.servers: Dict[int, SampServer] = {}  # Servidores monitorados (tabela 'samp_servers'), por ID
+        self.poll_task = None
+        self._inflight: Dict[int, asyncio.Task] = {}  # Consultas de informações em andamento, por servidor
+
+    async def cog_load(self):
+        await self.reload_servers()
 
     @commands.Cog.listener()
     async def on_ready(self):
         """
         Listener ativado quando o bot está pronto.
+        Inicia a consulta periódica dos servidores (população e lista de jogadores).
+        """
+        if not self.poll_task:
+            self.poll_task = asyncio.create_task(self.poll_loop())
+        logger.info(f"[SAMP LISTENER] Cog SampListener está pronto para uso ({len(self.servers)} servidor(es) monitorado(s)).")
+
+    async def cog_unload(self):
+        if self.poll_task:
+            self.poll_task.cancel()
+
+    async def reload_servers(self):
+        """
+        Recarrega a lista de servidores do banco, preservando o estado já consultado
+        dos servidores que continuam cadastrados.
         """
-        logger.info("[SAMP LISTENER] Cog SampListener está pronto para uso.")
+        servers = await db.run(samp_servers.load)
+        for server in servers:
+            previous = self.servers.get(server.id)
+            if previous is not None and previous.key == server.key:
+                server.status = previous.status
+                server.server_info = previous.server_info
+                server.players = previous.players
+                server.roster = previous.roster
+                server.roster_updated_at = previous.roster_updated_at
+                server.checked_at = previous.checked_at
+        self.servers = {server.id: server for server in servers}
 
-    async def fetch_server_info(self) -> bool:
+    async def poll_loop(self):
         """
-        Obtém informações do servidor SA-MP sob demanda.
-        Realiza até `max_attempts` antes de marcar como offline.
+        Consulta todos os servidores em paralelo, pelo mesmo socket UDP: cada consulta
+        alimenta a série histórica da população e atualiza a lista de jogadores, que os
+        comandos leem da memória sem acessar os servidores do jogo.
         """
-        for attempt in range(1, self.max_attempts + 1):
+        while True:
             try:
-                logger.info(f"[SAMP LISTENER] Tentativa {attempt}/{self.max_attempts} para obter informações do servidor...")
-
-                if self.samp_query.is_online():
-                    info = self.samp_query.get_info()
-                    if info:
-                        self.server_info = {
-                            "state": "Online",
-                            "hostname": info["hostname"],
-                            "gamemode": info["gamemode"],
-                            "mapname": info["mapname"],
-                        }
-                        self.players = {
-                            "online": info["players"],
-                            "max": info["maxplayers"]
-                        }
-                        logger.info("[SAMP LISTENER] Informações do servidor obtidas com sucesso.")
-                        self.status = "on"
-                        return True
-                else:
-                    logger.warning("[SAMP LISTENER] Servidor SA-MP está inacessível. Tentando novamente...")
+                await asyncio.gather(*(self._poll(server) for server in self.get_servers()))
             except Exception as e:
-                logger.error(f"[SAMP LISTENER] Erro ao tentar acessar o servidor: {e}")
+                logger.error(f"[SAMP LISTENER] Erro ao consultar os servidores: {e}")
+            await asyncio.sleep(SAMP_POLL_INTERVAL)
 
-            # Aguarda antes da próxima tentativa
-            await asyncio.sleep(5)
+    async def _poll(self, server: SampServer):
+        if await self.fetch_server_info(server):
+            # Uma amostra por ciclo, mesmo que a consulta tenha sido reaproveitada de um comando
+            samp_stats.record(server.key, server.players["online"])
+            await self.refresh_roster(server)
 
-        # Se todas as tentativas falharem
-        logger.error("[SAMP LISTENER] Não foi possível acessar o servidor após várias tentativas.")
-        self.server_info = None
-        self.players = {"online": 0, "max": 0}
-        self.status = "off"
-        return False
-
-    def get_status(self) -> str:
+    async def fetch_all(self) -> Dict[int, bool]:
         """
-        Retorna o status atual do listener.
+        Atualiza as informações de todos os servidores em paralelo.
+
+        :return: Dicionário ID do servidor -> True se o servidor respondeu.
         """
-        return self.status
+        servers = self.get_servers()
+        results = await asyncio.gather(*(self.fetch_server_info(server) for server in servers))
+        return {server.id: result for server, result in zip(servers, results)}
 
-    def get_server_info(self) -> dict:
+    async def refresh_roster(self, server: Optional[SampServer] = None) -> bool:
         """
-        Retorna as informações do servidor armazenadas na memória.
+        Consulta a lista detalhada de jogadores (com ping); se o servidor não responder
+        a ela, usa a lista simples (nome e pontuação). Com 100 jogadores ou mais o
+        servidor não responde a nenhuma das duas, então a consulta nem é enviada.
         """
-        return self.server_info
+        server = server or self.get_server()
+        if server is None:
+            return False
+        if server.players["online"] >= ROSTER_MAX_PLAYERS:
+            server.roster = []
+            return False
+        try:
+            roster = await samp_query.get_players(server.ip, server.port)
+        except SampQueryError:
+            try:
+                roster = await samp_query.get_clients(server.ip, server.port)
+            except SampQueryError as e:
+                logger.warning(f"[SAMP LISTENER] Não foi possível obter a lista de jogadores de {server.name}: {e}")
+                server.roster = []
+                return False
+
+        server.roster = sorted(roster, key=lambda player: player["score"], reverse=True)
+        server.roster_updated_at = time.time()
+        return True
 
-    def get_player_info(self) -> dict:
+    async def fetch_server_info(self, server: Optional[SampServer] = None, max_age: Optional[float] = None) -> bool:
         """
-        Retorna as informações dos jogadores armazenadas na memória.
+        Obtém informações de um servidor SA-MP sob demanda (o principal, se nenhum for informado).
+        As consultas são assíncronas: o cliente reenvia o pacote com espera exponencial
+        e, se o servidor não responder, o status é marcado como offline sem bloquear o bot.
+
+        Chamadas simultâneas para o mesmo servidor aguardam a mesma consulta, e um
+        resultado com menos de `max_age` segundos é reaproveitado sem nova consulta.
+
+        :param max_age: Idade máxima aceita para o resultado em memória (0 força uma nova consulta).
+        :return: True se o servidor está online.
         """
-        return self.players
+        server = server or self.get_server()
+        if server is None:
+            return False
+
+        max_age = SAMP_INFO_MAX_AGE if max_age is None else max_age
+        if server.checked_at is not None and time.monotonic() - server.checked_at < max_age:
+            return server.status == "on"
 
+        task = self._inflight.get(server.id)
+        if task is None:
+            task = asyncio.create_task(self._query_server_info(server))
+            self._inflight[server.id] = task
+            task.add_done_callback(lambda _, server_id=server.id: self._inflight.pop(server_id, None))
+        # shield: se quem chamou for cancelado, a consulta continua para os demais
+        return await asyncio.shield(task)
 
-class SampQueryAPI:
-    def __init__(self, ip: str, port: int):
+    async def _query_server_info(self, server: SampServer) -> bool:
+        try:
+            info = await samp_query.get_info(server.ip, server.port)
+        except SampQueryError as e:
+            logger.warning(f"[SAMP LISTENER] Servidor {server.name} inacessível: {e}")
+            info = None
+        except Exception as e:
+            logger.error(f"[SAMP LISTENER] Erro ao tentar acessar o servidor {server.name}: {e}")
+            info = None
+
+        server.checked_at = time.monotonic()
+        if not info:
+            server.set_offline()
+            return False
+
+        server.server_info = {
+            "state": "Online",
+            "hostname": info["hostname"],
+            "gamemode": info["gamemode"],
+            "mapname": info["mapname"],
+        }
+        server.players = {
+            "online": info["players"],
+            "max": info["maxplayers"]
+        }
+        logger.debug(f"[SAMP LISTENER] Informações do servidor {server.name} obtidas com sucesso.")
+        server.status = "on"
+        return True
+
+    def get_servers(self) -> List[SampServer]:
         """
-        Inicializa a API de consulta ao servidor SA-MP.
+        Retorna os servidores monitorados, na ordem de cadastro.
         """
-        self.ip = ip
-        self.port = port
-        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        self.socket.settimeout(10)  # Tempo limite para a conexão
+        return list(self.servers.values())
 
-    def is_online(self) -> bool:
+    def get_server(self, server_id: Optional[int] = None) -> Optional[SampServer]:
         """
-        Verifica se o servidor está online.
+        Retorna um servidor pelo ID, ou o servidor principal (o primeiro cadastrado).
         """
-        try:
-            self.socket.sendto(self._build_packet("i"), (self.ip, self.port))
-            data, _ = self.socket.recvfrom(4096)
-            return data.startswith(b"SAMP")
-        except Exception as e:
-            logger.warning(f"[SAMPQueryAPI] Erro ao verificar servidor online: {e}")
-            return False
+        if server_id is not None:
+            return self.servers.get(server_id)
+        return next(iter(self.servers.values()), None)
+
+    # Atalhos para o servidor principal, usados pelos comandos que não escolhem servidor
+
+    @property
+    def status(self) -> str:
+        server = self.get_server()
+        return server.status if server else "off"
+
+    @status.setter
+    def status(self, value: str):
+        server = self.get_server()
+        if server:
+            server.status = value
 
-    def get_info(self) -> dict:
+    @property
+    def server_key(self) -> Optional[str]:
+        server = self.get_server()
+        return server.key if server else None
+
+    def get_status(self, server: Optional[SampServer] = None) -> str:
         """
-        Obtém informações detalhadas do servidor.
+        Retorna o status atual do servidor.
         """
-        try:
-            self.socket.sendto(self._build_packet("i"), (self.ip, self.port))
-            data, _ = self.socket.recvfrom(4096)
-            return self._parse_info(data)
-        except Exception as e:
-            logger.error(f"[SAMPQueryAPI] Erro ao buscar informações do servidor: {e}")
-            return None
+        server = server or self.get_server()
+        return server.status if server else "off"
+
+    def get_server_info(self, server: Optional[SampServer] = None) -> dict:
+        """
+        Retorna as informações do servidor armazenadas na memória.
+        """
+        server = server or self.get_server()
+        return server.server_info if server else None
 
-    def _build_packet(self, payload: str) -> bytes:
+    def get_player_info(self, server: Optional[SampServer] = None) -> dict:
         """
-        Constrói o pacote de consulta para o servidor SA-MP.
+        Retorna as informações dos jogadores armazenadas na memória.
         """
-        ip_parts = [int(x) for x in self.ip.split(".")]
-        port_low = self.port & 0xFF
-        port_high = (self.port >> 8) & 0xFF
-        return b"SAMP" + bytes(ip_parts) + bytes([port_low, port_high]) + payload.encode()
+        server = server or self.get_server()
+        return server.players if server else {"online": 0, "max": 0}
 
-    def _parse_info(self, data: bytes) -> dict:
+    def get_roster(self, server: Optional[SampServer] = None) -> list:
         """
-        Analisa os dados recebidos do servidor.
+        Retorna a lista de jogadores online armazenada na memória.
+        O servidor não envia a lista quando há 100 jogadores ou mais.
         """
-        try:
-            offset = 11
-            password = data[offset]
-            offset += 1
-            players = struct.unpack("<H", data[offset:offset + 2])[0]
-            offset += 2
-            maxplayers = struct.unpack("<H", data[offset:offset + 2])[0]
-            offset += 2
-            hostname_length = struct.unpack("<I", data[offset:offset + 4])[0]
-            offset += 4
-            hostname = data[offset:offset + hostname_length].decode(errors="replace")
-            offset += hostname_length
-            gamemode_length = struct.unpack("<I", data[offset:offset + 4])[0]
-            offset += 4
-            gamemode = data[offset:offset + gamemode_length].decode(errors="replace")
-            offset += gamemode_length
-            mapname_length = struct.unpack("<I", data[offset:offset + 4])[0]
-            offset += 4
-            mapname = data[offset:offset + mapname_length].decode(errors="replace")
-
-            return {
-                "hostname": hostname,
-                "gamemode": gamemode,
-                "players": players,
-                "maxplayers": maxplayers,
-                "mapname": mapname,
-            }
-        except Exception as e:
-            logger.error(f"[SAMPQueryAPI] Erro ao analisar dados do servidor: {e}")
-            return None
+        server = server or self.get_server()
+        return server.roster if server else []
 
 
 async def setup(bot: commands.Bot):
@@ -1,7 +1,6 @@
 import asyncio
-import discord
 from discord.ext import commands
-from utils.database import fetchone
+from utils.channel_renamer import ChannelRenameScheduler, PRIORITY_HIGH, PRIORITY_NORMAL
 import logging
 
 logger = logging.getLogger(__name__)
@@ -13,8 +12,7 @@ class SampChannels(commands.Cog):
         self.current_status = "off"  # Status inicial do servidor
         self.update_interval = 300  # Intervalo padrão entre atualizações (em segundos)
         self.quick_check_interval = 30  # Intervalo curto para verificações rápidas
-        self.rate_limit_penalty = 5  # Penalidade adicional ao detectar rate limit
-        self.max_attempts = 5  # Máximo de tentativas antes de marcar como offline
+        self.renamer = ChannelRenameScheduler(bot)  # Renomeações respeitando o limite de 2 a cada 10 minutos por canal
 
     @commands.Cog.listener()
     async def on_ready(self):
@@ -25,12 +23,18 @@ class SampChannels(commands.Cog):
         logger.info("[SAMP CHANNELS] Iniciando verificação do status do servidor SA-MP...")
 
         if not self.update_task:
+            self.renamer.start()
             self.update_task = asyncio.create_task(self.manage_updates())
             logger.info("[SAMP CHANNELS] Loop de atualização iniciado.")
 
+    async def cog_unload(self):
+        if self.update_task:
+            self.update_task.cancel()
+        self.renamer.stop()
+
     async def manage_updates(self):
         """
-        Gerencia a verificação do status do servidor e atualiza os canais.
+        Gerencia a verificação do status dos servidores e atualiza os canais.
         """
         while True:
             try:
@@ -42,12 +46,12 @@ class SampChannels(commands.Cog):
                     await asyncio.sleep(self.update_interval)
                     continue
 
-                # Tentar obter informações do servidor
-                logger.info("[SAMP CHANNELS] Verificando informações do servidor SA-MP...")
-                server_success = await listener.fetch_server_info()
+                # Consultar todos os servidores em paralelo
+                logger.info("[SAMP CHANNELS] Verificando informações dos servidores SA-MP...")
+                results = await listener.fetch_all()
 
-                if not server_success:
-                    logger.warning("[SAMP CHANNELS] Não foi possível obter informações do servidor. Marcando como offline.")
+                if not any(results.values()):
+                    logger.warning("[SAMP CHANNELS] Nenhum servidor respondeu. Marcando como offline.")
                     self.current_status = "off"
                 else:
                     self.current_status = "on"
@@ -56,16 +60,11 @@ class SampChannels(commands.Cog):
                 logger.info("[SAMP CHANNELS] Atualizando canais...")
                 channels_updated = await self.update_channels(listener)
 
-                # Determinar o intervalo de espera
-                sleep_interval = self.quick_check_interval if not channels_updated else self.update_interval
-            except discord.errors.HTTPException as e:
-                if e.status == 429:
-                    retry_after = e.response.json().get("retry_after", self.rate_limit_penalty)
-                    sleep_interval = retry_after + self.rate_limit_penalty
-                    logger.warning(f"[SAMP CHANNELS] Rate limit detectado. Aguardando {sleep_interval} segundos.")
-                else:
-                    logger.error(f"[SAMP CHANNELS] Erro inesperado da API do Discord: {e}")
-                    sleep_interval = self.update_interval
+                # As renomeações são agendadas e combinadas pelo renamer, então verificações
+                # frequentes não custam renomeações extras: o canal recebe só o nome mais recente
+                if channels_updated:
+                    logger.info("[SAMP CHANNELS] Renomeações agendadas.")
+                sleep_interval = self.quick_check_interval
             except Exception as e:
                 logger.error(f"[SAMP CHANNELS] Erro durante a gestão de atualizações: {e}")
                 sleep_interval = self.update_interval
@@ -75,92 +74,44 @@ class SampChannels(commands.Cog):
 
     async def update_channels(self, listener):
         """
-        Atualiza os canais de status e jogadores com base nas informações do servidor.
-        Retorna True se os canais foram atualizados, False caso contrário.
+        Agenda a atualização dos canais de status e jogadores de todos os servidores.
+        Retorna True se alguma renomeação foi agendada, False caso contrário.
         """
-        try:
-            server_info = listener.get_server_info()
-            player_info = listener.get_player_info()
+        servers = listener.get_servers()
+        primary = listener.get_server()
+        results = [self.update_server_channels(server, labeled=server is not primary) for server in servers]
+        return any(results)
 
-            if not server_info:
-                logger.warning("[SAMP CHANNELS] Nenhuma informação do servidor disponível. Definindo canais como offline.")
-                await self.set_channels_offline()
-                return True
-
-            # Buscar IDs dos canais no banco de dados
-            status_channel_id = fetchone("SELECT id FROM canais WHERE tipodecanal = ?", ("samp_status",))
-            players_channel_id = fetchone("SELECT id FROM canais WHERE tipodecanal = ?", ("samp_jogadores",))
-
-            if not (status_channel_id and players_channel_id):
-                logger.error("[SAMP CHANNELS] IDs dos canais necessários não encontrados no banco de dados.")
+    def update_server_channels(self, server, labeled=False):
+        """
+        Agenda a atualização dos canais de um servidor com base nas informações consultadas
+        (servidores offline aparecem como '🔴 Offline' e '0/0'). Mudanças de online/offline
+        têm prioridade sobre mudanças na contagem de jogadores.
+        Retorna True se alguma renomeação foi agendada, False caso contrário.
+        """
+        try:
+            if not (server.status_channel_id and server.players_channel_id):
+                logger.debug(f"[SAMP CHANNELS] Servidor {server.name} sem canais configurados.")
                 return False
 
             # Obter canais no Discord
-            status_channel = self.bot.get_channel(status_channel_id[0])
-            players_channel = self.bot.get_channel(players_channel_id[0])
+            status_channel = self.bot.get_channel(server.status_channel_id)
+            players_channel = self.bot.get_channel(server.players_channel_id)
 
             if not (status_channel and players_channel):
-                logger.error("[SAMP CHANNELS] Um ou mais canais não foram encontrados no servidor.")
+                logger.error(f"[SAMP CHANNELS] Canais do servidor {server.name} não foram encontrados.")
                 return False
 
-            # Atualizar canais apenas se necessário
-            updated = False
-            status_name = f"Status: {'🟢 Online' if server_info else '🔴 Offline'}"
-            players_name = f"Jogadores: {player_info.get('online', 0)}/{player_info.get('max', 0)}"
-
-            if status_channel.name != status_name:
-                await status_channel.edit(name=status_name)
-                logger.info(f"[SAMP CHANNELS] Canal de status atualizado para: {status_name}")
-                updated = True
-                await asyncio.sleep(5)
-
-            if players_channel.name != players_name:
-                await players_channel.edit(name=players_name)
-                logger.info(f"[SAMP CHANNELS] Canal de jogadores atualizado para: {players_name}")
-                updated = True
-                await asyncio.sleep(5)
-
-            return updated
-        except Exception as e:
-            logger.error(f"[SAMP CHANNELS] Erro ao atualizar canais: {e}")
-            return False
-
-    async def set_channels_offline(self):
-        """
-        Atualiza os canais para refletir o status offline.
-        """
-        try:
-            status_channel_id = fetchone("SELECT id FROM canais WHERE tipodecanal = ?", ("samp_status",))
-            players_channel_id = fetchone("SELECT id FROM canais WHERE tipodecanal = ?", ("samp_jogadores",))
-
-            if not (status_channel_id and players_channel_id):
-                logger.error("[SAMP CHANNELS] IDs dos canais necessários não encontrados no banco de dados.")
-                return
-
-            status_channel = self.bot.get_channel(status_channel_id[0])
-            players_channel = self.bot.get_channel(players_channel_id[0])
-
-            if not (status_channel and players_channel):
-                logger.error("[SAMP CHANNELS] Um ou mais canais não foram encontrados no servidor.")
-                return
-
-            # Atualizar canais para offline
-            updated = False
-            if status_channel.name != "Status: 🔴 Offline":
-                await status_channel.edit(name="Status: 🔴 Offline")
-                logger.info("[SAMP CHANNELS] Canal de status atualizado para: 🔴 Offline")
-                updated = True
-                await asyncio.sleep(5)
-
-            if players_channel.name != "Jogadores: 0/0":
-                await players_channel.edit(name="Jogadores: 0/0")
-                logger.info("[SAMP CHANNELS] Canal de jogadores atualizado para: 0/0")
-                updated = True
-                await asyncio.sleep(5)
+            # Compara com o nome que o canal terá após as renomeações já agendadas
+            status_name, players_name = server.channel_names(labeled)
+            expected_status = self.renamer.pending(status_channel.id) or status_channel.name
+            priority = PRIORITY_HIGH if expected_status != status_name else PRIORITY_NORMAL
 
+            updated = self.renamer.request(status_channel, status_name, priority)
+            updated = self.renamer.request(players_channel, players_name, priority) or updated
             return updated
         except Exception as e:
-            logger.error(f"[SAMP CHANNELS] Erro ao definir canais como offline: {e}")
+            logger.error(f"[SAMP CHANNELS] Erro ao atualizar canais do servidor {server.name}: {e}")
             return False
 
 
@@ -0,0 +1,120 @@
+import asyncio
+import functools
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
+
+from utils import database
+
+# Configuração de logs
+logger = logging.getLogger(__name__)
+
+
+class AsyncDatabase:
+    """
+    Camada assíncrona de acesso ao banco de dados.
+
+    Cada chamada é executada em um executor dedicado de threads, de forma que uma
+    leitura lenta no disco ou a espera por um lock nunca bloqueie o event loop do
+    bot. A quantidade de operações pendentes é limitada para evitar que uma rajada
+    de comandos acumule trabalho indefinidamente.
+    """
+
+    def __init__(self, workers: int = 4, max_pending: int = 256):
+        """
+        Inicializa a camada assíncrona.
+
+        :param workers: Número de threads dedicadas ao banco de dados.
+        :param max_pending: Máximo de operações aguardando execução ao mesmo tempo.
+        """
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="db")
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """
+        Retorna quantas operações estão na fila ou em execução.
+        """
+        return self._pending
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Executa qualquer função síncrona de banco de dados no executor dedicado.
+        Serve como caminho de migração para helpers que ainda não têm versão assíncrona.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_pending)
+
+        self._pending += 1
+        try:
+            async with self._semaphore:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+        finally:
+            self._pending -= 1
+
+    async def execute_query(self, query: str, params: Tuple = (), log: bool = True) -> Optional[int]:
+        """
+        Versão assíncrona de `utils.database.execute_query`.
+        """
+        return await self.run(database.execute_query, query, params, log)
+
+    async def execute_many(self, query: str, params_list: List[Tuple], log: bool = True) -> Optional[int]:
+        """
+        Versão assíncrona de `utils.database.execute_many`.
+        """
+        return await self.run(database.execute_many, query, params_list, log)
+
+    async def fetchone(self, query: str, params: Tuple = (), log: bool = True) -> Optional[Tuple]:
+        """
+        Versão assíncrona de `utils.database.fetchone`.
+        """
+        return await self.run(database.fetchone, query, params, log)
+
+    async def fetchall(self, query: str, params: Tuple = (), log: bool = True) -> List[Tuple]:
+        """
+        Versão assíncrona de `utils.database.fetchall`.
+        """
+        return await self.run(database.fetchall, query, params, log)
+
+    async def set_config(self, key: str, value: Optional[str]) -> bool:
+        """
+        Versão assíncrona de `utils.database.set_config` (grava no banco e no cache).
+        """
+        return await self.run(database.set_config, key, value)
+
+    async def get_status_by_id(self, status_id: int) -> Optional[Tuple]:
+        """
+        Versão assíncrona de `utils.database.get_status_by_id`.
+        """
+        return await self.run(database.get_status_by_id, status_id)
+
+    async def get_user_volume(self, user_id: int) -> float:
+        """
+        Versão assíncrona de `utils.database.get_user_volume`.
+        """
+        return await self.run(database.get_user_volume, user_id)
+
+    async def set_user_volume(self, user_id: int, volume: int) -> None:
+        """
+        Versão assíncrona de `utils.database.set_user_volume`.
+        """
+        return await self.run(database.set_user_volume, user_id, volume)
+
+    def close(self) -> None:
+        """
+        Aguarda as operações em andamento e encerra o executor.
+        """
+        self._executor.shutdown(wait=True)
+        logger.info("[ASYNC DB] Executor do banco de dados encerrado.")
+
+
+# Instância compartilhada por todos os cogs
+db = AsyncDatabase(
+    workers=int(os.getenv("DATABASE_WORKERS", "4")),
+    max_pending=int(os.getenv("DATABASE_MAX_PENDING", "256")),
+)
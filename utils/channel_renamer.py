@@ -0,0 +1,165 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+import discord
+
+# Configuração de logs
+logger = logging.getLogger(__name__)
+
+RENAME_LIMIT = 2  # Renomeações permitidas pelo Discord por canal...
+RENAME_WINDOW = 600  # ...a cada 10 minutos
+
+RENAME_TIMEOUT = 30  # Segundos aguardando uma renomeação antes de considerar a janela esgotada
+
+PRIORITY_NORMAL = 0  # Ex.: mudança na contagem de jogadores
+PRIORITY_HIGH = 1  # Ex.: servidor ficou online/offline
+
+
+class ChannelRenameScheduler:
+    """
+    Agenda renomeações de canais respeitando o limite do Discord por canal.
+
+    Cada canal tem no máximo um nome pendente: pedidos novos substituem o anterior
+    (só o nome mais recente importa). Renomeações de prioridade normal nunca gastam
+    a última renomeação disponível na janela, que fica reservada para mudanças de
+    prioridade alta; nenhuma renomeação é enviada sem orçamento disponível.
+
+    Cada renomeação roda em sua própria tarefa e tem tempo limite: se o Discord
+    segurar a requisição por rate limit (ex.: após uma renomeação manual), só aquele
+    canal espera, e a janela dele é considerada esgotada.
+    """
+
+    def __init__(self, bot, limit: int = RENAME_LIMIT, window: int = RENAME_WINDOW):
+        """
+        :param bot: Instância do bot (usada para localizar os canais).
+        :param limit: Renomeações permitidas por canal dentro da janela.
+        :param window: Duração da janela, em segundos.
+        """
+        self.bot = bot
+        self.limit = limit
+        self.window = window
+        self._history: Dict[int, Deque[float]] = {}  # Canal -> horários das últimas renomeações
+        self._pending: Dict[int, Tuple[str, int, float]] = {}  # Canal -> (nome, prioridade, pedido em)
+        self._renaming: Dict[int, asyncio.Task] = {}  # Canal -> renomeação em andamento
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+        for task in self._renaming.values():
+            task.cancel()
+
+    def request(self, channel: discord.abc.GuildChannel, name: str, priority: int = PRIORITY_NORMAL) -> bool:
+        """
+        Pede que um canal passe a ter o nome informado.
+
+        :return: True se uma renomeação ficou pendente.
+        """
+        pending = self._pending.get(channel.id)
+        if channel.name == name:
+            if pending is not None:
+                del self._pending[channel.id]  # O canal já tem o nome desejado
+            return False
+        if pending is not None:
+            if pending[0] == name:
+                return True
+            # Mantém a prioridade mais alta entre os pedidos combinados
+            priority = max(priority, pending[1])
+        self._pending[channel.id] = (name, priority, time.monotonic())
+        self._wakeup.set()
+        return True
+
+    def pending(self, channel_id: int) -> Optional[str]:
+        """
+        Nome aguardando para ser aplicado ao canal, se houver.
+        """
+        entry = self._pending.get(channel_id)
+        return entry[0] if entry else None
+
+    def _used(self, channel_id: int, now: float) -> Deque[float]:
+        history = self._history.setdefault(channel_id, deque())
+        while history and now - history[0] >= self.window:
+            history.popleft()
+        return history
+
+    def _ready_at(self, channel_id: int, priority: int, now: float) -> float:
+        """
+        Momento a partir do qual o canal pode ser renomeado com a prioridade informada.
+        """
+        history = self._used(channel_id, now)
+        allowed = self.limit if priority >= PRIORITY_HIGH else self.limit - 1
+        if len(history) < allowed:
+            return now
+        # Precisa esperar até que renomeações antigas saiam da janela
+        return history[len(history) - allowed] + self.window
+
+    async def _run(self) -> None:
+        while True:
+            now = time.monotonic()
+            ready = []
+            next_at = None
+            for channel_id, (name, priority, requested_at) in self._pending.items():
+                if channel_id in self._renaming:
+                    continue  # Reavaliado quando a renomeação atual terminar
+                at = self._ready_at(channel_id, priority, now)
+                if at <= now:
+                    ready.append((-priority, requested_at, channel_id))
+                elif next_at is None or at < next_at:
+                    next_at = at
+
+            for _, _, channel_id in sorted(ready):
+                entry = self._pending.pop(channel_id)
+                task = asyncio.create_task(self._rename(channel_id, entry))
+                self._renaming[channel_id] = task
+                task.add_done_callback(lambda _, channel_id=channel_id: self._finished(channel_id))
+
+            self._wakeup.clear()
+            try:
+                timeout = None if next_at is None else max(next_at - time.monotonic(), 0.1)
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def _finished(self, channel_id: int) -> None:
+        self._renaming.pop(channel_id, None)
+        if channel_id in self._pending:
+            self._wakeup.set()
+
+    def _exhaust(self, channel_id: int, entry: Tuple[str, int, float]) -> None:
+        """
+        Orçamento fora de sincronia (ex.: renomeação manual): considera a janela esgotada
+        e mantém o pedido para depois dela, se nenhum mais recente tiver chegado.
+        """
+        history = self._used(channel_id, time.monotonic())
+        history.extend([time.monotonic()] * (self.limit - len(history)))
+        self._pending.setdefault(channel_id, entry)
+
+    async def _rename(self, channel_id: int, entry: Tuple[str, int, float]) -> None:
+        name = entry[0]
+        channel = self.bot.get_channel(channel_id)
+        if channel is None or channel.name == name:
+            return
+        try:
+            # O discord.py aguarda o rate limit internamente; o tempo limite evita esperar a janela inteira
+            await asyncio.wait_for(channel.edit(name=name), RENAME_TIMEOUT)
+            self._used(channel_id, time.monotonic()).append(time.monotonic())
+            logger.info(f"[CHANNEL RENAMER] Canal {channel_id} renomeado para: {name}")
+        except (asyncio.TimeoutError, discord.RateLimited):
+            self._exhaust(channel_id, entry)
+            logger.warning(f"[CHANNEL RENAMER] Rate limit ao renomear o canal {channel_id}; nova tentativa após a janela.")
+        except discord.errors.HTTPException as e:
+            if e.status == 429:
+                self._exhaust(channel_id, entry)
+                logger.warning(f"[CHANNEL RENAMER] Rate limit ao renomear o canal {channel_id}; nova tentativa após a janela.")
+            else:
+                logger.error(f"[CHANNEL RENAMER] Erro ao renomear o canal {channel_id}: {e}")
+        except Exception as e:
+            logger.error(f"[CHANNEL RENAMER] Erro ao renomear o canal {channel_id}: {e}")
@@ -2,7 +2,7 @@ from utils.database import get_emoji_from_table, get_fun_emoji, get_music_emoji,
 import os
 import logging
 from colorama import Fore, Style
-from commands.music.musicsystem.music_system import MusicManager
+from commands.music.musicsystem.music_registry import MusicManagerRegistry
 
 # Configuração de logs
 logger = logging.getLogger(__name__)
@@ -11,8 +11,11 @@ async def load_commands(bot):
     """
     Carrega comandos do bot a partir das pastas 'commands', 'commands/music' e 'commands/samp'.
     """
-    # Inicializa o MusicManager
-    music_manager = MusicManager(bot)
+    # Inicializa o registro de players de música (um MusicManager por servidor)
+    music_managers = MusicManagerRegistry(bot)
+    await music_managers.load_snapshots()
+    music_managers.start()
+    bot.music_managers = music_managers  # Permite gravar o último snapshot das filas no desligamento
 
     base_path = "./commands"
     logger.info(f"{Fore.CYAN}🔍 Iniciando o carregamento dos comandos no caminho: {base_path}{Style.RESET_ALL}")
@@ -28,7 +31,7 @@ async def load_commands(bot):
     music_path = os.path.join(base_path, "music")
     if os.path.exists(music_path):
         logger.info(f"{Fore.YELLOW}🎵 Carregando comandos da subpasta 'music': {music_path}{Style.RESET_ALL}")
-        await _load_subfolder_commands(bot, music_path, "commands.music", music_manager=music_manager)
+        await _load_subfolder_commands(bot, music_path, "commands.music", music_managers=music_managers)
     else:
         logger.warning(f"{Fore.RED}⚠️ A subpasta 'music' não foi encontrada. Nenhum comando de música será carregado.{Style.RESET_ALL}")
 
@@ -43,14 +46,14 @@ async def load_commands(bot):
     logger.info(f"{Fore.CYAN}✅ Carregamento dos comandos concluído.{Style.RESET_ALL}")
 
 
-async def _load_subfolder_commands(bot, path, module_prefix, music_manager=None):
+async def _load_subfolder_commands(bot, path, module_prefix, music_managers=None):
     """
     Carrega comandos de uma subpasta específica.
 
     :param bot: Instância do bot.
     :param path: Caminho da subpasta a ser carregada.
     :param module_prefix: Prefixo do módulo para importação.
-    :param music_manager: Instância de MusicManager para passar aos módulos de música (opcional).
+    :param music_managers: Registro de MusicManager por servidor para passar aos módulos de música (opcional).
     """
     for filename in os.listdir(path):
         if filename.endswith(".py") and not filename.startswith("__"):
@@ -59,8 +62,8 @@ async def _load_subfolder_commands(bot, path, module_prefix, music_manager=None)
                 # Carregar módulo e chamar setup manualmente
                 module = __import__(f"{module_prefix}.{command_name}", fromlist=["setup"])
                 if hasattr(module, "setup") and callable(module.setup):
-                    if music_manager and "music" in module_prefix:
-                        await module.setup(bot, music_manager)
+                    if music_managers is not None and "music" in module_prefix:
+                        await module.setup(bot, music_managers)
                     else:
                         await module.setup(bot)
                     logger.info(f"{Fore.GREEN}✅ Comando '{module_prefix}.{command_name}' carregado com sucesso.{Style.RESET_ALL}")
@@ -4,6 +4,8 @@ import discord
 from dotenv import load_dotenv
 import os
 from colorama import Fore, Style
+from utils import database
+from utils.database import pool
 
 # Configuração de logs
 logger = logging.getLogger(__name__)
@@ -32,18 +34,16 @@ INTENTS = discord.Intents.default()
 INTENTS.message_content = True  # Ativar leitura de conteúdo de mensagens
 
 
-# Funções utilitárias para banco de dados
+# Funções utilitárias para banco de dados (usam o pool compartilhado de utils.database)
 def execute_query(query, params=()):
     """
-    Executa uma query no banco de dados e retorna o cursor.
+    Executa uma query de escrita no banco de dados e retorna o número de linhas afetadas.
     """
     try:
-        with sqlite3.connect(DATABASE_URL) as conn:
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            conn.commit()
+        with pool.writer() as conn:
+            cursor = conn.execute(query, params)
             logger.debug(f"Query executada com sucesso: {query} | Parâmetros: {params}")
-            return cursor
+            return cursor.rowcount
     except sqlite3.Error as e:
         logger.error(f"Erro ao executar a query '{query}' com parâmetros {params}: {e}")
         return None
@@ -53,31 +53,32 @@ def fetchone(query, params=()):
     """
     Executa uma query e retorna um único resultado.
     """
-    cursor = execute_query(query, params)
-    if cursor:
-        return cursor.fetchone()
-    return None
+    try:
+        with pool.reader() as conn:
+            return conn.execute(query, params).fetchone()
+    except sqlite3.Error as e:
+        logger.error(f"Erro ao executar a query '{query}' com parâmetros {params}: {e}")
+        return None
 
 
 def fetchall(query, params=()):
     """
     Executa uma query e retorna todos os resultados.
     """
-    cursor = execute_query(query, params)
-    if cursor:
-        return cursor.fetchall()
-    return []
+    try:
+        with pool.reader() as conn:
+            return conn.execute(query, params).fetchall()
+    except sqlite3.Error as e:
+        logger.error(f"Erro ao executar a query '{query}' com parâmetros {params}: {e}")
+        return []
 
 
 # Funções para configurações do bot
 def get_config(key):
     """
-    Obtém um valor da tabela 'configs' pelo seu key.
+    Obtém um valor da tabela 'configs' pelo seu key, a partir do cache em memória.
     """
-    result = fetchone('SELECT value FROM configs WHERE key = ?', (key,))
-    if not result:
-        logger.warning(f"Configuração não encontrada para a chave: {key}")
-    return result[0] if result else None
+    return database.get_config(key)
 
 
 def get_prefix():
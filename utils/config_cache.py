@@ -0,0 +1,113 @@
+import logging
+import threading
+from typing import Callable, Dict, Optional, Set
+
+# Configuração de logs
+logger = logging.getLogger(__name__)
+
+
+class ConfigCache:
+    """
+    Cache em memória da tabela 'configs', compartilhado por todo o processo.
+
+    A tabela inteira é carregada de uma vez na primeira leitura (ou explicitamente
+    via `load()`), e as alterações feitas pelo bot passam por `set()`, que grava no
+    banco e atualiza o cache ao mesmo tempo. Alterações feitas fora do bot podem ser
+    refletidas com `invalidate()`.
+    """
+
+    def __init__(self, loader: Callable, writer: Callable, single_loader: Callable):
+        """
+        Inicializa o cache.
+
+        :param loader: Função que retorna todas as linhas (key, value) da tabela.
+        :param writer: Função que grava um par (key, value) no banco de dados.
+        :param single_loader: Função que retorna a linha (value,) de uma única chave.
+        """
+        self._loader = loader
+        self._writer = writer
+        self._single_loader = single_loader
+        self._values: Dict[str, Optional[str]] = {}
+        self._stale: Set[str] = set()
+        self._loaded = False
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self) -> int:
+        """
+        (Re)carrega toda a tabela 'configs' para a memória.
+
+        :return: Quantidade de chaves carregadas.
+        """
+        rows = self._loader()
+        with self._lock:
+            self._values = {key: value for key, value in rows}
+            self._stale.clear()
+            self._loaded = True
+        logger.info(f"[CONFIG CACHE] {len(self._values)} configurações carregadas em memória.")
+        return len(self._values)
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        Obtém o valor de uma configuração, consultando o banco apenas em caso de miss.
+        """
+        if not self._loaded:
+            self.load()
+
+        with self._lock:
+            if key in self._values and key not in self._stale:
+                self.hits += 1
+                value = self._values[key]
+                return value if value is not None else default
+            self.misses += 1
+            needs_reload = key in self._stale
+
+        # Chaves ausentes após a carga completa não existem no banco: não há o que consultar.
+        if not needs_reload:
+            return default
+
+        result = self._single_loader(key)
+        with self._lock:
+            self._stale.discard(key)
+            if result:
+                self._values[key] = result[0]
+            else:
+                self._values.pop(key, None)
+        return result[0] if result and result[0] is not None else default
+
+    def set(self, key: str, value: Optional[str]) -> bool:
+        """
+        Grava uma configuração no banco (write-through) e atualiza o cache.
+
+        :return: True se a gravação no banco foi bem-sucedida.
+        """
+        if self._writer(key, value) is None:
+            logger.error(f"[CONFIG CACHE] Falha ao gravar a configuração '{key}'. Cache não alterado.")
+            return False
+        with self._lock:
+            self._values[key] = value
+            self._stale.discard(key)
+        logger.info(f"[CONFIG CACHE] Configuração '{key}' atualizada.")
+        return True
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Invalida uma chave específica ou o cache inteiro.
+        A próxima leitura correspondente volta a consultar o banco.
+        """
+        with self._lock:
+            if key is None:
+                self._values.clear()
+                self._stale.clear()
+                self._loaded = False
+            else:
+                self._stale.add(key)
+        logger.info(f"[CONFIG CACHE] Cache invalidado: {key or 'todas as chaves'}.")
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Retorna os contadores de acertos e falhas do cache.
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "keys": len(self._values)}
@@ -5,6 +5,9 @@ from dotenv import load_dotenv
 import os
 import random
 import discord
+from utils.db_pool import SQLitePool
+from utils.config_cache import ConfigCache
+from utils.emoji_registry import EmojiRegistry, FALLBACK_EMOJI
 
 # Configuração de logs
 logging.basicConfig(level=logging.INFO)
@@ -17,9 +20,13 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL não está definida. Verifique o arquivo .env ou as variáveis de ambiente.")
 
+# Pool de conexões persistentes compartilhado por todo o bot
+pool = SQLitePool(DATABASE_URL, readers=int(os.getenv("DATABASE_POOL_SIZE", "4")))
+
 def get_db_connection() -> sqlite3.Connection:
     """
-    Cria e retorna uma conexão com o banco de dados.
+    Cria e retorna uma conexão avulsa com o banco de dados.
+    Prefira `pool.reader()` e `pool.writer()`, que reutilizam conexões abertas.
     """
     try:
         conn = sqlite3.connect(DATABASE_URL)
@@ -33,7 +40,7 @@ def check_database():
     Verifica se as tabelas obrigatórias estão presentes no banco de dados.
     """
     required_tables = ["configs", "formularios", "volume"]
-    with get_db_connection() as conn:
+    with pool.reader() as conn:
         cursor = conn.cursor()
         for table in required_tables:
             cursor.execute(f"SELECT name FROM sqlite_master WHERE type='table' AND name='{table}'")
@@ -46,10 +53,9 @@ def execute_query(query: str, params: Tuple = (), log: bool = True) -> Optional[
     Executa uma query no banco de dados e retorna o número de linhas afetadas.
     """
     try:
-        with get_db_connection() as conn:
+        with pool.writer() as conn:
             cursor = conn.cursor()
             cursor.execute(query, params)
-            conn.commit()
             if log:
                 logger.debug(f"Query executada: {query} | Parâmetros: {params} | Linhas afetadas: {cursor.rowcount}")
             return cursor.rowcount
@@ -58,12 +64,28 @@ def execute_query(query: str, params: Tuple = (), log: bool = True) -> Optional[
             logger.error(f"Erro ao executar a query '{query}': {e}")
         return None
 
+def execute_many(query: str, params_list: List[Tuple], log: bool = True) -> Optional[int]:
+    """
+    Executa a mesma query para vários conjuntos de parâmetros em uma única transação.
+    """
+    try:
+        with pool.writer() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(query, params_list)
+            if log:
+                logger.debug(f"Query executada em lote: {query} | Registros: {len(params_list)} | Linhas afetadas: {cursor.rowcount}")
+            return cursor.rowcount
+    except sqlite3.Error as e:
+        if log:
+            logger.error(f"Erro ao executar a query em lote '{query}': {e}")
+        return None
+
 def fetchone(query: str, params: Tuple = (), log: bool = True) -> Optional[Tuple]:
     """
     Executa uma query e retorna um único resultado ou None.
     """
     try:
-        with get_db_connection() as conn:
+        with pool.reader() as conn:
             cursor = conn.cursor()
             cursor.execute(query, params)
             result = cursor.fetchone()
@@ -80,7 +102,7 @@ def fetchall(query: str, params: Tuple = (), log: bool = True) -> List[Tuple]:
     Executa uma query e retorna todos os resultados.
     """
     try:
-        with get_db_connection() as conn:
+        with pool.reader() as conn:
             cursor = conn.cursor()
             cursor.execute(query, params)
             results = cursor.fetchall()
@@ -92,17 +114,54 @@ def fetchall(query: str, params: Tuple = (), log: bool = True) -> List[Tuple]:
             logger.error(f"Erro ao executar a query '{query}': {e}")
         return []
 
+def _load_all_configs() -> List[Tuple]:
+    """
+    Lê a tabela 'configs' inteira. Erros são propagados para que o cache não
+    seja marcado como carregado com dados incompletos.
+    """
+    with pool.reader() as conn:
+        return conn.execute('SELECT key, value FROM configs').fetchall()
+
+def _load_single_config(key: str) -> Optional[Tuple]:
+    """
+    Lê uma única chave da tabela 'configs'.
+    """
+    return fetchone('SELECT value FROM configs WHERE key = ?', (key,))
+
+def _write_config(key: str, value: Optional[str]) -> Optional[int]:
+    """
+    Insere ou atualiza uma chave na tabela 'configs'.
+    """
+    query = """
+    INSERT INTO configs (key, value)
+    VALUES (?, ?)
+    ON CONFLICT(key) DO UPDATE SET value = excluded.value
+    """
+    return execute_query(query, (key, value))
+
+# Cache em memória da tabela 'configs'
+config_cache = ConfigCache(_load_all_configs, _write_config, _load_single_config)
+
 def get_config(key: str, default: Optional[str] = None) -> Optional[str]:
     """
-    Obtém um valor da tabela 'configs' pelo seu key.
+    Obtém um valor da tabela 'configs' pelo seu key, a partir do cache em memória.
     """
-    query = 'SELECT value FROM configs WHERE key = ?'
-    result = fetchone(query, (key,))
-    if result:
-        return result[0]
+    try:
+        value = config_cache.get(key)
+    except sqlite3.Error as e:
+        logger.error(f"Erro ao carregar as configurações do banco de dados: {e}")
+        value = None
+    if value is not None:
+        return value
     logger.warning(f"Configuração não encontrada para a chave: {key}")
     return default
 
+def set_config(key: str, value: Optional[str]) -> bool:
+    """
+    Grava um valor na tabela 'configs' e atualiza o cache em memória.
+    """
+    return config_cache.set(key, value)
+
 def get_prefix() -> str:
     """
     Obtém o prefixo do bot armazenado na tabela 'configs'.
@@ -158,11 +217,10 @@ def get_embed_color() -> discord.Colour:
     Obtém a cor da tabela 'configs' com a key 'EMBED_COLOR'.
     Se não houver valor válido, retorna uma cor aleatória como `discord.Colour`.
     """
-    query = "SELECT value FROM configs WHERE key = ?"
-    result = fetchone(query, ("EMBED_COLOR",))
+    value = get_config("EMBED_COLOR")
 
-    if result and result[0]:
-        color_value = result[0].strip()
+    if value:
+        color_value = value.strip().lstrip("#")
         if color_value.startswith("0x"):
             color_value = color_value[2:]
         try:
@@ -172,27 +230,32 @@ def get_embed_color() -> discord.Colour:
             pass
     return discord.Colour.random()
 
-def get_emoji_from_table(table_name: str, identifier: str) -> Optional[str]:
+def _load_emoji_table(table_name: str) -> List[Tuple]:
+    """
+    Lê todas as linhas (identifier, emoji_code) de uma tabela de emojis.
+    """
+    return fetchall(f"SELECT identifier, emoji_code FROM {table_name}")
+
+# Registro em memória de todas as tabelas de emojis
+emoji_registry = EmojiRegistry(_load_emoji_table)
+
+def get_emoji_from_table(table_name: str, identifier: str, fallback: Optional[str] = FALLBACK_EMOJI) -> Optional[str]:
     """
     Obtém o código do emoji de uma tabela específica baseado no identifier.
     
     :param table_name: Nome da tabela onde o emoji está armazenado.
     :param identifier: Identificador único do emoji.
-    :return: Código do emoji (<:name:id> ou <a:name:id>) ou None se não encontrado.
+    :param fallback: Valor retornado se o emoji não for encontrado.
+    :return: Código do emoji (<:name:id> ou <a:name:id>) ou `fallback` se não encontrado.
     """
-    query = f"SELECT emoji_code FROM {table_name} WHERE identifier = ?"
-    result = fetchone(query, (identifier,))
-    if result:
-        return result[0]
-    logger.warning(f"Emoji não encontrado na tabela '{table_name}' para o identificador '{identifier}'.")
-    return None
+    return emoji_registry.get(table_name, identifier, fallback)
 
 def get_music_emoji(identifier: str) -> Optional[str]:
     """
     Obtém um emoji da tabela 'emojis_music'.
     
     :param identifier: Identificador único do emoji.
-    :return: Código do emoji ou None se não encontrado.
+    :return: Código do emoji ou o emoji padrão se não encontrado.
     """
     return get_emoji_from_table("emojis_music", identifier)
 
@@ -201,7 +264,7 @@ def get_error_emoji(identifier: str) -> Optional[str]:
     Obtém um emoji da tabela 'emojis_errors'.
     
     :param identifier: Identificador único do emoji.
-    :return: Código do emoji ou None se não encontrado.
+    :return: Código do emoji ou o emoji padrão se não encontrado.
     """
     return get_emoji_from_table("emojis_errors", identifier)
 
@@ -210,7 +273,7 @@ def get_fun_emoji(identifier: str) -> Optional[str]:
     Obtém um emoji da tabela 'emojis_fun'.
     
     :param identifier: Identificador único do emoji.
-    :return: Código do emoji ou None se não encontrado.
+    :return: Código do emoji ou o emoji padrão se não encontrado.
     """
     return get_emoji_from_table("emojis_fun", identifier)
 
@@ -219,7 +282,7 @@ def get_number_emoji(identifier: str) -> Optional[str]:
     Obtém um emoji da tabela 'emojis_numbers'.
     
     :param identifier: Identificador único do emoji.
-    :return: Código do emoji ou None se não encontrado.
+    :return: Código do emoji ou o emoji padrão se não encontrado.
     """
     return get_emoji_from_table("emojis_numbers", identifier)
 
@@ -228,7 +291,7 @@ def get_clan_management_emoji(identifier: str) -> Optional[str]:
     Obtém um emoji da tabela 'emojis_clan_management'.
     
     :param identifier: Identificador único do emoji.
-    :return: Código do emoji ou None se não encontrado.
+    :return: Código do emoji ou o emoji padrão se não encontrado.
     """
     return get_emoji_from_table("emojis_clan_management", identifier)
 
@@ -237,7 +300,7 @@ def get_server_staff_emoji(identifier: str) -> Optional[str]:
     Obtém um emoji da tabela 'emojis_server_staff'.
     
     :param identifier: Identificador único do emoji.
-    :return: Código do emoji ou None se não encontrado.
+    :return: Código do emoji ou o emoji padrão se não encontrado.
     """
     return get_emoji_from_table("emojis_server_staff", identifier)
 
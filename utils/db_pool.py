@@ -0,0 +1,154 @@
+import sqlite3
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+# Configuração de logs
+logger = logging.getLogger(__name__)
+
+# PRAGMAs aplicados a todas as conexões do pool
+DEFAULT_PRAGMAS = {
+    "synchronous": "NORMAL",      # Seguro com WAL e bem mais rápido que FULL
+    "cache_size": -16000,         # ~16 MB de cache de páginas por conexão
+    "mmap_size": 134217728,       # 128 MB de leitura via memory-map
+    "temp_store": "MEMORY",       # Tabelas temporárias em memória
+    "busy_timeout": 5000,         # Aguarda até 5s por locks antes de falhar
+}
+
+
+class SQLitePool:
+    """
+    Pool de conexões SQLite persistentes com separação entre leitura e escrita.
+
+    O SQLite permite apenas um escritor por vez, então todas as escritas passam por
+    uma única conexão protegida por lock. As leituras usam um conjunto de conexões
+    próprias e, graças ao modo WAL, nunca ficam bloqueadas atrás de uma escrita.
+    """
+
+    def __init__(self, database: str, readers: int = 4, pragmas: Optional[dict] = None):
+        """
+        Inicializa o pool.
+
+        :param database: Caminho do arquivo do banco de dados.
+        :param readers: Quantidade de conexões dedicadas à leitura.
+        :param pragmas: PRAGMAs adicionais ou substitutos aos padrões.
+        """
+        self.database = database
+        self.readers = max(1, readers)
+        self.pragmas = {**DEFAULT_PRAGMAS, **(pragmas or {})}
+        self._writer: Optional[sqlite3.Connection] = None
+        self._writer_lock = threading.RLock()
+        self._readers: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=self.readers)
+        self._created_readers = 0
+        self._init_lock = threading.Lock()
+        self._closed = False
+
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """
+        Abre uma nova conexão já configurada com os PRAGMAs do pool.
+        """
+        conn = sqlite3.connect(self.database, check_same_thread=False, isolation_level=None if read_only else "")
+        for pragma, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {pragma} = {value}")
+        if read_only:
+            conn.execute("PRAGMA query_only = ON")
+        return conn
+
+    def _get_writer(self) -> sqlite3.Connection:
+        """
+        Retorna a conexão de escrita, criando-a e ativando o WAL na primeira chamada.
+        """
+        if self._writer is None:
+            with self._init_lock:
+                if self._writer is None:
+                    if self._closed:
+                        raise sqlite3.ProgrammingError("O pool de conexões já foi encerrado.")
+                    conn = self._connect()
+                    mode = conn.execute("PRAGMA journal_mode = WAL").fetchone()
+                    logger.info(f"[DB POOL] Conexão de escrita aberta (journal_mode={mode[0] if mode else '?'}).")
+                    self._writer = conn
+        return self._writer
+
+    def _acquire_reader(self) -> sqlite3.Connection:
+        """
+        Obtém uma conexão de leitura livre, criando novas até o limite do pool.
+        """
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._init_lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("O pool de conexões já foi encerrado.")
+            if self._created_readers < self.readers:
+                self._created_readers += 1
+                create = True
+            else:
+                create = False
+
+        if create:
+            try:
+                # Garante que o WAL já foi ativado antes da primeira leitura
+                self._get_writer()
+                return self._connect(read_only=True)
+            except Exception:
+                # Libera a vaga, senão as próximas leituras esperariam por uma conexão que nunca existirá
+                with self._init_lock:
+                    self._created_readers -= 1
+                raise
+        return self._readers.get()
+
+    def _release_reader(self, conn: sqlite3.Connection) -> None:
+        """
+        Devolve uma conexão de leitura ao pool.
+        """
+        if self._closed:
+            conn.close()
+            return
+        self._readers.put_nowait(conn)
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """
+        Context manager que empresta uma conexão somente leitura.
+        """
+        conn = self._acquire_reader()
+        try:
+            yield conn
+        finally:
+            self._release_reader(conn)
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """
+        Context manager que empresta a conexão de escrita com acesso exclusivo.
+        Faz commit ao final ou rollback em caso de erro.
+        """
+        with self._writer_lock:
+            conn = self._get_writer()
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    def close(self) -> None:
+        """
+        Fecha todas as conexões abertas pelo pool.
+        """
+        with self._init_lock:
+            self._closed = True
+        with self._writer_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+        logger.info("[DB POOL] Conexões encerradas.")
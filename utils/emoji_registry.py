@@ -0,0 +1,111 @@
+import logging
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+# Configuração de logs
+logger = logging.getLogger(__name__)
+
+# Servidor de onde os emojis personalizados do bot são sincronizados
+EMOJI_SERVER_ID = 1315754008136384572
+
+# Prefixo do nome do emoji -> tabela onde ele é armazenado
+EMOJI_CATEGORIES = {
+    "music_": "emojis_music",
+    "error_": "emojis_errors",
+    "fun_": "emojis_fun",
+    "number_": "emojis_numbers",
+    "clan_": "emojis_clan_management",
+    "staff_": "emojis_server_staff",
+}
+
+# Emoji exibido quando um identificador não existe no registro
+FALLBACK_EMOJI = "▫️"
+
+
+class EmojiRegistry:
+    """
+    Registro em memória de todos os emojis das tabelas 'emojis_*'.
+
+    Todas as tabelas são carregadas em um único dicionário na inicialização,
+    de forma que cada consulta é apenas um acesso O(1) em memória.
+    """
+
+    def __init__(self, loader: Callable[[str], List[Tuple]]):
+        """
+        Inicializa o registro.
+
+        :param loader: Função que recebe o nome de uma tabela e retorna suas linhas (identifier, emoji_code).
+        """
+        self._loader = loader
+        self._emojis: Dict[Tuple[str, str], str] = {}
+        self._missing: Set[Tuple[str, str]] = set()
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def load(self) -> int:
+        """
+        (Re)carrega todas as tabelas de emojis para a memória.
+
+        :return: Quantidade de emojis carregados.
+        """
+        emojis = {}
+        for table in EMOJI_CATEGORIES.values():
+            for identifier, emoji_code in self._loader(table):
+                if emoji_code:
+                    emojis[(table, identifier)] = emoji_code
+
+        with self._lock:
+            self._emojis = emojis
+            self._missing.clear()
+            self._loaded = True
+        logger.info(f"[EMOJIS] {len(emojis)} emojis carregados em memória.")
+        return len(emojis)
+
+    def get(self, table_name: str, identifier: str, fallback: Optional[str] = FALLBACK_EMOJI) -> Optional[str]:
+        """
+        Obtém o código de um emoji, retornando `fallback` se ele não existir.
+        """
+        if not self._loaded:
+            self.load()
+
+        key = (table_name, identifier)
+        emoji_code = self._emojis.get(key)
+        if emoji_code is None and key not in self._missing:
+            # Registra o aviso apenas uma vez por identificador
+            self._missing.add(key)
+            logger.warning(f"Emoji não encontrado na tabela '{table_name}' para o identificador '{identifier}'.")
+        return emoji_code if emoji_code is not None else fallback
+
+    def apply_guild_update(self, before: Iterable, after: Iterable) -> int:
+        """
+        Atualiza o registro a partir de uma alteração nos emojis do servidor,
+        sem precisar recarregar o banco de dados.
+
+        :param before: Emojis do servidor antes da alteração.
+        :param after: Emojis do servidor depois da alteração.
+        :return: Quantidade de entradas alteradas no registro.
+        """
+        changed = 0
+        after_names = {emoji.name for emoji in after}
+        with self._lock:
+            for emoji in before:
+                table = table_for_emoji(emoji.name)
+                if table and emoji.name not in after_names and self._emojis.pop((table, emoji.name), None):
+                    changed += 1
+            for emoji in after:
+                table = table_for_emoji(emoji.name)
+                if table and self._emojis.get((table, emoji.name)) != str(emoji):
+                    self._emojis[(table, emoji.name)] = str(emoji)
+                    self._missing.discard((table, emoji.name))
+                    changed += 1
+        return changed
+
+
+def table_for_emoji(name: str) -> Optional[str]:
+    """
+    Retorna a tabela correspondente ao prefixo do nome do emoji, se houver.
+    """
+    for prefix, table in EMOJI_CATEGORIES.items():
+        if name.startswith(prefix):
+            return table
+    return None
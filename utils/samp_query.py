@@ -0,0 +1,316 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+import struct
+from typing import Dict, List, Optional, Tuple
+
+# Configuração de logs
+logger = logging.getLogger(__name__)
+
+SAMP_QUERY_TIMEOUT = float(os.getenv("SAMP_QUERY_TIMEOUT", "0.8"))  # Segundos aguardando cada resposta
+SAMP_QUERY_RETRIES = int(os.getenv("SAMP_QUERY_RETRIES", "3"))  # Reenvios após a primeira tentativa
+SAMP_QUERY_BACKOFF = float(os.getenv("SAMP_QUERY_BACKOFF", "0.25"))  # Espera antes do primeiro reenvio (dobra a cada tentativa)
+
+HEADER_SIZE = 11  # "SAMP" + IP (4 bytes) + porta (2 bytes) + opcode (1 byte)
+
+PendingKey = Tuple[str, int, str]
+
+
+class SampQueryError(Exception):
+    """
+    Erro ao consultar um servidor SA-MP.
+    """
+
+
+class SampQueryTimeout(SampQueryError):
+    """
+    O servidor não respondeu dentro do tempo e das tentativas configuradas.
+    """
+
+
+class _SampQueryProtocol(asyncio.DatagramProtocol):
+    """
+    Protocolo do endpoint UDP compartilhado: apenas repassa os datagramas ao cliente.
+    """
+
+    def __init__(self, client: "SampQueryClient"):
+        self.client = client
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        self.client._on_datagram(data, addr)
+
+    def error_received(self, exc: Exception) -> None:
+        # Ex.: ICMP "port unreachable"; a requisição correspondente expira pelo timeout
+        logger.debug(f"[SAMP QUERY] Erro recebido no socket: {exc}")
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self.client._on_connection_lost(exc)
+
+
+class SampQueryClient:
+    """
+    Cliente assíncrono do protocolo de consulta do SA-MP.
+
+    Todas as consultas usam um único endpoint UDP do event loop. Cada requisição
+    registra um future identificado por (IP, porta, opcode) e o datagrama recebido
+    resolve o future correspondente, de forma que nenhuma chamada bloqueia o loop.
+    Sem resposta, o pacote é reenviado com espera exponencial entre as tentativas.
+    """
+
+    def __init__(self, timeout: float = SAMP_QUERY_TIMEOUT, retries: int = SAMP_QUERY_RETRIES, backoff: float = SAMP_QUERY_BACKOFF):
+        """
+        :param timeout: Tempo máximo, em segundos, aguardando cada resposta.
+        :param retries: Quantidade de reenvios quando o servidor não responde.
+        :param backoff: Espera antes do primeiro reenvio, em segundos (dobra a cada tentativa).
+        """
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self._transport: Optional[asyncio.DatagramTransport] = None
+        self._opening: Optional[asyncio.Future] = None
+        self._pending: Dict[PendingKey, List[asyncio.Future]] = {}
+
+    async def _get_transport(self) -> asyncio.DatagramTransport:
+        """
+        Abre o endpoint UDP compartilhado na primeira consulta.
+        """
+        if self._transport is not None and not self._transport.is_closing():
+            return self._transport
+        if self._opening is None:
+            loop = asyncio.get_running_loop()
+            self._opening = asyncio.ensure_future(
+                loop.create_datagram_endpoint(lambda: _SampQueryProtocol(self), local_addr=("0.0.0.0", 0))
+            )
+        try:
+            self._transport, _ = await asyncio.shield(self._opening)
+        finally:
+            self._opening = None
+        return self._transport
+
+    def _on_datagram(self, data: bytes, addr) -> None:
+        if len(data) < HEADER_SIZE or data[:4] != b"SAMP":
+            return
+        key = (addr[0], addr[1], chr(data[10]))
+        for future in self._pending.pop(key, ()):
+            if not future.done():
+                future.set_result(data)
+
+    def _on_connection_lost(self, exc: Optional[Exception]) -> None:
+        self._transport = None
+        error = SampQueryError(f"Socket de consulta fechado: {exc}")
+        for futures in self._pending.values():
+            for future in futures:
+                if not future.done():
+                    future.set_exception(error)
+        self._pending.clear()
+
+    @staticmethod
+    def build_packet(ip: str, port: int, opcode: str, payload: bytes = b"") -> bytes:
+        """
+        Constrói o pacote de consulta: "SAMP", IP e porta do servidor, opcode e dados extras.
+        """
+        return b"SAMP" + socket.inet_aton(ip) + struct.pack("<H", port) + opcode.encode() + payload
+
+    async def query(self, ip: str, port: int, opcode: str, payload: bytes = b"", *,
+                    timeout: Optional[float] = None, retries: Optional[int] = None) -> bytes:
+        """
+        Envia uma consulta e aguarda a resposta, reenviando o pacote quando necessário.
+
+        :param ip: IP do servidor (IPv4).
+        :param port: Porta do servidor.
+        :param opcode: Tipo de consulta ('i' informações, 'r' regras, 'c'/'d' jogadores, 'p' ping).
+        :param payload: Dados extras do pacote (ex.: os 4 bytes do ping).
+        :return: Datagrama de resposta completo, incluindo o cabeçalho.
+        :raises SampQueryTimeout: Se o servidor não responder após todas as tentativas.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        retries = self.retries if retries is None else retries
+        transport = await self._get_transport()
+
+        key = (ip, port, opcode)
+        future = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(key, []).append(future)
+        packet = self.build_packet(ip, port, opcode, payload)
+
+        try:
+            for attempt in range(retries + 1):
+                transport.sendto(packet, (ip, port))
+                try:
+                    # O mesmo future é mantido entre as tentativas: uma resposta atrasada também serve
+                    return await asyncio.wait_for(asyncio.shield(future), timeout)
+                except asyncio.TimeoutError:
+                    if attempt < retries:
+                        await asyncio.sleep(self.backoff * (2 ** attempt))
+            raise SampQueryTimeout(f"{ip}:{port} não respondeu à consulta '{opcode}' após {retries + 1} tentativa(s).")
+        finally:
+            waiters = self._pending.get(key)
+            if waiters is not None and future in waiters:
+                waiters.remove(future)
+                if not waiters:
+                    del self._pending[key]
+            if not future.done():
+                future.cancel()
+
+    async def get_info(self, ip: str, port: int, **kwargs) -> Dict:
+        """
+        Obtém as informações gerais do servidor (opcode 'i').
+
+        :return: Dicionário com hostname, gamemode, mapname, players, maxplayers e password.
+        :raises SampQueryError: Se o servidor não responder ou a resposta for inválida.
+        """
+        return self.parse_info(await self.query(ip, port, "i", **kwargs))
+
+    async def get_rules(self, ip: str, port: int, **kwargs) -> Dict[str, str]:
+        """
+        Obtém as regras do servidor (opcode 'r'), como versão, horário e clima.
+        """
+        return self.parse_rules(await self.query(ip, port, "r", **kwargs))
+
+    async def get_clients(self, ip: str, port: int, **kwargs) -> List[Dict]:
+        """
+        Obtém a lista de jogadores com pontuação (opcode 'c').
+        O servidor só responde com jogadores quando há menos de 100 online.
+        """
+        return self.parse_clients(await self.query(ip, port, "c", **kwargs))
+
+    async def get_players(self, ip: str, port: int, **kwargs) -> List[Dict]:
+        """
+        Obtém a lista detalhada de jogadores, com ID, pontuação e ping (opcode 'd').
+        O servidor só responde com jogadores quando há menos de 100 online.
+        """
+        return self.parse_players(await self.query(ip, port, "d", **kwargs))
+
+    async def ping(self, ip: str, port: int, **kwargs) -> float:
+        """
+        Mede a latência até o servidor (opcode 'p'), em milissegundos.
+        """
+        token = os.urandom(4)
+        started = time.perf_counter()
+        data = await self.query(ip, port, "p", token, **kwargs)
+        if data[HEADER_SIZE:HEADER_SIZE + 4] != token:
+            raise SampQueryError("Resposta de ping não corresponde ao pacote enviado.")
+        return (time.perf_counter() - started) * 1000
+
+    async def is_online(self, ip: str, port: int, **kwargs) -> bool:
+        """
+        Verifica se o servidor responde às consultas.
+        """
+        try:
+            await self.query(ip, port, "i", **kwargs)
+            return True
+        except SampQueryError:
+            return False
+
+    @staticmethod
+    def parse_info(data: bytes) -> Dict:
+        """
+        Analisa a resposta da consulta de informações.
+        """
+        view = memoryview(data)
+        try:
+            password, players, maxplayers = struct.unpack_from("<?HH", view, HEADER_SIZE)
+            offset = HEADER_SIZE + 5
+            fields = []
+            for _ in range(3):
+                (length,) = struct.unpack_from("<I", view, offset)
+                offset += 4
+                if offset + length > len(view):
+                    raise SampQueryError("Resposta de informações truncada.")
+                fields.append(bytes(view[offset:offset + length]).decode(errors="replace"))
+                offset += length
+        except struct.error as e:
+            raise SampQueryError(f"Resposta de informações inválida: {e}") from e
+
+        hostname, gamemode, mapname = fields
+        return {
+            "hostname": hostname,
+            "gamemode": gamemode,
+            "mapname": mapname,
+            "players": players,
+            "maxplayers": maxplayers,
+            "password": password,
+        }
+
+    @staticmethod
+    def _read_string(view: memoryview, offset: int) -> Tuple[str, int]:
+        """
+        Lê uma string prefixada por um byte de tamanho.
+
+        :return: Tupla (string, offset após a string).
+        """
+        length = view[offset]
+        offset += 1
+        if offset + length > len(view):
+            raise SampQueryError("Resposta truncada.")
+        return bytes(view[offset:offset + length]).decode(errors="replace"), offset + length
+
+    @classmethod
+    def parse_rules(cls, data: bytes) -> Dict[str, str]:
+        """
+        Analisa a resposta da consulta de regras.
+        """
+        view = memoryview(data)
+        try:
+            (count,) = struct.unpack_from("<H", view, HEADER_SIZE)
+            offset = HEADER_SIZE + 2
+            rules = {}
+            for _ in range(count):
+                name, offset = cls._read_string(view, offset)
+                value, offset = cls._read_string(view, offset)
+                rules[name] = value
+        except (struct.error, IndexError) as e:
+            raise SampQueryError(f"Resposta de regras inválida: {e}") from e
+        return rules
+
+    @classmethod
+    def parse_clients(cls, data: bytes) -> List[Dict]:
+        """
+        Analisa a resposta da lista de jogadores (nome e pontuação).
+        """
+        view = memoryview(data)
+        try:
+            (count,) = struct.unpack_from("<H", view, HEADER_SIZE)
+            offset = HEADER_SIZE + 2
+            clients = []
+            for _ in range(count):
+                name, offset = cls._read_string(view, offset)
+                (score,) = struct.unpack_from("<i", view, offset)
+                offset += 4
+                clients.append({"name": name, "score": score})
+        except (struct.error, IndexError) as e:
+            raise SampQueryError(f"Resposta de jogadores inválida: {e}") from e
+        return clients
+
+    @classmethod
+    def parse_players(cls, data: bytes) -> List[Dict]:
+        """
+        Analisa a resposta da lista detalhada de jogadores (ID, nome, pontuação e ping).
+        """
+        view = memoryview(data)
+        try:
+            (count,) = struct.unpack_from("<H", view, HEADER_SIZE)
+            offset = HEADER_SIZE + 2
+            players = []
+            for _ in range(count):
+                player_id = view[offset]
+                name, offset = cls._read_string(view, offset + 1)
+                score, ping = struct.unpack_from("<iI", view, offset)
+                offset += 8
+                players.append({"id": player_id, "name": name, "score": score, "ping": ping})
+        except (struct.error, IndexError) as e:
+            raise SampQueryError(f"Resposta de jogadores inválida: {e}") from e
+        return players
+
+    def close(self) -> None:
+        """
+        Fecha o endpoint UDP compartilhado.
+        """
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+
+# Instância compartilhada por todos os consumidores das consultas SA-MP
+samp_query = SampQueryClient()
@@ -0,0 +1,163 @@
+import logging
+import sqlite3
+from typing import List, Optional, Tuple
+
+from utils.database import pool
+
+# Configuração de logs
+logger = logging.getLogger(__name__)
+
+# Servidor monitorado antes da configuração em banco; usado para popular a tabela na primeira execução
+DEFAULT_SERVER = ("Brasil Cidade Vida Real", "15.235.123.105", 7777)
+
+
+class SampServer:
+    """
+    Servidor SA-MP monitorado: configuração (endereço e canais) e último estado consultado.
+    """
+
+    __slots__ = (
+        "id", "name", "ip", "port", "status_channel_id", "players_channel_id",
+        "status", "server_info", "players", "roster", "roster_updated_at", "checked_at",
+    )
+
+    def __init__(self, id: int, name: str, ip: str, port: int,
+                 status_channel_id: Optional[int] = None, players_channel_id: Optional[int] = None):
+        self.id = id
+        self.name = name
+        self.ip = ip
+        self.port = port
+        self.status_channel_id = status_channel_id
+        self.players_channel_id = players_channel_id
+        self.status = "off"
+        self.server_info = None  # Informações gerais (hostname, gamemode, mapname)
+        self.players = {"online": 0, "max": 0}
+        self.roster = []  # Jogadores online (nome, pontuação e, se disponível, ID e ping)
+        self.roster_updated_at = None
+        self.checked_at = None  # Momento (monotônico) da última consulta de informações concluída
+
+    @property
+    def key(self) -> str:
+        """
+        Identificador do servidor na série histórica de população.
+        """
+        return f"{self.ip}:{self.port}"
+
+    def channel_names(self, labeled: bool = False) -> Tuple[str, str]:
+        """
+        Nomes dos canais de status e de jogadores do servidor.
+        Os servidores adicionais levam o nome do servidor, para diferenciá-los do principal.
+        """
+        status = "🟢 Online" if self.server_info else "🔴 Offline"
+        players = f"{self.players.get('online', 0)}/{self.players.get('max', 0)}"
+        if labeled:
+            return f"{self.name}: {status}", f"{self.name}: {players} jogadores"
+        return f"Status: {status}", f"Jogadores: {players}"
+
+    def set_offline(self) -> None:
+        self.status = "off"
+        self.server_info = None
+        self.players = {"online": 0, "max": 0}
+        self.roster = []
+
+    def __repr__(self) -> str:
+        return f"<SampServer {self.id} {self.name} {self.key} {self.status}>"
+
+
+class SampServerStore:
+    """
+    Configuração dos servidores monitorados na tabela 'samp_servers'.
+    Todos os métodos são bloqueantes e devem ser chamados via `db.run`.
+    """
+
+    def __init__(self):
+        self._schema_ready = False
+
+    def _ensure_schema(self) -> None:
+        if self._schema_ready:
+            return
+        with pool.writer() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS samp_servers (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT NOT NULL,
+                    ip TEXT NOT NULL,
+                    port INTEGER NOT NULL,
+                    status_channel_id INTEGER,
+                    players_channel_id INTEGER,
+                    enabled INTEGER NOT NULL DEFAULT 1,
+                    UNIQUE (ip, port)
+                )
+            """)
+            if conn.execute("SELECT COUNT(*) FROM samp_servers").fetchone()[0] == 0:
+                self._bootstrap(conn)
+        self._schema_ready = True
+
+    @staticmethod
+    def _bootstrap(conn: sqlite3.Connection) -> None:
+        """
+        Cadastra o servidor original, reaproveitando os canais já registrados na tabela 'canais'.
+        """
+        channels = {}
+        try:
+            channels = dict(conn.execute(
+                "SELECT tipodecanal, id FROM canais WHERE tipodecanal IN ('samp_status', 'samp_jogadores')"
+            ).fetchall())
+        except sqlite3.Error:
+            pass  # Banco sem a tabela 'canais'
+        name, ip, port = DEFAULT_SERVER
+        conn.execute(
+            "INSERT INTO samp_servers (name, ip, port, status_channel_id, players_channel_id) VALUES (?, ?, ?, ?, ?)",
+            (name, ip, port, channels.get("samp_status"), channels.get("samp_jogadores")),
+        )
+        logger.info(f"[SAMP SERVERS] Servidor padrão {ip}:{port} cadastrado.")
+
+    def load(self) -> List[SampServer]:
+        """
+        Carrega os servidores habilitados, na ordem de cadastro.
+        """
+        self._ensure_schema()
+        with pool.reader() as conn:
+            rows = conn.execute(
+                "SELECT id, name, ip, port, status_channel_id, players_channel_id FROM samp_servers "
+                "WHERE enabled = 1 ORDER BY id"
+            ).fetchall()
+        return [SampServer(*row) for row in rows]
+
+    def add(self, name: str, ip: str, port: int) -> int:
+        """
+        Cadastra (ou reativa) um servidor.
+
+        :return: ID do servidor.
+        """
+        self._ensure_schema()
+        with pool.writer() as conn:
+            conn.execute(
+                "INSERT INTO samp_servers (name, ip, port) VALUES (?, ?, ?) "
+                "ON CONFLICT(ip, port) DO UPDATE SET name = excluded.name, enabled = 1",
+                (name, ip, port),
+            )
+            return conn.execute("SELECT id FROM samp_servers WHERE ip = ? AND port = ?", (ip, port)).fetchone()[0]
+
+    def remove(self, server_id: int) -> bool:
+        """
+        Remove um servidor do monitoramento.
+        """
+        self._ensure_schema()
+        with pool.writer() as conn:
+            return conn.execute("DELETE FROM samp_servers WHERE id = ?", (server_id,)).rowcount > 0
+
+    def set_channels(self, server_id: int, status_channel_id: Optional[int], players_channel_id: Optional[int]) -> None:
+        """
+        Associa (ou desassocia, com None) os canais de status e de jogadores de um servidor.
+        """
+        self._ensure_schema()
+        with pool.writer() as conn:
+            conn.execute(
+                "UPDATE samp_servers SET status_channel_id = ?, players_channel_id = ? WHERE id = ?",
+                (status_channel_id, players_channel_id, server_id),
+            )
+
+
+# Instância compartilhada pelo listener e pelos comandos do SA-MP
+samp_servers = SampServerStore()
@@ -0,0 +1,300 @@
+import asyncio
+import logging
+import os
+import time
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from colorama import Fore, Style
+
+from utils.async_database import db
+from utils.database import pool
+
+# Configuração de logs
+logger = logging.getLogger(__name__)
+
+SAMP_STATS_FLUSH_INTERVAL = int(os.getenv("SAMP_STATS_FLUSH_INTERVAL", "300"))  # Segundos entre gravações no banco
+SAMP_STATS_RING_SIZE = 1440  # Amostras recentes mantidas em memória por servidor (24 h a cada minuto)
+
+MINUTE, HOUR, DAY = 60, 3600, 86400
+
+# Resolução (segundos) -> retenção (segundos). Cada amostra é agregada diretamente nas três resoluções.
+RETENTION = {
+    MINUTE: 2 * DAY,
+    HOUR: 90 * DAY,
+    DAY: 730 * DAY,
+}
+PRUNE_INTERVAL = HOUR  # Intervalo mínimo entre as limpezas de dados expirados
+
+
+class PopulationRing:
+    """
+    Buffer circular de amostras (timestamp, jogadores) sobre arrays compactos.
+
+    Guarda as amostras mais recentes para consultas imediatas e marca quais ainda
+    não foram gravadas no banco.
+    """
+
+    def __init__(self, capacity: int = SAMP_STATS_RING_SIZE):
+        self.capacity = capacity
+        self._times = array("d", bytes(8 * capacity))
+        self._counts = array("H", bytes(2 * capacity))
+        self._next = 0  # Posição da próxima escrita
+        self._size = 0
+        self._unflushed = 0
+
+    def append(self, timestamp: float, players: int) -> None:
+        self._times[self._next] = timestamp
+        self._counts[self._next] = min(players, 0xFFFF)
+        self._next = (self._next + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+        if self._unflushed == self.capacity:
+            logger.warning("[SAMP STATS] Buffer cheio sem gravação; a amostra mais antiga foi descartada.")
+        self._unflushed = min(self._unflushed + 1, self.capacity)
+
+    def _last(self, count: int) -> List[Tuple[float, int]]:
+        start = (self._next - count) % self.capacity
+        return [(self._times[(start + i) % self.capacity], self._counts[(start + i) % self.capacity]) for i in range(count)]
+
+    def drain(self) -> List[Tuple[float, int]]:
+        """
+        Retorna as amostras ainda não gravadas e as marca como gravadas.
+        """
+        samples = self._last(self._unflushed)
+        self._unflushed = 0
+        return samples
+
+    def restore(self, count: int) -> None:
+        """
+        Marca novamente as últimas `count` amostras como pendentes (após falha na gravação).
+        """
+        self._unflushed = min(self._unflushed + count, self._size)
+
+    def since(self, timestamp: float) -> List[Tuple[float, int]]:
+        """
+        Amostras em memória a partir de um instante, em ordem cronológica.
+        """
+        return [sample for sample in self._last(self._size) if sample[0] >= timestamp]
+
+
+class SampStatsStore:
+    """
+    Série temporal da população dos servidores SA-MP.
+
+    Cada ciclo da consulta periódica vira uma amostra no buffer em memória; periodicamente
+    as amostras são agregadas (quantidade, soma, pico e mínimo) em baldes de 1 minuto,
+    1 hora e 1 dia na tabela 'samp_population', com retenção própria por resolução.
+    As consultas de período usam a menor resolução que cobre o intervalo.
+    """
+
+    def __init__(self, flush_interval: int = SAMP_STATS_FLUSH_INTERVAL):
+        """
+        :param flush_interval: Segundos entre as gravações no banco.
+        """
+        self.flush_interval = flush_interval
+        self._rings: Dict[str, PopulationRing] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._last_prune = 0.0
+        self._schema_ready = False
+
+    def _ensure_schema(self) -> None:
+        if self._schema_ready:
+            return
+        with pool.writer() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS samp_population (
+                    server TEXT NOT NULL,
+                    resolution INTEGER NOT NULL,
+                    bucket INTEGER NOT NULL,
+                    samples INTEGER NOT NULL,
+                    total INTEGER NOT NULL,
+                    peak INTEGER NOT NULL,
+                    low INTEGER NOT NULL,
+                    PRIMARY KEY (server, resolution, bucket)
+                ) WITHOUT ROWID
+            """)
+        self._schema_ready = True
+
+    def record(self, server: str, players: int, timestamp: Optional[float] = None) -> None:
+        """
+        Registra uma amostra da população (apenas em memória até a próxima gravação).
+
+        :param server: Identificador do servidor (ex.: "ip:porta").
+        :param players: Jogadores online no momento da consulta.
+        """
+        ring = self._rings.get(server)
+        if ring is None:
+            ring = self._rings[server] = PopulationRing()
+        ring.append(timestamp or time.time(), players)
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    def recent(self, server: str, seconds: int) -> List[Tuple[float, int]]:
+        """
+        Amostras em memória dos últimos `seconds` segundos, sem acessar o banco.
+        """
+        ring = self._rings.get(server)
+        return ring.since(time.time() - seconds) if ring else []
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def flush(self) -> int:
+        """
+        Agrega as amostras pendentes nas três resoluções e grava no banco.
+
+        :return: Quantidade de amostras gravadas.
+        """
+        batches = {server: ring.drain() for server, ring in self._rings.items()}
+        batches = {server: samples for server, samples in batches.items() if samples}
+        if not batches:
+            return 0
+        try:
+            await db.run(self._write, batches)
+        except Exception as e:
+            for server, samples in batches.items():
+                self._rings[server].restore(len(samples))
+            logger.error(f"{Fore.RED}[SAMP STATS]{Style.RESET_ALL} Erro ao gravar a população dos servidores: {e}")
+            return 0
+        return sum(len(samples) for samples in batches.values())
+
+    def _write(self, batches: Dict[str, List[Tuple[float, int]]]) -> None:
+        self._ensure_schema()
+        buckets: Dict[Tuple[str, int, int], List[int]] = {}
+        utc_offset = time.localtime().tm_gmtoff  # Baldes diários seguem a meia-noite local
+        for server, samples in batches.items():
+            for timestamp, players in samples:
+                for resolution in RETENTION:
+                    shift = utc_offset if resolution == DAY else 0
+                    key = (server, resolution, int((timestamp + shift) // resolution) * resolution - shift)
+                    bucket = buckets.get(key)
+                    if bucket is None:
+                        buckets[key] = [1, players, players, players]
+                    else:
+                        bucket[0] += 1
+                        bucket[1] += players
+                        bucket[2] = max(bucket[2], players)
+                        bucket[3] = min(bucket[3], players)
+
+        now = time.time()
+        with pool.writer() as conn:
+            conn.executemany("""
+                INSERT INTO samp_population (server, resolution, bucket, samples, total, peak, low)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(server, resolution, bucket) DO UPDATE SET
+                    samples = samples + excluded.samples,
+                    total = total + excluded.total,
+                    peak = MAX(peak, excluded.peak),
+                    low = MIN(low, excluded.low)
+            """, [key + tuple(values) for key, values in buckets.items()])
+
+            if now - self._last_prune >= PRUNE_INTERVAL:
+                conn.executemany(
+                    "DELETE FROM samp_population WHERE resolution = ? AND bucket < ?",
+                    [(resolution, now - retention) for resolution, retention in RETENTION.items()],
+                )
+                self._last_prune = now
+
+    # ----- Consultas -----
+
+    @staticmethod
+    def _resolution_for(seconds: int) -> int:
+        """
+        Menor resolução cuja retenção cobre o período pedido.
+        """
+        for resolution, retention in sorted(RETENTION.items()):
+            if seconds <= retention:
+                return resolution
+        return DAY
+
+    async def summary(self, server: str, seconds: int) -> Optional[Dict]:
+        """
+        Média, pico e mínimo de jogadores no período.
+
+        :return: Dicionário com 'average', 'peak', 'peak_at' e 'low', ou None sem dados.
+        """
+        await self.flush()
+        resolution = self._resolution_for(seconds)
+        since = time.time() - seconds
+
+        def query():
+            self._ensure_schema()
+            with pool.reader() as conn:
+                totals = conn.execute(
+                    "SELECT SUM(samples), SUM(total), MIN(low) FROM samp_population "
+                    "WHERE server = ? AND resolution = ? AND bucket >= ?",
+                    (server, resolution, since),
+                ).fetchone()
+                peak = conn.execute(
+                    "SELECT peak, bucket FROM samp_population WHERE server = ? AND resolution = ? AND bucket >= ? "
+                    "ORDER BY peak DESC, bucket DESC LIMIT 1",
+                    (server, resolution, since),
+                ).fetchone()
+            return totals, peak
+
+        totals, peak = await db.run(query)
+        if not totals or not totals[0]:
+            return None
+        return {
+            "average": totals[1] / totals[0],
+            "low": totals[2],
+            "peak": peak[0],
+            "peak_at": peak[1],
+        }
+
+    async def peak_hours(self, server: str, days: int = 7, limit: int = 3) -> List[Tuple[int, float, int]]:
+        """
+        Horários (hora local do dia) com maior média de jogadores nos últimos dias.
+
+        :return: Lista de tuplas (hora, média, pico).
+        """
+        await self.flush()
+        offset = time.localtime().tm_gmtoff
+        since = time.time() - days * DAY
+
+        def query():
+            self._ensure_schema()
+            with pool.reader() as conn:
+                return conn.execute(
+                    "SELECT ((bucket + ?) / 3600) % 24 AS hour, SUM(total) * 1.0 / SUM(samples) AS average, MAX(peak) "
+                    "FROM samp_population WHERE server = ? AND resolution = ? AND bucket >= ? "
+                    "GROUP BY hour ORDER BY average DESC LIMIT ?",
+                    (offset, server, HOUR, since, limit),
+                ).fetchall()
+
+        return await db.run(query)
+
+    async def daily(self, server: str, days: int = 7) -> List[Tuple[int, float, int]]:
+        """
+        Média e pico de jogadores por dia.
+
+        :return: Lista de tuplas (início do dia, média, pico), do mais antigo ao mais recente.
+        """
+        await self.flush()
+        since = time.time() - days * DAY
+
+        def query():
+            self._ensure_schema()
+            with pool.reader() as conn:
+                return conn.execute(
+                    "SELECT bucket, total * 1.0 / samples, peak FROM samp_population "
+                    "WHERE server = ? AND resolution = ? AND bucket >= ? ORDER BY bucket",
+                    (server, DAY, since),
+                ).fetchall()
+
+        return await db.run(query)
+
+    async def close(self) -> None:
+        """
+        Grava as amostras pendentes (usado no desligamento do bot).
+        """
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+        await self.flush()
+
+
+# Instância compartilhada pelo listener e pelos comandos do SA-MP
+samp_stats = SampStatsStore()